@@ -1,8 +1,10 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from src.models.db.account import Account
+from src.config.manager import settings
+from src.models.schemas.jwt import JWTPrincipal
 from src.repository.crud.account import AccountCRUDRepository
 from src.securities.authorizations.jwt import get_jwt_generator
+from src.utilities.caches.principal_cache import principal_cache
 from .repository import get_repository
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/signinswagger", auto_error=False)
@@ -11,7 +13,7 @@ jwt_generator = get_jwt_generator()
 async def get_current_user(
     token: str | None = Depends(oauth2_scheme),
     account_repo: AccountCRUDRepository = Depends(get_repository(AccountCRUDRepository))
-) -> Account | None:
+) -> JWTPrincipal | None:
     if not token:
         return None
         
@@ -23,8 +25,38 @@ async def get_current_user(
     except:
         return None
 
+    # Claim'li token'larda hesabı veritabanından okumadan token'ın kendisinden kur
+    if settings.IS_JWT_CLAIMS_PRINCIPAL and "account_id" in payload:
+        try:
+            principal = JWTPrincipal(**payload)
+        except:
+            return None
+
+        # Tokens issued before the account's last `token_version` bump are revoked
+        token_version = principal_cache.get_token_version(principal.account_id)
+        if token_version is None:
+            epoch = principal_cache.epoch
+            token_version = await account_repo.read_token_version(principal.account_id)
+            if token_version is None:
+                return None
+            principal_cache.set_token_version(principal.account_id, token_version, epoch=epoch)
+
+        return principal if principal.token_version == token_version else None
+
+    # Aynı token ile gelen tekrar isteklerde veritabanına gitme
+    cached_principal = principal_cache.get(token)
+    if cached_principal is not None:
+        return cached_principal
+
+    epoch = principal_cache.epoch
     try:
         user = await account_repo.read_account_by_email(user_email)
-        return user
     except:
-        return None
\ No newline at end of file
+        return None
+    if user is None:
+        return None
+
+    # Share a plain copy between requests, the row itself stays in this request's session
+    principal = JWTPrincipal.from_account(user)
+    principal_cache.set(token, principal, epoch=epoch)
+    return principal
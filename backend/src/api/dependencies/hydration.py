@@ -0,0 +1,11 @@
+import fastapi
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+from src.api.dependencies.session import get_async_session
+from src.utilities.services.post_hydration_service import PostHydrationService
+
+
+def get_post_hydration_service(
+    async_session: SQLAlchemyAsyncSession = fastapi.Depends(get_async_session),
+) -> PostHydrationService:
+    return PostHydrationService(async_session=async_session)
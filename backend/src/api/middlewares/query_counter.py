@@ -0,0 +1,41 @@
+import typing
+
+import fastapi
+import loguru
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+
+from src.repository.query_counter import count_queries
+
+
+class QueryCounterMiddleware(BaseHTTPMiddleware):
+    """
+    Counts the SQL statements and DB time of every request, exposes them as `X-DB-Queries` and
+    `X-DB-Time` (milliseconds) and warns about statements repeated more than `repeat_threshold` times,
+    which is almost always an N+1 loop.
+    """
+
+    def __init__(self, app: typing.Any, repeat_threshold: int):
+        super().__init__(app)
+        self.repeat_threshold = repeat_threshold
+
+    async def dispatch(self, request: fastapi.Request, call_next: RequestResponseEndpoint) -> fastapi.Response:
+        with count_queries() as query_stats:
+            response = await call_next(request)
+
+        db_time_ms = round(query_stats.duration * 1000, 2)
+        response.headers["X-DB-Queries"] = str(query_stats.count)
+        response.headers["X-DB-Time"] = str(db_time_ms)
+
+        logger = loguru.logger.bind(
+            method=request.method,
+            path=request.url.path,
+            status_code=response.status_code,
+            db_queries=query_stats.count,
+            db_time_ms=db_time_ms,
+        )
+        logger.info(f"{request.method} {request.url.path} --- {query_stats.count} queries in {db_time_ms} ms")
+
+        for statement, count in query_stats.repeated_statements(threshold=self.repeat_threshold).items():
+            logger.warning(f"Possible N+1 --- statement ran {count} times in one request: {statement}")
+
+        return response
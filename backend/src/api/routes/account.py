@@ -3,38 +3,29 @@ import pydantic
 
 from src.api.dependencies.repository import get_repository
 from src.api.dependencies.auth import get_current_user
-from src.models.schemas.account import AccountDetailBase, AccountInResponse, AccountInUpdate, AccountWithToken
+from src.api.dependencies.hydration import get_post_hydration_service
+from src.models.schemas.account import AccountDetailBase, AccountInList, AccountInResponse, AccountInUpdate, AccountWithToken
 from src.repository.crud.account import AccountCRUDRepository
-from src.models.db.account import Account
-from src.models.schemas.post import AnswerInResponsePost, PollInResponsePost, PostInResponse, PostStatsBase
-from src.repository.crud.bookmark import BookmarkCRUDRepository
-from src.repository.crud.like import LikeCRUDRepository
-from src.repository.crud.poll_vote import PollVoteCRUDRepository
+from src.models.schemas.jwt import JWTPrincipal
+from src.models.schemas.post import PostInResponse
 from src.repository.crud.post import PostCRUDRepository
-from src.models.schemas.tag import TagCreate
+from src.utilities.services.post_hydration_service import PostHydrationService
 from fastapi import Depends, Query
 
 from src.securities.authorizations.jwt import jwt_generator
+from src.utilities.formatters.cursor_formatter import format_cursor_into_keyset, format_keyset_into_cursor
 from src.utilities.exceptions.database import EntityDoesNotExist
+from src.utilities.exceptions.http.exc_400 import http_400_exc_bad_cursor_request
 from src.utilities.exceptions.http.exc_404 import (
     http_404_exc_email_not_found_request,
     http_404_exc_id_not_found_request,
     http_404_exc_username_not_found_request,
 )
+from src.utilities.exceptions.http.exc_503 import http_503_exc_hashing_pool_saturated_request
+from src.utilities.exceptions.password import HashingPoolSaturated
 
 router = fastapi.APIRouter(prefix="/accounts", tags=["accounts"])
 
-async def enrich_post_with_interactions(
-    post: PostInResponse,
-    current_user: Account | None,
-    like_repo: LikeCRUDRepository,
-    bookmark_repo: BookmarkCRUDRepository
-) -> PostInResponse:
-    if current_user:
-        post.is_liked = await like_repo.is_post_liked(current_user.id, post.id)
-        post.is_bookmarked = await bookmark_repo.is_post_bookmarked(current_user.id, post.id)
-    return post
-
 
 @router.get(
     path="/getIdByUsername",
@@ -63,113 +54,62 @@ async def get_user_id_by_username(
     status_code=fastapi.status.HTTP_200_OK,
 )
 async def read_posts(
+    response: fastapi.Response,
     skip: int = Query(default=0, ge=0, description="Number of posts to skip"),
     limit: int = Query(default=10, ge=1, le=50, description="Number of posts to return"),
     target_user_id: int = Query(default=None, description="User to retrieve"),
+    cursor: str | None = Query(default=None, description="Opaque cursor returned in `X-Next-Cursor`; overrides `skip`"),
     post_repo: PostCRUDRepository = fastapi.Depends(get_repository(PostCRUDRepository)),
-    like_repo: LikeCRUDRepository = fastapi.Depends(get_repository(LikeCRUDRepository)),
-    bookmark_repo: BookmarkCRUDRepository = fastapi.Depends(get_repository(BookmarkCRUDRepository)),
-    poll_vote_repo: PollVoteCRUDRepository = fastapi.Depends(get_repository(PollVoteCRUDRepository)),
-    current_user: Account | None = Depends(get_current_user),
+    hydration_service: PostHydrationService = fastapi.Depends(get_post_hydration_service),
+    current_user: JWTPrincipal | None = Depends(get_current_user),
 ):
     if not target_user_id:
         target_user_id = current_user.id
 
-    db_posts = await post_repo.read_own_posts(target_user_id, skip=skip, limit=limit)
-    
-    async def process_post(post, current_user, like_repo, bookmark_repo, poll_vote_repo):
-        poll_response = None
-        if post.poll:
-            if current_user:
-                user_vote = await poll_vote_repo.get_user_vote(post.poll.id, current_user.id)
-            else:
-                user_vote = None
-
-            #poll_votes = await poll_vote_repo.get_poll_votes_detail(post.poll.id)
-
-            answers_response = []
-            for answer in post.poll.answers:
-                answer_count = await poll_vote_repo.get_poll_vote_count(post.poll.id, answer.answer_index)
-
-                is_selected = False
-                if user_vote:
-                    is_selected = (answer.answer_index == user_vote.answer_index)
-                print(answer.answer_index)
-                answers_response.append(AnswerInResponsePost(
-                    id=answer.id,
-                    answerIndex=answer.answer_index,
-                    text=answer.text,
-                    answerCount=answer_count,
-                    isSelected=is_selected
-                ))
-
-            poll_response = PollInResponsePost(
-                id=post.poll.id,
-                postId=post.poll.post_id,
-                accountId=post.poll.account_id,
-                answers=answers_response,
-                expirationDate=post.poll.expiration_date,
-            )
-
-        return await enrich_post_with_interactions(
-            PostInResponse(
-                id=post.id,
-                content=post.content,
-                account=AccountDetailBase(
-                    avatar=post.account.avatar,
-                    username=post.account.username,
-                    fullName=post.account.username
-                ),
-                stats=PostStatsBase(
-                    comments=post.stats.comments,
-                    likes=post.stats.likes,
-                    bookmarks=post.stats.bookmarks
-                ),
-                photos=[photo.url for photo in post.photos],
-                tags=[TagCreate(name=tag.name) for tag in post.tags],
-                poll=poll_response,
-                createdAt=post.created_at
-            ),
-            current_user, like_repo, bookmark_repo
-        )
-    
-    post_responses = []
-    for post in db_posts:
-        processed_post = await process_post(post, current_user, like_repo, bookmark_repo, poll_vote_repo)
-        post_responses.append(processed_post)
+    try:
+        keyset = format_cursor_into_keyset(cursor) if cursor else None
+    except ValueError:
+        raise await http_400_exc_bad_cursor_request(cursor=cursor)
+
+    db_posts = await post_repo.read_own_posts(target_user_id, skip=skip, limit=limit, cursor=keyset)
 
-    return post_responses
+    if len(db_posts) == limit:
+        response.headers["X-Next-Cursor"] = format_keyset_into_cursor(db_posts[-1].created_at, db_posts[-1].id)
+
+    return await hydration_service.hydrate_posts(db_posts, current_user)
 
 @router.get(
     path="",
     name="accountss:read-accounts",
-    response_model=list[AccountInResponse],
+    response_model=list[AccountInList],
     status_code=fastapi.status.HTTP_200_OK,
 )
 async def get_accounts(
+    response: fastapi.Response,
+    limit: int = Query(default=20, ge=1, le=100, description="Number of accounts to return"),
+    cursor: str | None = Query(default=None, description="Opaque cursor returned in `X-Next-Cursor`"),
     account_repo: AccountCRUDRepository = fastapi.Depends(get_repository(repo_type=AccountCRUDRepository)),
-) -> list[AccountInResponse]:
-    db_accounts = await account_repo.read_accounts()
-    db_account_list: list = list()
+) -> list[AccountInList]:
+    try:
+        keyset = format_cursor_into_keyset(cursor, is_timezone_aware=True) if cursor else None
+    except ValueError:
+        raise await http_400_exc_bad_cursor_request(cursor=cursor)
 
-    for db_account in db_accounts:
-        access_token = jwt_generator.generate_access_token(account=db_account)
-        account = AccountInResponse(
+    db_accounts = await account_repo.read_accounts(limit=limit, cursor=keyset)
+
+    if len(db_accounts) == limit:
+        response.headers["X-Next-Cursor"] = format_keyset_into_cursor(db_accounts[-1].created_at, db_accounts[-1].id)
+
+    return [
+        AccountInList(
             id=db_account.id,
-            authorizedAccount=AccountWithToken(
-                token=access_token,
-                username=db_account.username,
-                email=db_account.email,  # type: ignore
-                isVerified=db_account.is_verified,
-                isActive=db_account.is_active,
-                isLoggedIn=db_account.is_logged_in,
-                createdAt=db_account.created_at,
-                updatedAt=db_account.updated_at,
-            ),
+            username=db_account.username,
+            avatar=db_account.avatar,
+            isVerified=db_account.is_verified,
+            createdAt=db_account.created_at,
         )
-        db_account_list.append(account)
-
-    return db_account_list
+        for db_account in db_accounts
+    ]
 
 
 @router.get(
@@ -225,6 +165,9 @@ async def update_account(
     except EntityDoesNotExist:
         raise await http_404_exc_id_not_found_request(id=query_id)
 
+    except HashingPoolSaturated:
+        raise await http_503_exc_hashing_pool_saturated_request()
+
     access_token = jwt_generator.generate_access_token(account=updated_db_account)
 
     return AccountInResponse(
@@ -12,6 +12,8 @@ from src.utilities.exceptions.http.exc_400 import (
     http_exc_400_credentials_bad_signup_request,
 )
 from src.utilities.exceptions.http.exc_404 import http_404_exc_id_not_found_request
+from src.utilities.exceptions.http.exc_503 import http_503_exc_hashing_pool_saturated_request
+from src.utilities.exceptions.password import HashingPoolSaturated
 
 router = fastapi.APIRouter(prefix="/auth", tags=["authentication"])
 
@@ -35,6 +37,9 @@ async def signup(
     except EntityAlreadyExists:
         raise await http_exc_400_credentials_bad_signup_request()
 
+    except HashingPoolSaturated:
+        raise await http_503_exc_hashing_pool_saturated_request()
+
     
     return AccountInResponse(
         id=new_account.id,
@@ -124,6 +129,9 @@ async def signin(
     try:
         db_account = await account_repo.read_user_by_password_authentication(account_login=account_login)
 
+    except HashingPoolSaturated:
+        raise await http_503_exc_hashing_pool_saturated_request()
+
     except Exception:
         raise await http_exc_400_credentials_bad_signin_request()
 
@@ -163,6 +171,9 @@ async def signin(
         )
         db_account = await account_repo.read_user_by_password_authentication_swagger(account_login=account_login)
 
+    except HashingPoolSaturated:
+        raise await http_503_exc_hashing_pool_saturated_request()
+
     except Exception:
         raise await http_exc_400_credentials_bad_signin_request()
 
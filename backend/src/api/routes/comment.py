@@ -4,10 +4,13 @@ from typing import List
 
 from src.api.dependencies.repository import get_repository
 from src.api.dependencies.auth import get_current_user
-from src.models.schemas.comment import CommentCreate, CommentResponse
+from src.models.schemas.comment import CommentCreate, CommentInThread, CommentResponse
 from src.repository.crud.comment import CommentCRUDRepository
-from src.models.db.account import Account
+from src.models.schemas.jwt import JWTPrincipal
 from src.utilities.exceptions.database import EntityDoesNotExist
+from src.utilities.exceptions.http.exc_400 import http_400_exc_bad_cursor_request
+from src.utilities.exceptions.http.exc_404 import http_404_exc_comment_id_not_found_request
+from src.utilities.formatters.cursor_formatter import format_cursor_into_keyset, format_keyset_into_cursor
 
 router = fastapi.APIRouter(prefix="/comments", tags=["comments"])
 
@@ -19,7 +22,7 @@ router = fastapi.APIRouter(prefix="/comments", tags=["comments"])
 )
 async def create_comment(
     comment: CommentCreate,
-    current_user: Account = Depends(get_current_user),
+    current_user: JWTPrincipal | None = Depends(get_current_user),
     comment_repo: CommentCRUDRepository = Depends(get_repository(CommentCRUDRepository))
 ):
     db_comment = await comment_repo.create_comment(comment, current_user.id)
@@ -32,17 +35,30 @@ async def create_comment(
         updated_at=db_comment.updated_at,
         content=db_comment.content,
         author_username=current_user.username,
-        author_avatar=current_user.avatar
+        author_avatar=current_user.avatar,
+        replies_count=0,
     )
 
 @router.get("/post/{post_id}", response_model=List[CommentResponse])
 async def get_post_comments(
     post_id: int,
+    response: fastapi.Response,
     skip: int = Query(default=0, ge=0, description="Number of comments to skip"),
     limit: int = Query(default=10, ge=1, le=50, description="Number of comments to return"),
+    cursor: str | None = Query(default=None, description="Opaque cursor returned in `X-Next-Cursor`; overrides `skip`"),
     comment_repo: CommentCRUDRepository = Depends(get_repository(CommentCRUDRepository))
 ):
-    comments_data = await comment_repo.get_post_comments(post_id, skip, limit)
+    try:
+        keyset = format_cursor_into_keyset(cursor, is_timezone_aware=True) if cursor else None
+    except ValueError:
+        raise await http_400_exc_bad_cursor_request(cursor=cursor)
+
+    comments_data = await comment_repo.get_post_comments(post_id, skip, limit, cursor=keyset)
+
+    if len(comments_data) == limit:
+        last_comment = comments_data[-1][0]
+        response.headers["X-Next-Cursor"] = format_keyset_into_cursor(last_comment.created_at, last_comment.id)
+
     return [
         CommentResponse(
             id=comment.id,
@@ -53,11 +69,60 @@ async def get_post_comments(
             updated_at=comment.updated_at,
             content=comment.content,
             author_username=username,
-            author_avatar=avatar
+            author_avatar=avatar,
+            replies_count=replies_count
         )
-        for comment, username, avatar in comments_data
+        for comment, username, avatar, replies_count in comments_data
     ]
 
+@router.get("/post/{post_id}/thread", response_model=List[CommentInThread])
+async def get_post_comment_thread(
+    post_id: int,
+    response: fastapi.Response,
+    parent_id: int | None = Query(default=None, description="Load the replies of this comment instead of the top-level comments"),
+    limit: int = Query(default=10, ge=1, le=50, description="Number of root comments to return"),
+    replies_limit: int = Query(default=3, ge=0, le=20, description="Number of replies to return under each comment"),
+    depth: int = Query(default=2, ge=0, le=10, description="Number of reply levels to return below the roots"),
+    cursor: str | None = Query(default=None, description="Opaque cursor returned in `X-Next-Cursor`"),
+    comment_repo: CommentCRUDRepository = Depends(get_repository(CommentCRUDRepository))
+):
+    try:
+        keyset = format_cursor_into_keyset(cursor, is_timezone_aware=True) if cursor else None
+    except ValueError:
+        raise await http_400_exc_bad_cursor_request(cursor=cursor)
+
+    thread_data = await comment_repo.get_comment_thread(
+        post_id, parent_id=parent_id, limit=limit, replies_limit=replies_limit, max_depth=depth, cursor=keyset
+    )
+
+    # Rows arrive parent first, so every reply can be attached to a node that already exists
+    roots: list[CommentInThread] = []
+    nodes: dict[int, CommentInThread] = {}
+    for comment, username, avatar, comment_depth, replies_count in thread_data:
+        node = CommentInThread(
+            id=comment.id,
+            post_id=comment.post_id,
+            author_id=comment.author_id,
+            parent_id=comment.parent_id,
+            created_at=comment.created_at,
+            updated_at=comment.updated_at,
+            content=comment.content,
+            author_username=username,
+            author_avatar=avatar,
+            replies_count=replies_count,
+            depth=comment_depth,
+        )
+        nodes[comment.id] = node
+        if comment_depth == 0:
+            roots.append(node)
+        else:
+            nodes[comment.parent_id].replies.append(node)
+
+    if len(roots) == limit:
+        response.headers["X-Next-Cursor"] = format_keyset_into_cursor(roots[-1].created_at, roots[-1].id)
+
+    return roots
+
 """ @router.get("/{comment_id}/replies", response_model=List[CommentResponse])
 async def get_comment_replies(
     comment_id: int,
@@ -82,10 +147,12 @@ async def get_comment(
     comment_id: int,
     comment_repo: CommentCRUDRepository = Depends(get_repository(CommentCRUDRepository))
 ):
-    comment_data = await comment_repo.get_comment(comment_id)
-    if not comment_data:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Comment with id {comment_id} not found")
-    comment, username, avatar = comment_data
+    try:
+        comment, username, avatar = await comment_repo.get_comment(comment_id)
+    except EntityDoesNotExist:
+        raise await http_404_exc_comment_id_not_found_request(comment_id=comment_id)
+
+    replies_counts = await comment_repo.count_replies(comment.post_id, [comment.id])
     return CommentResponse(
         id=comment.id,
         post_id=comment.post_id,
@@ -95,13 +162,14 @@ async def get_comment(
         updated_at=comment.updated_at,
         content=comment.content,
         author_username=username,
-        author_avatar=avatar
+        author_avatar=avatar,
+        replies_count=replies_counts.get(comment.id, 0),
     )
 
 @router.delete("/{comment_id}")
 async def delete_comment(
     comment_id: int,
-    current_user: Account = Depends(get_current_user),
+    current_user: JWTPrincipal | None = Depends(get_current_user),
     comment_repo: CommentCRUDRepository = Depends(get_repository(CommentCRUDRepository))
 ):
     try:
@@ -114,11 +182,12 @@ async def delete_comment(
 async def update_comment(
     comment_id: int,
     content: str,
-    current_user: Account = Depends(get_current_user),
+    current_user: JWTPrincipal | None = Depends(get_current_user),
     comment_repo: CommentCRUDRepository = Depends(get_repository(CommentCRUDRepository))
 ):
     try:
         updated_comment = await comment_repo.update_comment(comment_id, content)
+        replies_counts = await comment_repo.count_replies(updated_comment.post_id, [updated_comment.id])
         return CommentResponse(
             id=updated_comment.id,
             post_id=updated_comment.post_id,
@@ -128,7 +197,8 @@ async def update_comment(
             updated_at=updated_comment.updated_at,
             content=updated_comment.content,
             author_username=current_user.username,
-            author_avatar=current_user.avatar
+            author_avatar=current_user.avatar,
+            replies_count=replies_counts.get(updated_comment.id, 0),
         )
     except EntityDoesNotExist as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
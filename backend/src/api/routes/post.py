@@ -4,42 +4,39 @@ import sqlalchemy
 
 from src.api.dependencies.repository import get_repository
 from src.api.dependencies.auth import get_current_user
+from src.api.dependencies.hydration import get_post_hydration_service
 from src.models.schemas.post import PostInCreate, PostInResponse, PostStatsBase
-from src.models.db.poll_vote import PollVote
 from src.models.schemas.tag import TagCreate
-from src.models.schemas.poll import PollInResponse, AnswerInResponse
-from src.models.schemas.post import PollInResponsePost, AnswerInResponsePost
-from src.models.db.account import Account
+from src.models.schemas.jwt import JWTPrincipal
 from src.models.schemas.account import AccountDetailBase
+from src.config.manager import settings
 from src.repository.crud.post import PostCRUDRepository
-from src.repository.crud.poll_vote import PollVoteCRUDRepository
-from src.repository.crud.like import LikeCRUDRepository
-from src.repository.crud.bookmark import BookmarkCRUDRepository
-from src.utilities.exceptions.http.exc_404 import http_404_exc_post_id_not_found_request
-from src.utilities.exceptions.database import EntityDoesNotExist
+from src.utilities.caches.post_cache import post_cache
+from src.utilities.services.public_feed_service import public_feed_service
+from src.utilities.services.singleflight import singleflight
+from src.utilities.services.post_hydration_service import PostHydrationService
+from src.utilities.exceptions.http.exc_400 import http_400_exc_bad_cursor_request
+from src.utilities.exceptions.http.exc_404 import http_404_exc_id_not_found_request, http_404_exc_post_id_not_found_request
+from src.utilities.exceptions.http.exc_409 import http_409_exc_post_create_conflict_request
+from src.utilities.formatters.cursor_formatter import format_cursor_into_keyset, format_keyset_into_cursor
+from src.utilities.exceptions.database import DatabaseError, EntityDoesNotExist
 from fastapi import Depends, Query
 
 router = fastapi.APIRouter(prefix="/posts", tags=["posts"])
 
-async def enrich_post_with_interactions(
-    post: PostInResponse,
-    current_user: Account | None,
-    like_repo: LikeCRUDRepository,
-    bookmark_repo: BookmarkCRUDRepository
-) -> PostInResponse:
-    if current_user:
-        post.is_liked = await like_repo.is_post_liked(current_user.id, post.id)
-        post.is_bookmarked = await bookmark_repo.is_post_bookmarked(current_user.id, post.id)
-    return post
-
 @router.post("", response_model=PostInResponse)
 async def create_post(
     post_create: PostInCreate,
-    current_user: Account = Depends(get_current_user),
+    current_user: JWTPrincipal | None = Depends(get_current_user),
     post_repo: PostCRUDRepository = fastapi.Depends(get_repository(PostCRUDRepository)),
 ):
-    db_post = await post_repo.create_post(post_create, current_user.id)
-    
+    try:
+        db_post = await post_repo.create_post(post_create, current_user.id)
+    except EntityDoesNotExist:
+        raise await http_404_exc_id_not_found_request(id=current_user.id)
+    except DatabaseError:
+        raise await http_409_exc_post_create_conflict_request()
+
     return PostInResponse(
         id=db_post.id,
         content=db_post.content,
@@ -62,150 +59,86 @@ async def create_post(
 async def read_post(
     post_id: int,
     post_repo: PostCRUDRepository = fastapi.Depends(get_repository(PostCRUDRepository)),
-    like_repo: LikeCRUDRepository = fastapi.Depends(get_repository(LikeCRUDRepository)),
-    bookmark_repo: BookmarkCRUDRepository = fastapi.Depends(get_repository(BookmarkCRUDRepository)),
-    poll_vote_repo: PollVoteCRUDRepository = fastapi.Depends(get_repository(PollVoteCRUDRepository)),
-    current_user: Account | None = Depends(get_current_user),
+    hydration_service: PostHydrationService = fastapi.Depends(get_post_hydration_service),
+    current_user: JWTPrincipal | None = Depends(get_current_user),
 ):
-    try:
-        db_post = await post_repo.read_post(post_id)
-
-        async def process_post(post, current_user, like_repo, bookmark_repo, poll_vote_repo):
-            poll_response = None
-            if post.poll:
-                if current_user:
-                    user_vote = await poll_vote_repo.get_user_vote(post.poll.id, current_user.id)
-                else:
-                    user_vote = None
-
-                answers_response = []
-                for answer in post.poll.answers:
-                    answer_count = await poll_vote_repo.get_poll_vote_count(post.poll.id, answer.answer_index)
-
-                    is_selected = False
-                    if user_vote:
-                        is_selected = (answer.answer_index == user_vote.answer_index)
-                    answers_response.append(AnswerInResponsePost(
-                        id=answer.id,
-                        answerIndex=answer.answer_index,
-                        text=answer.text,
-                        answerCount=answer_count,
-                        isSelected=is_selected
-                    ))
-
-                poll_response = PollInResponsePost(
-                    id=post.poll.id,
-                    postId=post.poll.post_id,
-                    accountId=post.poll.account_id,
-                    answers=answers_response,
-                    expirationDate=post.poll.expiration_date,
-                )
+    # The version is taken before reading, so a response built from rows older than a concurrent write
+    # is stored under an outdated key and never served
+    version = post_cache.version(post_id)
+    public_post = post_cache.get(post_id)
+    if public_post is None:
+        async def build_public_post() -> PostInResponse:
+            db_post = await post_repo.read_post(post_id)
+            return hydration_service.build_public_post(db_post)
 
-            return await enrich_post_with_interactions(
-                PostInResponse(
-                    id=post.id,
-                    content=post.content,
-                    account=AccountDetailBase(
-                        avatar=post.account.avatar,
-                        username=post.account.username,
-                        fullName=post.account.username
-                    ),
-                    stats=PostStatsBase(
-                        comments=post.stats.comments,
-                        likes=post.stats.likes,
-                        bookmarks=post.stats.bookmarks
-                    ),
-                    photos=[photo.url for photo in post.photos],
-                    tags=[TagCreate(name=tag.name) for tag in post.tags],
-                    poll=poll_response,
-                    createdAt=post.created_at
-                ),
-                current_user, like_repo, bookmark_repo
-            )
-        
-        processed_post = await process_post(db_post, current_user, like_repo, bookmark_repo, poll_vote_repo)
-        return processed_post
+        # Concurrent misses on the same post version share one read, which also keeps a read that started
+        # before a write from being joined after it
+        try:
+            public_post = await singleflight.do(("read_post", post_id, version), build_public_post)
+        except EntityDoesNotExist:
+            raise await http_404_exc_post_id_not_found_request(post_id=post_id)
 
-    except EntityDoesNotExist:
-        raise await http_404_exc_post_id_not_found_request(post_id=post_id)
+        post_cache.set(post_id, version, public_post)
+
+    return await hydration_service.personalize_post(public_post, current_user)
 
 
 @router.get("", response_model=list[PostInResponse])
 async def read_posts(
+    request: fastapi.Request,
+    response: fastapi.Response,
     skip: int = Query(default=0, ge=0, description="Number of posts to skip"),
     limit: int = Query(default=10, ge=1, le=50, description="Number of posts to return"),
     tag: int = Query(default=None, description="Tag ID to filter posts by"),
+    cursor: str | None = Query(default=None, description="Opaque cursor returned in `X-Next-Cursor`; overrides `skip`"),
     post_repo: PostCRUDRepository = fastapi.Depends(get_repository(PostCRUDRepository)),
-    like_repo: LikeCRUDRepository = fastapi.Depends(get_repository(LikeCRUDRepository)),
-    bookmark_repo: BookmarkCRUDRepository = fastapi.Depends(get_repository(BookmarkCRUDRepository)),
-    poll_vote_repo: PollVoteCRUDRepository = fastapi.Depends(get_repository(PollVoteCRUDRepository)),
-    current_user: Account | None = Depends(get_current_user),
+    hydration_service: PostHydrationService = fastapi.Depends(get_post_hydration_service),
+    current_user: JWTPrincipal | None = Depends(get_current_user),
 ):
-    db_posts = await post_repo.read_posts(user_id=current_user.id, skip=skip, limit=limit, tag=tag)
-    
-    async def process_post(post, current_user, like_repo, bookmark_repo, poll_vote_repo):
-        poll_response = None
-        if post.poll:
-            if current_user:
-                user_vote = await poll_vote_repo.get_user_vote(post.poll.id, current_user.id)
-            else:
-                user_vote = None
-
-            #poll_votes = await poll_vote_repo.get_poll_votes_detail(post.poll.id)
-
-            answers_response = []
-            for answer in post.poll.answers:
-                answer_count = await poll_vote_repo.get_poll_vote_count(post.poll.id, answer.answer_index)
-
-                is_selected = False
-                if user_vote:
-                    is_selected = (answer.answer_index == user_vote.answer_index)
-                print(answer.answer_index)
-                answers_response.append(AnswerInResponsePost(
-                    id=answer.id,
-                    answerIndex=answer.answer_index,
-                    text=answer.text,
-                    answerCount=answer_count,
-                    isSelected=is_selected
-                ))
-
-            poll_response = PollInResponsePost(
-                id=post.poll.id,
-                postId=post.poll.post_id,
-                accountId=post.poll.account_id,
-                answers=answers_response,
-                expirationDate=post.poll.expiration_date,
-            )
+    try:
+        keyset = format_cursor_into_keyset(cursor) if cursor else None
+    except ValueError:
+        raise await http_400_exc_bad_cursor_request(cursor=cursor)
+
+    # Logged-out visitors all see the same feed, so its first pages come from a shared snapshot that a
+    # reverse proxy may cache too; `Vary` keeps it from handing them to logged-in users.
+    if current_user is None:
+        try:
+            public_page = public_feed_service.read_page(tag=tag, skip=skip, limit=limit, cursor=keyset)
+        except ValueError:
+            raise await http_400_exc_bad_cursor_request(cursor=cursor)
+        if public_page is not None:
+            cache_headers = {
+                "Cache-Control": f"public, max-age={settings.PUBLIC_FEED_REFRESH_SECONDS}",
+                "ETag": public_page.etag,
+                "Vary": "Authorization",
+            }
+            if request.headers.get("if-none-match") == public_page.etag:
+                return fastapi.Response(status_code=fastapi.status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+            response.headers.update(cache_headers)
+            if len(public_page.posts) == limit:
+                response.headers["X-Next-Cursor"] = format_keyset_into_cursor(
+                    public_page.posts[-1].created_at, public_page.posts[-1].id
+                )
+            return public_page.posts
+    else:
+        response.headers["Cache-Control"] = "private"
 
-        return await enrich_post_with_interactions(
-            PostInResponse(
-                id=post.id,
-                content=post.content,
-                account=AccountDetailBase(
-                    avatar=post.account.avatar,
-                    username=post.account.username,
-                    fullName=post.account.username
-                ),
-                stats=PostStatsBase(
-                    comments=post.stats.comments,
-                    likes=post.stats.likes,
-                    bookmarks=post.stats.bookmarks
-                ),
-                photos=[photo.url for photo in post.photos],
-                tags=[TagCreate(name=tag.name) for tag in post.tags],
-                poll=poll_response,
-                createdAt=post.created_at
-            ),
-            current_user, like_repo, bookmark_repo
+    async def read_public_posts() -> list[PostInResponse]:
+        db_posts = await post_repo.read_posts(
+            user_id=None, skip=skip, limit=limit, tag=tag, cursor=keyset  # type: ignore
         )
-    
-    post_responses = []
-    for post in db_posts:
-        processed_post = await process_post(post, current_user, like_repo, bookmark_repo, poll_vote_repo)
-        post_responses.append(processed_post)
-
-    return post_responses
-    #return await asyncio.gather(*[process_post(post, current_user, like_repo, bookmark_repo, poll_vote_repo) for post in db_posts])
+        return [hydration_service.build_public_post(db_post) for db_post in db_posts]
+
+    # The page does not depend on the viewer, so every viewer asking for it at once shares one read. Only the
+    # public responses are shared, never the rows, which belong to the session of whoever ran the read.
+    public_posts = await singleflight.do(("read_posts", tag, skip, limit, keyset), read_public_posts)
+
+    if len(public_posts) == limit:
+        response.headers["X-Next-Cursor"] = format_keyset_into_cursor(public_posts[-1].created_at, public_posts[-1].id)
+
+    return await hydration_service.personalize_posts(public_posts, current_user)
 
 @router.patch("/{post_id}", response_model=PostInResponse)
 async def update_post(
@@ -6,7 +6,7 @@ from src.api.dependencies.repository import get_repository
 from src.api.dependencies.auth import get_current_user
 from src.models.schemas.tag import TagResponse, TagCreate
 from src.repository.crud.tag import TagCRUDRepository
-from src.models.db.account import Account
+from src.models.schemas.jwt import JWTPrincipal
 
 router = fastapi.APIRouter(prefix="/tags", tags=["tags"])
 
@@ -21,7 +21,7 @@ async def get_all_tags(
 async def add_tags_to_post(
     post_id: int,
     tags: List[str],
-    current_user: Account = Depends(get_current_user),
+    current_user: JWTPrincipal | None = Depends(get_current_user),
     tag_repo: TagCRUDRepository = Depends(get_repository(TagCRUDRepository))
 ):
     added_tags = await tag_repo.add_tags_to_post(post_id, tags)
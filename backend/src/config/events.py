@@ -3,19 +3,59 @@ import typing
 import fastapi
 import loguru
 
+from src.config.manager import settings
+from src.repository.crud.search import SearchCRUDRepository
+from src.repository.database import async_db
 from src.repository.events import dispose_db_connection, initialize_db_connection
+from src.securities.hashing.hash import hash_generator
+from src.securities.hashing.pool import hashing_pool
+from src.utilities.caches.suggestion_index import suggestion_index
+from src.utilities.services.mail_outbox_worker import mail_outbox_worker
+from src.utilities.services.password_rehasher import password_rehasher
+from src.utilities.services.post_stats_aggregator import post_stats_aggregator
+from src.utilities.services.public_feed_service import public_feed_service
+from src.utilities.services.post_stats_reconciler import post_stats_reconciler
+from src.utilities.services.stats_reporter import stats_reporter
 
 
 def execute_backend_server_event_handler(backend_app: fastapi.FastAPI) -> typing.Any:
     async def launch_backend_server_events() -> None:
         await initialize_db_connection(backend_app=backend_app)
 
+        async with async_db.async_session() as session:
+            search_repo = SearchCRUDRepository(async_session=session)
+            suggestion_index.load(
+                tag_popularity=await search_repo.read_tag_popularity(),
+                username_popularity=await search_repo.read_username_popularity(),
+            )
+
+        # Only logs the time cost this machine would need, PASSWORD_HASH_TIME_COST stays the one in use
+        if settings.IS_PASSWORD_HASH_CALIBRATION_ENABLED:
+            await hashing_pool.run(
+                hash_generator.calibrate_password_hash_cost,
+                settings.PASSWORD_HASH_TARGET_VERIFY_MS,
+                settings.PASSWORD_HASH_MAX_TIME_COST,
+            )
+
+        post_stats_aggregator.start()
+        post_stats_reconciler.start()
+        mail_outbox_worker.start()
+        public_feed_service.start()
+        stats_reporter.start()
+
     return launch_backend_server_events
 
 
 def terminate_backend_server_event_handler(backend_app: fastapi.FastAPI) -> typing.Any:
     @loguru.logger.catch
     async def stop_backend_server_events() -> None:
+        await stats_reporter.stop()
+        await public_feed_service.stop()
+        await mail_outbox_worker.stop()
+        await post_stats_reconciler.stop()
+        await post_stats_aggregator.stop()
+        await password_rehasher.stop()
         await dispose_db_connection(backend_app=backend_app)
+        hashing_pool.shutdown()
 
     return stop_backend_server_events
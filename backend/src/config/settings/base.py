@@ -69,6 +69,7 @@ class BackendBaseSettings(BaseSettings):
     ]
     ALLOWED_METHODS: list[str] = ["*"]
     ALLOWED_HEADERS: list[str] = ["*"]
+    EXPOSED_HEADERS: list[str] = ["X-Next-Cursor", "X-DB-Queries", "X-DB-Time", "ETag"]
 
     LOGGING_LEVEL: int = logging.INFO
     LOGGERS: tuple[str, str] = ("uvicorn.asgi", "uvicorn.access")
@@ -76,7 +77,61 @@ class BackendBaseSettings(BaseSettings):
     HASHING_ALGORITHM_LAYER_1: str = decouple.config("HASHING_ALGORITHM_LAYER_1", cast=str)  # type: ignore
     HASHING_ALGORITHM_LAYER_2: str = decouple.config("HASHING_ALGORITHM_LAYER_2", cast=str)  # type: ignore
     HASHING_SALT: str = decouple.config("HASHING_SALT", cast=str)  # type: ignore
+    HASHING_POOL_WORKERS: int = decouple.config("HASHING_POOL_WORKERS", default=4, cast=int)  # type: ignore
+    HASHING_POOL_MAX_PENDING: int = decouple.config("HASHING_POOL_MAX_PENDING", default=64, cast=int)  # type: ignore
+    PASSWORD_HASH_TIME_COST: int = decouple.config("PASSWORD_HASH_TIME_COST", default=3, cast=int)  # type: ignore
+    PASSWORD_HASH_MEMORY_COST_KIB: int = decouple.config("PASSWORD_HASH_MEMORY_COST_KIB", default=65536, cast=int)  # type: ignore
+    PASSWORD_HASH_PARALLELISM: int = decouple.config("PASSWORD_HASH_PARALLELISM", default=4, cast=int)  # type: ignore
+    IS_PASSWORD_HASH_CALIBRATION_ENABLED: bool = decouple.config("IS_PASSWORD_HASH_CALIBRATION_ENABLED", default=False, cast=bool)  # type: ignore
+    PASSWORD_HASH_TARGET_VERIFY_MS: int = decouple.config("PASSWORD_HASH_TARGET_VERIFY_MS", default=250, cast=int)  # type: ignore
+    PASSWORD_HASH_MAX_TIME_COST: int = decouple.config("PASSWORD_HASH_MAX_TIME_COST", default=16, cast=int)  # type: ignore
     JWT_ALGORITHM: str = decouple.config("JWT_ALGORITHM", cast=str)  # type: ignore
+    IS_JWT_CLAIMS_PRINCIPAL: bool = decouple.config("IS_JWT_CLAIMS_PRINCIPAL", default=False, cast=bool)  # type: ignore
+
+    TAG_CACHE_MAX_SIZE: int = decouple.config("TAG_CACHE_MAX_SIZE", default=4096, cast=int)  # type: ignore
+
+    IS_POST_STATS_WRITE_BEHIND: bool = decouple.config("IS_POST_STATS_WRITE_BEHIND", default=False, cast=bool)  # type: ignore
+    POST_STATS_FLUSH_INTERVAL_MS: int = decouple.config("POST_STATS_FLUSH_INTERVAL_MS", default=500, cast=int)  # type: ignore
+    POST_STATS_FLUSH_MAX_EVENTS: int = decouple.config("POST_STATS_FLUSH_MAX_EVENTS", default=1000, cast=int)  # type: ignore
+    IS_POST_STATS_RECONCILE_ENABLED: bool = decouple.config("IS_POST_STATS_RECONCILE_ENABLED", default=False, cast=bool)  # type: ignore
+    POST_STATS_RECONCILE_CHUNK_SIZE: int = decouple.config("POST_STATS_RECONCILE_CHUNK_SIZE", default=500, cast=int)  # type: ignore
+    POST_STATS_RECONCILE_MAX_POSTS_PER_SECOND: int = decouple.config("POST_STATS_RECONCILE_MAX_POSTS_PER_SECOND", default=2000, cast=int)  # type: ignore
+    POST_STATS_RECONCILE_INTERVAL_SECONDS: int = decouple.config("POST_STATS_RECONCILE_INTERVAL_SECONDS", default=3600, cast=int)  # type: ignore
+
+    IS_STATS_REPORT_ENABLED: bool = decouple.config("IS_STATS_REPORT_ENABLED", default=True, cast=bool)  # type: ignore
+    STATS_REPORT_INTERVAL_SECONDS: int = decouple.config("STATS_REPORT_INTERVAL_SECONDS", default=300, cast=int)  # type: ignore
+
+    IS_DB_QUERY_COUNTER_ENABLED: bool = decouple.config("IS_DB_QUERY_COUNTER_ENABLED", default=True, cast=bool)  # type: ignore
+    DB_QUERY_REPEAT_THRESHOLD: int = decouple.config("DB_QUERY_REPEAT_THRESHOLD", default=5, cast=int)  # type: ignore
+
+    SEARCH_FACET_TIMEOUT_MS: int = decouple.config("SEARCH_FACET_TIMEOUT_MS", default=800, cast=int)  # type: ignore
+    SEARCH_CACHE_MAX_SIZE: int = decouple.config("SEARCH_CACHE_MAX_SIZE", default=1024, cast=int)  # type: ignore
+    SEARCH_CACHE_TTL_SECONDS: int = decouple.config("SEARCH_CACHE_TTL_SECONDS", default=60, cast=int)  # type: ignore
+    SUGGESTION_INDEX_MAX_SUGGESTIONS: int = decouple.config("SUGGESTION_INDEX_MAX_SUGGESTIONS", default=10, cast=int)  # type: ignore
+
+    PRINCIPAL_CACHE_MAX_SIZE: int = decouple.config("PRINCIPAL_CACHE_MAX_SIZE", default=10000, cast=int)  # type: ignore
+    # Cache invalidation does not cross worker processes, so this is how long a revoked account stays usable
+    PRINCIPAL_CACHE_TTL_SECONDS: int = decouple.config("PRINCIPAL_CACHE_TTL_SECONDS", default=30, cast=int)  # type: ignore
+    POST_CACHE_MAX_SIZE: int = decouple.config("POST_CACHE_MAX_SIZE", default=2048, cast=int)  # type: ignore
+    # Bumps do not cross worker processes, so this is how long other workers may serve an edited or deleted post
+    POST_CACHE_TTL_SECONDS: int = decouple.config("POST_CACHE_TTL_SECONDS", default=30, cast=int)  # type: ignore
+    POST_CACHE_MAX_VERSIONS: int = decouple.config("POST_CACHE_MAX_VERSIONS", default=100000, cast=int)  # type: ignore
+    IS_PUBLIC_FEED_SNAPSHOT_ENABLED: bool = decouple.config("IS_PUBLIC_FEED_SNAPSHOT_ENABLED", default=True, cast=bool)  # type: ignore
+    PUBLIC_FEED_PAGE_SIZE: int = decouple.config("PUBLIC_FEED_PAGE_SIZE", default=10, cast=int)  # type: ignore
+    PUBLIC_FEED_PAGES: int = decouple.config("PUBLIC_FEED_PAGES", default=5, cast=int)  # type: ignore
+    PUBLIC_FEED_MAX_TAGS: int = decouple.config("PUBLIC_FEED_MAX_TAGS", default=32, cast=int)  # type: ignore
+    PUBLIC_FEED_REFRESH_SECONDS: int = decouple.config("PUBLIC_FEED_REFRESH_SECONDS", default=30, cast=int)  # type: ignore
+
+    SMTP_HOST: str = decouple.config("SMTP_HOST", default="smtp.gmail.com", cast=str)  # type: ignore
+    SMTP_PORT: int = decouple.config("SMTP_PORT", default=587, cast=int)  # type: ignore
+    SMTP_USERNAME: str = decouple.config("SMTP_USERNAME", cast=str)  # type: ignore
+    SMTP_PASSWORD: str = decouple.config("SMTP_PASSWORD", cast=str)  # type: ignore
+    SMTP_FROM_EMAIL: str = decouple.config("SMTP_FROM_EMAIL", cast=str)  # type: ignore
+    IS_SMTP_STARTTLS_ENABLED: bool = decouple.config("IS_SMTP_STARTTLS_ENABLED", default=True, cast=bool)  # type: ignore
+    MAIL_OUTBOX_BATCH_SIZE: int = decouple.config("MAIL_OUTBOX_BATCH_SIZE", default=50, cast=int)  # type: ignore
+    MAIL_OUTBOX_POLL_INTERVAL_SECONDS: int = decouple.config("MAIL_OUTBOX_POLL_INTERVAL_SECONDS", default=5, cast=int)  # type: ignore
+    MAIL_OUTBOX_MAX_ATTEMPTS: int = decouple.config("MAIL_OUTBOX_MAX_ATTEMPTS", default=8, cast=int)  # type: ignore
+    MAIL_OUTBOX_BACKOFF_SECONDS: int = decouple.config("MAIL_OUTBOX_BACKOFF_SECONDS", default=30, cast=int)  # type: ignore
 
     class Config(SettingsConfigDict):
         case_sensitive: bool = True
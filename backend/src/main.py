@@ -3,6 +3,7 @@ import uvicorn
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.endpoints import router as api_endpoint_router
+from src.api.middlewares.query_counter import QueryCounterMiddleware
 from src.config.events import execute_backend_server_event_handler, terminate_backend_server_event_handler
 from src.config.manager import settings
 
@@ -10,12 +11,16 @@ from src.config.manager import settings
 def initialize_backend_application() -> fastapi.FastAPI:
     app = fastapi.FastAPI(**settings.set_backend_app_attributes)  # type: ignore
 
+    if settings.IS_DB_QUERY_COUNTER_ENABLED:
+        app.add_middleware(QueryCounterMiddleware, repeat_threshold=settings.DB_QUERY_REPEAT_THRESHOLD)
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.ALLOWED_ORIGINS,
         allow_credentials=settings.IS_ALLOWED_CREDENTIALS,
         allow_methods=settings.ALLOWED_METHODS,
         allow_headers=settings.ALLOWED_HEADERS,
+        expose_headers=settings.EXPOSED_HEADERS,
     )
 
     app.add_event_handler(
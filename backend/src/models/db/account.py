@@ -23,6 +23,10 @@ class Account(Base):  # type: ignore
     is_active: SQLAlchemyMapped[bool] = sqlalchemy_mapped_column(sqlalchemy.Boolean, nullable=False, default=False)
     is_logged_in: SQLAlchemyMapped[bool] = sqlalchemy_mapped_column(sqlalchemy.Boolean, nullable=False, default=False)
     verification_code: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=6), nullable=True)
+    # Bumped whenever claims carried by issued access tokens must stop being trusted
+    token_version: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(
+        sqlalchemy.Integer, nullable=False, default=0, server_default="0"
+    )
     created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
         sqlalchemy.DateTime(timezone=True), nullable=False, server_default=sqlalchemy_functions.now()
     )
@@ -36,6 +40,13 @@ class Account(Base):  # type: ignore
     posts: SQLAlchemyMapped[list["Post"]] = relationship(back_populates="account")
 
     __mapper_args__ = {"eager_defaults": True}
+    # Trigram index (pg_trgm) behind the fuzzy username search, and the seek index of the account listing
+    __table_args__ = (
+        sqlalchemy.Index(
+            "ix_account_username_trgm", "username", postgresql_using="gin", postgresql_ops={"username": "gin_trgm_ops"}
+        ),
+        sqlalchemy.Index("ix_account_created_at_id", "created_at", "id"),
+    )
 
     @property
     def hashed_password(self) -> str:
@@ -20,6 +20,8 @@ class Answer(Base):
     text: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(String)
     poll_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(ForeignKey("polls.id"))
     answer_index: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(Integer)
+    # Denormalized tally, maintained by `PollVoteCRUDRepository.create_vote`
+    vote_count: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(Integer, nullable=False, default=0, server_default="0")
 
     # Relationship (only defined on one side)
     poll: SQLAlchemyMapped["Poll"] = relationship(back_populates="answers")
\ No newline at end of file
@@ -9,7 +9,7 @@ class Bookmark(Base):
 
     id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(primary_key=True, autoincrement="auto")
     account_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.ForeignKey("account.id", ondelete="CASCADE"))
-    post_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.ForeignKey("posts.id", ondelete="CASCADE"))
+    post_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.ForeignKey("posts.id", ondelete="CASCADE"), index=True)
     created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
         sqlalchemy.DateTime(timezone=True), 
         nullable=False, 
@@ -18,4 +18,9 @@ class Bookmark(Base):
 
     # Relationships
     account = relationship("Account", backref="bookmarks")
-    post = relationship("Post", backref="bookmarks")
\ No newline at end of file
+    post = relationship("Post", backref="bookmarks")
+
+    # A user can bookmark a post only once; also lets writes use ON CONFLICT DO NOTHING
+    __table_args__ = (
+        sqlalchemy.UniqueConstraint("account_id", "post_id", name="unique_account_post_bookmark"),
+    )
\ No newline at end of file
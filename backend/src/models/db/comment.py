@@ -9,9 +9,12 @@ class Comment(Base):
 
     id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(primary_key=True, autoincrement="auto")
     content: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.Text, nullable=False)
-    post_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.ForeignKey("posts.id", ondelete="CASCADE"))
+    post_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.ForeignKey("posts.id", ondelete="CASCADE"), index=True)
     author_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.ForeignKey("account.id", ondelete="CASCADE"))
     parent_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.ForeignKey("comment.id", ondelete="CASCADE"), nullable=True)
+    # Materialized path of zero-padded ids from the root down to this comment, e.g. `0000000007/0000000042`.
+    # "C" collation keeps both the prefix match and the ordering of the (post_id, path) index byte-wise.
+    path: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.Text(collation="C"), nullable=True)
     created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
         sqlalchemy.DateTime(timezone=True), nullable=False, server_default=sqlalchemy_functions.now()
     )
@@ -25,4 +28,17 @@ class Comment(Base):
     # Relationships
     post = relationship("Post", back_populates="comments")
     author = relationship("Account", backref="comments")
-    replies = relationship("Comment", backref=sqlalchemy.orm.backref("parent", remote_side=[id]))
\ No newline at end of file
+    replies = relationship("Comment", backref=sqlalchemy.orm.backref("parent", remote_side=[id]))
+
+    __table_args__ = (sqlalchemy.Index("ix_comment_post_id_path", "post_id", "path"),)
+
+
+# Serves the newest-first listing of a post's top-level comments, the oldest-first replies of a comment
+# (scanned backwards) and the grouped reply counts of a page.
+sqlalchemy.Index(
+    "ix_comment_post_id_parent_id_created_at",
+    Comment.post_id,
+    Comment.parent_id,
+    Comment.created_at.desc(),
+    Comment.id.desc(),
+)
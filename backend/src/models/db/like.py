@@ -9,7 +9,7 @@ class Like(Base):
 
     id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(primary_key=True, autoincrement="auto")
     account_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.ForeignKey("account.id", ondelete="CASCADE"))
-    post_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.ForeignKey("posts.id", ondelete="CASCADE"))
+    post_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.ForeignKey("posts.id", ondelete="CASCADE"), index=True)
     created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
         sqlalchemy.DateTime(timezone=True), 
         nullable=False, 
@@ -18,4 +18,9 @@ class Like(Base):
 
     # Relationships
     account = relationship("Account", backref="likes")
-    post = relationship("Post", backref="likes")
\ No newline at end of file
+    post = relationship("Post", backref="likes")
+
+    # A user can like a post only once; also lets writes use ON CONFLICT DO NOTHING
+    __table_args__ = (
+        sqlalchemy.UniqueConstraint("account_id", "post_id", name="unique_account_post_like"),
+    )
\ No newline at end of file
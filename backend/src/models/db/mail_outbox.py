@@ -0,0 +1,38 @@
+import datetime
+
+import sqlalchemy
+from sqlalchemy.orm import Mapped as SQLAlchemyMapped, mapped_column as sqlalchemy_mapped_column
+from sqlalchemy.sql import functions as sqlalchemy_functions
+
+from src.repository.table import Base
+
+
+class MailOutbox(Base):  # type: ignore
+    __tablename__ = "mail_outbox"
+
+    id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(primary_key=True, autoincrement="auto")
+    recipient: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=320), nullable=False)
+    subject: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=255), nullable=False)
+    body: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.Text, nullable=False)
+    attempts: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(
+        sqlalchemy.Integer, nullable=False, default=0, server_default="0"
+    )
+    last_error: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.Text, nullable=True)
+    next_attempt_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=False, server_default=sqlalchemy_functions.now()
+    )
+    sent_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=True
+    )
+    created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=False, server_default=sqlalchemy_functions.now()
+    )
+
+    # Only unsent mail is ever polled, so the index stays as small as the backlog
+    __table_args__ = (
+        sqlalchemy.Index(
+            "ix_mail_outbox_pending",
+            "next_attempt_at",
+            postgresql_where=sqlalchemy.text("sent_at IS NULL"),
+        ),
+    )
@@ -9,6 +9,7 @@ from sqlalchemy import (
     ForeignKey,
     String,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import (
     Mapped as SQLAlchemyMapped,
     mapped_column as sqlalchemy_mapped_column,
@@ -25,6 +26,12 @@ if TYPE_CHECKING:
     from src.models.db.post_stats import PostStats
     from src.models.db.poll import Poll
 
+# Posts are written in Turkish and English, so both stemmers feed the search vector
+POST_SEARCH_VECTOR_EXPRESSION = (
+    "to_tsvector('turkish'::regconfig, coalesce(content, '')) || "
+    "to_tsvector('english'::regconfig, coalesce(content, ''))"
+)
+
 class Post(Base):
     __tablename__ = "posts"
 
@@ -34,6 +41,9 @@ class Post(Base):
     created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
         DateTime, default=datetime.datetime.utcnow
     )
+    search_vector: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(
+        TSVECTOR, sqlalchemy.Computed(POST_SEARCH_VECTOR_EXPRESSION, persisted=True), deferred=True
+    )
 
     # Relationships (only defined on one side)
     account: SQLAlchemyMapped["Account"] = relationship(back_populates="posts")
@@ -41,4 +51,11 @@ class Post(Base):
     photos: SQLAlchemyMapped[list["Photo"]] = relationship(back_populates="post")
     poll: SQLAlchemyMapped["Poll"] = relationship(back_populates="post", uselist=False)
     tags = relationship("Tag", secondary=post_tags, back_populates="posts")
-    comments: SQLAlchemyMapped[list["Comment"]] = relationship(back_populates="post")
\ No newline at end of file
+    comments: SQLAlchemyMapped[list["Comment"]] = relationship(back_populates="post")
+
+    # Keyset pagination indexes for the main feed and the profile feed
+    __table_args__ = (
+        sqlalchemy.Index("ix_posts_created_at_id", "created_at", "id"),
+        sqlalchemy.Index("ix_posts_account_id_created_at_id", "account_id", "created_at", "id"),
+        sqlalchemy.Index("ix_posts_search_vector", "search_vector", postgresql_using="gin"),
+    )
\ No newline at end of file
@@ -19,7 +19,7 @@ class PostStats(Base):
     comments: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(Integer, default=0)
     likes: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(Integer, default=0)
     bookmarks: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(Integer, default=0)
-    post_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(ForeignKey("posts.id"))
+    post_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(ForeignKey("posts.id"), index=True)
 
     # Relationship (only defined on one side)
     post: SQLAlchemyMapped["Post"] = relationship(back_populates="stats")
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Table, ForeignKey
+from sqlalchemy import Column, Index, Integer, String, Table, ForeignKey
 from sqlalchemy.orm import relationship
 
 from src.repository.table import Base
@@ -18,4 +18,9 @@ class Tag(Base):
     name = Column(String, unique=True, nullable=False)
     
     # Relationship with posts
-    posts = relationship("Post", secondary=post_tags, back_populates="tags")
\ No newline at end of file
+    posts = relationship("Post", secondary=post_tags, back_populates="tags")
+
+    # Trigram index (pg_trgm) behind the fuzzy tag search
+    __table_args__ = (
+        Index("ix_tags_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
@@ -48,6 +48,14 @@ class AccountInResponse(BaseSchemaModel):
     id: int
     authorized_account: AccountWithToken
 
+
+class AccountInList(BaseSchemaModel):
+    id: int
+    username: str
+    avatar: str | None = None
+    is_verified: bool = False
+    created_at: datetime.datetime
+
 class AccountDetailBase(BaseSchemaModel):
     avatar: Optional[str]
     username: str
@@ -1,6 +1,6 @@
 from datetime import datetime
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 class CommentBase(BaseModel):
     content: str = Field(..., min_length=1)
@@ -22,4 +22,8 @@ class CommentInDB(CommentBase):
 
 class CommentResponse(CommentInDB):
     author_username: str
-    author_avatar: Optional[str]
\ No newline at end of file
+    author_avatar: Optional[str]
+    replies_count: int = 0
+class CommentInThread(CommentResponse):
+    depth: int
+    replies: List["CommentInThread"] = []
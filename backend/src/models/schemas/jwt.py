@@ -1,7 +1,11 @@
 import datetime
+import typing
 
 import pydantic
 
+if typing.TYPE_CHECKING:
+    from src.models.db.account import Account
+
 
 class JWToken(pydantic.BaseModel):
     exp: datetime.datetime
@@ -13,4 +17,33 @@ class JWTAccount(pydantic.BaseModel):
     email: pydantic.EmailStr
 
 class JWTVerification(pydantic.BaseModel):
-    account_id: int
\ No newline at end of file
+    account_id: int
+
+class JWTPrincipal(pydantic.BaseModel):
+    """
+    The authenticated account as a plain value, either described by the claims of its access token or
+    copied from its row by `get_current_user`. It carries no session state, so it can be cached and shared
+    between requests, and its fields can be stale until the token is reissued or the cache entry expires.
+    """
+
+    account_id: int
+    username: str
+    email: pydantic.EmailStr
+    avatar: str | None = None
+    is_verified: bool
+    token_version: int
+
+    @property
+    def id(self) -> int:
+        return self.account_id
+
+    @classmethod
+    def from_account(cls, account: "Account") -> "JWTPrincipal":
+        return cls(
+            account_id=account.id,
+            username=account.username,
+            email=account.email,
+            avatar=account.avatar,
+            is_verified=account.is_verified,
+            token_version=account.token_version,
+        )
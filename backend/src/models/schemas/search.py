@@ -1,10 +1,20 @@
-from typing import List
+from typing import List, Optional
 from src.models.schemas.base import BaseSchemaModel
 from src.models.schemas.post import PostInResponse
 from src.models.schemas.account import AccountDetailBase
 from src.models.schemas.tag import TagResponse
 
+class PostInSearchResponse(PostInResponse):
+    headline: Optional[str] = None
+
 class SearchResponse(BaseSchemaModel):
     users: List[AccountDetailBase] = []
-    posts: List[PostInResponse] = []
-    tags: List[TagResponse] = []
\ No newline at end of file
+    posts: List[PostInSearchResponse] = []
+    tags: List[TagResponse] = []
+    # True when at least one facet timed out and came back empty
+    is_partial: bool = False
+    timed_out_facets: List[str] = []
+
+class SuggestionResponse(BaseSchemaModel):
+    tags: List[str] = []
+    users: List[str] = []
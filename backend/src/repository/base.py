@@ -1,5 +1,6 @@
 from src.models.db.account import Account
 from src.models.db.answer import Answer
+from src.models.db.mail_outbox import MailOutbox
 from src.models.db.post import Post
 from src.models.db.post_stats import PostStats
 from src.models.db.poll import Poll
@@ -1,3 +1,4 @@
+import datetime
 import random
 import string
 import typing
@@ -6,28 +7,24 @@ import sqlalchemy
 from sqlalchemy.sql import functions as sqlalchemy_functions
 
 from src.models.db.account import Account
+from src.models.db.mail_outbox import MailOutbox
+from src.models.db.post import Post
 from src.models.schemas.account import AccountInCreate, AccountInLogin, AccountInUpdate, AccountInSwaggerAuth
 from src.repository.crud.base import BaseCRUDRepository
 from src.securities.hashing.password import pwd_generator
 from src.securities.verifications.credentials import credential_verifier
+from src.utilities.caches.post_cache import post_cache
+from src.utilities.caches.principal_cache import principal_cache
+from src.utilities.caches.suggestion_index import suggestion_index
 from src.utilities.exceptions.database import EntityAlreadyExists, EntityDoesNotExist
 from src.utilities.exceptions.password import PasswordDoesNotMatch
-from src.utilities.services.mail_service import MailService
+from src.utilities.services.mail_outbox_worker import mail_outbox_worker
+from src.utilities.services.mail_service import mail_service
+from src.utilities.services.password_rehasher import password_rehasher
 from src.securities.authorizations.jwt import get_jwt_generator
 
 jwt_generator = get_jwt_generator()
 
-# Gmail uygulama şifresi (dou.unihelp@gmail.com için)
-# xxfv bvmo rywe glpl
-
-mail_service = MailService({
-    "host": "smtp.gmail.com",
-    "port": 587,
-    "username": "dou.unihelp",
-    "password": "xxfv bvmo rywe glpl",
-    "from": "dou.unihelp"
-})
-
 class AccountCRUDRepository(BaseCRUDRepository):
     """
     Hesap CRUD işlemleri için repository sınıfı.
@@ -51,41 +48,58 @@ class AccountCRUDRepository(BaseCRUDRepository):
             is_verified=False
         )
 
-        new_account.set_hash_salt(hash_salt=pwd_generator.generate_salt) # Hash tuzu ayarlar
+        new_account.set_hash_salt(hash_salt=await pwd_generator.generate_salt()) # Hash tuzu ayarlar
         new_account.set_hashed_password(
-            hashed_password=pwd_generator.generate_hashed_password(
+            hashed_password=await pwd_generator.generate_hashed_password(
                 hash_salt=new_account.hash_salt, new_password=account_create.password
             )
         ) # Şifreyi hashleyerek ayarlar
 
         self.async_session.add(instance=new_account) # Yeni hesabı oturuma ekler
-        await self.async_session.commit() # Veritabanına kaydeder
-        await self.async_session.refresh(instance=new_account) # Hesabı yeniler
+        await self.async_session.flush() # Doğrulama token'ı için hesap id'sini alır
 
         # Doğrulama linki oluştur
         verification_token = jwt_generator.generate_verification_token(account_id=new_account.id)
         #base_url = "http://your-app-url.com"  # Uygulamanızın URL'si ile değiştirin
         verification_url = f"/auth/verify/{verification_token}"
 
-        # Doğrulama e-postası gönder
-        mail_service.send_verification_code(
-            to=[new_account.email],
-            code=verification_code,
-            verification_url=verification_url  # Şimdilik kod doğrulaması kullanacağız
-        )
+        # Doğrulama e-postası hesapla aynı transaction'da outbox'a yazılır, gönderimi arka plandaki worker yapar
+        subject, body = mail_service.build_verification_mail(code=verification_code, verification_url=verification_url)
+        self.async_session.add(instance=MailOutbox(recipient=new_account.email, subject=subject, body=body))
+
+        await self.async_session.commit() # Veritabanına kaydeder
+        await self.async_session.refresh(instance=new_account) # Hesabı yeniler
+        suggestion_index.add_username(username=new_account.username) # Öneri indeksine ekler
+        mail_outbox_worker.notify()
 
         return new_account
 
-    async def read_accounts(self) -> typing.Sequence[Account]:
+    async def read_accounts(
+        self, limit: int = 20, cursor: tuple[datetime.datetime, int] | None = None
+    ) -> typing.Sequence[sqlalchemy.Row]:
         """
-        Tüm hesapları okur.
+        Hesapları en yeniden eskiye doğru sayfa sayfa okur.
+
+        Yalnızca listede gösterilen kolonlar seçilir ve sayfa `(created_at, id)` cursor'ı ile bulunur,
+        böylece her sayfanın maliyeti kayıtlı hesap sayısından bağımsızdır.
+
+        Args:
+            limit (int): Sayfadaki hesap sayısı.
+            cursor (tuple[datetime.datetime, int] | None): Önceki sayfanın son hesabının konumu.
 
         Returns:
-            typing.Sequence[Account]: Hesap modelleri listesi.
+            typing.Sequence[sqlalchemy.Row]: `id`, `username`, `avatar`, `is_verified` ve `created_at` satırları.
         """
-        stmt = sqlalchemy.select(Account)
+        stmt = (
+            sqlalchemy.select(Account.id, Account.username, Account.avatar, Account.is_verified, Account.created_at)
+            .order_by(Account.created_at.desc(), Account.id.desc())
+            .limit(limit)
+        )
+        if cursor:
+            stmt = stmt.where(sqlalchemy.tuple_(Account.created_at, Account.id) < sqlalchemy.tuple_(*cursor))
+
         query = await self.async_session.execute(statement=stmt)
-        return query.scalars().all()
+        return query.all()
 
     async def read_account_by_id(self, id: int) -> Account:
         """
@@ -108,6 +122,22 @@ class AccountCRUDRepository(BaseCRUDRepository):
 
         return query.scalar()  # type: ignore
 
+    async def read_token_version(self, id: int) -> int | None:
+        """
+        Hesabın güncel `token_version` değerini okur, hesap yoksa `None` döner.
+        """
+        stmt = sqlalchemy.select(Account.token_version).where(Account.id == id)
+        query = await self.async_session.execute(statement=stmt)
+        return query.scalar()
+
+    async def read_post_ids_by_account_id(self, id: int) -> list[int]:
+        """
+        Hesabın yazdığı gönderilerin ID'lerini okur; yazar bilgisi değişince önbellekteki gönderileri bulmak için.
+        """
+        stmt = sqlalchemy.select(Post.id).where(Post.account_id == id)
+        query = await self.async_session.execute(statement=stmt)
+        return list(query.scalars().all())
+
     async def read_account_by_username(self, username: str) -> Account:
         """
         Kullanıcı adına göre hesabı okur.
@@ -173,9 +203,12 @@ class AccountCRUDRepository(BaseCRUDRepository):
         if not db_account:
             raise EntityDoesNotExist("Wrong email!")
 
-        if not pwd_generator.is_password_authenticated(hash_salt=db_account.hash_salt, password=account_login.password, hashed_password=db_account.hashed_password):  # type: ignore
+        if not await pwd_generator.is_password_authenticated(hash_salt=db_account.hash_salt, password=account_login.password, hashed_password=db_account.hashed_password):  # type: ignore
             raise PasswordDoesNotMatch("Password does not match!")
 
+        if pwd_generator.is_password_hash_stale(hashed_password=db_account.hashed_password):
+            password_rehasher.schedule(account=db_account, password=account_login.password) # Eski parametreli hash'i arka planda yeniler
+
         return db_account  # type: ignore
 
     async def read_user_by_password_authentication_swagger(self, account_login: AccountInSwaggerAuth) -> Account:
@@ -201,9 +234,12 @@ class AccountCRUDRepository(BaseCRUDRepository):
         if not db_account:
             raise EntityDoesNotExist("Wrong username!")
 
-        if not pwd_generator.is_password_authenticated(hash_salt=db_account.hash_salt, password=account_login.password, hashed_password=db_account.hashed_password):  # type: ignore
+        if not await pwd_generator.is_password_authenticated(hash_salt=db_account.hash_salt, password=account_login.password, hashed_password=db_account.hashed_password):  # type: ignore
             raise PasswordDoesNotMatch("Password does not match!")
 
+        if pwd_generator.is_password_hash_stale(hashed_password=db_account.hashed_password):
+            password_rehasher.schedule(account=db_account, password=account_login.password) # Eski parametreli hash'i arka planda yeniler
+
         return db_account  # type: ignore
 
     async def update_account_by_id(self, id: int, account_update: AccountInUpdate) -> Account:
@@ -229,8 +265,13 @@ class AccountCRUDRepository(BaseCRUDRepository):
         if not update_account:
             raise EntityDoesNotExist(f"Account with id `{id}` does not exist!")  # type: ignore
 
+        old_username = update_account.username
         update_stmt = sqlalchemy.update(table=Account).where(Account.id == update_account.id).values(updated_at=sqlalchemy_functions.now())  # type: ignore
 
+        # Kimlik bilgisi değişince eski token'ların claim'leri geçersiz sayılır
+        if new_account_data["username"] or new_account_data["email"] or new_account_data["password"]:
+            update_stmt = update_stmt.values(token_version=Account.token_version + 1)
+
         if new_account_data["username"]:
             update_stmt = update_stmt.values(username=new_account_data["username"])
 
@@ -238,11 +279,47 @@ class AccountCRUDRepository(BaseCRUDRepository):
             update_stmt = update_stmt.values(username=new_account_data["email"])
 
         if new_account_data["password"]:
-            update_account.set_hash_salt(hash_salt=pwd_generator.generate_salt)  # type: ignore
-            update_account.set_hashed_password(hashed_password=pwd_generator.generate_hashed_password(hash_salt=update_account.hash_salt, new_password=new_account_data["password"]))  # type: ignore
+            update_account.set_hash_salt(hash_salt=await pwd_generator.generate_salt())  # type: ignore
+            update_account.set_hashed_password(hashed_password=await pwd_generator.generate_hashed_password(hash_salt=update_account.hash_salt, new_password=new_account_data["password"]))  # type: ignore
+
+        await self.async_session.execute(statement=update_stmt)
+        await self.async_session.commit()
+        principal_cache.invalidate_account(account_id=update_account.id)
+        await self.async_session.refresh(instance=update_account)
+
+        if update_account.username != old_username:
+            post_cache.bump_many(await self.read_post_ids_by_account_id(id=update_account.id)) # Önbellekteki gönderiler yazar adını taşır
+            suggestion_index.rename_username(old_username=old_username, new_username=update_account.username)
+
+        return update_account  # type: ignore
+
+    async def update_account_avatar(self, id: int, avatar_url: str) -> Account:
+        """
+        ID'ye göre hesabın avatarını günceller.
+
+        Args:
+            id (int): Hesap ID'si.
+            avatar_url (str): Yeni avatar adresi.
+
+        Returns:
+            Account: Güncellenmiş hesap modeli.
+
+        Raises:
+            EntityDoesNotExist: Hesap bulunamazsa.
+        """
+        select_stmt = sqlalchemy.select(Account).where(Account.id == id)
+        query = await self.async_session.execute(statement=select_stmt)
+        update_account = query.scalar()
+
+        if not update_account:
+            raise EntityDoesNotExist(f"Account with id `{id}` does not exist!")  # type: ignore
+
+        update_stmt = sqlalchemy.update(table=Account).where(Account.id == update_account.id).values(avatar=avatar_url, updated_at=sqlalchemy_functions.now())  # type: ignore
 
         await self.async_session.execute(statement=update_stmt)
         await self.async_session.commit()
+        principal_cache.invalidate_account(account_id=update_account.id)
+        post_cache.bump_many(await self.read_post_ids_by_account_id(id=update_account.id)) # Önbellekteki gönderiler yazar avatarını taşır
         await self.async_session.refresh(instance=update_account)
 
         return update_account  # type: ignore
@@ -267,10 +344,14 @@ class AccountCRUDRepository(BaseCRUDRepository):
         if not delete_account:
             raise EntityDoesNotExist(f"Account with id `{id}` does not exist!")  # type: ignore
 
+        post_ids = await self.read_post_ids_by_account_id(id=delete_account.id)
         stmt = sqlalchemy.delete(table=Account).where(Account.id == delete_account.id)
 
         await self.async_session.execute(statement=stmt)
         await self.async_session.commit()
+        principal_cache.invalidate_account(account_id=delete_account.id)
+        post_cache.bump_many(post_ids)
+        suggestion_index.remove_username(username=delete_account.username)
 
         return f"Account with id '{id}' is successfully deleted!"
 
@@ -329,4 +410,6 @@ class AccountCRUDRepository(BaseCRUDRepository):
         account = await self.read_account_by_id(account_id)
         account.is_verified = True
         account.verification_code = None
+        account.token_version = account.token_version + 1
         await self.async_session.commit()
+        principal_cache.invalidate_account(account_id=account_id)
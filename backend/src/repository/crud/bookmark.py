@@ -1,57 +1,88 @@
 import sqlalchemy
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 from src.models.db.bookmark import Bookmark
 from src.models.db.post import Post
 from src.models.db.poll import Poll
 from src.models.db.post_stats import PostStats
 from src.repository.crud.base import BaseCRUDRepository
+from src.utilities.caches.post_cache import post_cache
+from src.utilities.services.post_stats_aggregator import post_stats_aggregator
 from src.utilities.exceptions.database import EntityDoesNotExist, EntityAlreadyExists
 
 class BookmarkCRUDRepository(BaseCRUDRepository):
-    async def create_bookmark(self, account_id: int, post_id: int) -> Bookmark:
-        stmt = (
-            sqlalchemy.select(Post)
-            .where(Post.id == post_id)
+    async def create_bookmark(self, account_id: int, post_id: int) -> bool:
+        """
+        Idempotently bookmarks a post for a user and returns whether a new row was written.
+
+        The insert and the `post_stats.bookmarks` increment run in one statement, and the unique
+        `(account_id, post_id)` constraint makes concurrent taps count only once.
+        """
+        new_bookmark = (
+            insert(Bookmark)
+            .values(account_id=account_id, post_id=post_id)
+            .on_conflict_do_nothing(constraint="unique_account_post_bookmark")
+            .returning(Bookmark.post_id)
+            .cte("new_bookmark")
         )
-        result = await self.async_session.execute(stmt)
-        db_post = result.scalar_one_or_none()  # Use scalar_one_or_none() to handle the case where the post doesn't exist
-        if not db_post:
+        counted_bookmark = (
+            sqlalchemy.update(PostStats)
+            .where(PostStats.post_id == new_bookmark.c.post_id)
+            .values(bookmarks=PostStats.bookmarks + 1)
+            .cte("counted_bookmark")
+        )
+        stmt = sqlalchemy.select(sqlalchemy.func.count()).select_from(new_bookmark)
+        if not post_stats_aggregator.is_enabled:
+            stmt = stmt.add_cte(counted_bookmark)
+
+        try:
+            result = await self.async_session.execute(statement=stmt)
+        except IntegrityError:
+            await self.async_session.rollback()
             raise EntityDoesNotExist(f"Post with id {post_id} does not exist")
 
-        already_bookmarked = await self.async_session.execute(
-            sqlalchemy.select(Bookmark).where(
+        is_created = result.scalar_one() > 0
+        await self.async_session.commit()
+
+        if is_created and post_stats_aggregator.is_enabled:
+            post_stats_aggregator.record(post_id=post_id, bookmarks=1)
+        elif is_created:
+            post_cache.bump(post_id)
+        return is_created
+
+    async def delete_bookmark(self, account_id: int, post_id: int) -> str:
+        """
+        Idempotently removes a user's bookmark together with the `post_stats.bookmarks` decrement in one statement.
+        """
+        removed_bookmark = (
+            sqlalchemy.delete(Bookmark)
+            .where(
                 (Bookmark.account_id == account_id) &
                 (Bookmark.post_id == post_id)
             )
+            .returning(Bookmark.post_id)
+            .cte("removed_bookmark")
         )
-        if already_bookmarked.scalar_one_or_none():
-            raise EntityAlreadyExists(f"Post with id {post_id} already bookmarked by user with id {account_id}")
-
-        new_bookmark = Bookmark(
-            account_id=account_id,
-            post_id=post_id
+        counted_bookmark = (
+            sqlalchemy.update(PostStats)
+            .where(PostStats.post_id == removed_bookmark.c.post_id)
+            .values(bookmarks=PostStats.bookmarks - 1)
+            .cte("counted_bookmark")
         )
-        self.async_session.add(instance=new_bookmark)
-        await self.async_session.flush()
-
-        await self.increment_bookmarks(post_id)
-        await self.async_session.commit()
-        await self.async_session.refresh(instance=new_bookmark)
-        return new_bookmark
+        stmt = sqlalchemy.select(sqlalchemy.func.count()).select_from(removed_bookmark)
+        if not post_stats_aggregator.is_enabled:
+            stmt = stmt.add_cte(counted_bookmark)
 
-    async def delete_bookmark(self, account_id: int, post_id: int) -> str:
-        stmt = sqlalchemy.delete(Bookmark).where(
-            (Bookmark.account_id == account_id) & 
-            (Bookmark.post_id == post_id)
-        )
         result = await self.async_session.execute(statement=stmt)
+        is_removed = result.scalar_one() > 0
         await self.async_session.commit()
-        
-        if result.rowcount == 0:
-            raise EntityDoesNotExist("Bookmark does not exist")
 
-        await self.decrement_bookmarks(post_id)
-        await self.async_session.commit()
+        if is_removed and post_stats_aggregator.is_enabled:
+            post_stats_aggregator.record(post_id=post_id, bookmarks=-1)
+        elif is_removed:
+            post_cache.bump(post_id)
+
         return "Bookmark removed successfully"
 
     async def get_user_bookmarks(self, account_id: int, skip: int = 0, limit: int = 10) -> list[Post]:
@@ -82,6 +113,17 @@ class BookmarkCRUDRepository(BaseCRUDRepository):
         result = await self.async_session.execute(statement=stmt)
         return result.scalar() is not None
 
+    async def get_bookmarked_post_ids(self, account_id: int, post_ids: list[int]) -> set[int]:
+        if not post_ids:
+            return set()
+
+        stmt = sqlalchemy.select(Bookmark.post_id).where(
+            (Bookmark.account_id == account_id) &
+            (Bookmark.post_id.in_(post_ids))
+        )
+        result = await self.async_session.execute(statement=stmt)
+        return set(result.scalars().all())
+
     async def increment_bookmarks(self, post_id: int) -> None:
         stmt = (
             sqlalchemy.update(PostStats)
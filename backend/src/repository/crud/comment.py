@@ -1,10 +1,22 @@
+import datetime
+
+import sqlalchemy
 from sqlalchemy import select, func, update
+from sqlalchemy.orm import aliased
 from src.models.db.comment import Comment
 from src.models.db.account import Account
 from src.models.db.post_stats import PostStats
 from src.repository.crud.base import BaseCRUDRepository
 from src.models.schemas.comment import CommentCreate
 from src.utilities.exceptions.database import EntityDoesNotExist
+from src.utilities.formatters.comment_path_formatter import (
+    COMMENT_PATH_SEGMENT_LENGTH,
+    COMMENT_PATH_SEPARATOR,
+    COMMENT_PATH_SUBTREE_END,
+    format_comment_path,
+)
+from src.utilities.caches.post_cache import post_cache
+from src.utilities.services.post_stats_aggregator import post_stats_aggregator
 
 class CommentCRUDRepository(BaseCRUDRepository):
     async def create_comment(self, comment_create: CommentCreate, author_id: int) -> Comment:
@@ -15,16 +27,38 @@ class CommentCRUDRepository(BaseCRUDRepository):
             author_id=author_id,
             parent_id=parent_id
         )
+        parent_path = None
+        if parent_id:
+            parent_path = (await self.async_session.execute(select(Comment.path).where(Comment.id == parent_id))).scalar()
         self.async_session.add(comment)
-        await self.async_session.flush()  # Flush to get the new_like.id
+        await self.async_session.flush()  # Flush to get the comment.id
+        comment.path = format_comment_path(comment_id=comment.id, parent_path=parent_path)
 
-        # Increment the likes count in PostStats
-        await self.increment_comment_count(comment_create.post_id)
+        # Increment the comments count in PostStats, or leave it to the write-behind flush
+        if not post_stats_aggregator.is_enabled:
+            await self.increment_comment_count(comment_create.post_id)
         await self.async_session.commit()
         await self.async_session.refresh(comment)
+
+        if post_stats_aggregator.is_enabled:
+            post_stats_aggregator.record(post_id=comment_create.post_id, comments=1)
+        else:
+            post_cache.bump(comment_create.post_id)
         return comment
 
-    async def get_post_comments(self, post_id: int, skip: int = 0, limit: int = 10) -> list[tuple[Comment, str, str | None, int]]:
+    async def get_post_comments(
+        self,
+        post_id: int,
+        skip: int = 0,
+        limit: int = 10,
+        cursor: tuple[datetime.datetime, int] | None = None,
+    ) -> list[tuple[Comment, str, str | None, int]]:
+        """
+        Page the top-level comments of a post newest first, each with its number of direct replies.
+
+        With a `(created_at, id)` cursor the page is found with a seek predicate, so every page costs
+        the same however deep the reader has scrolled. Without one, `skip` falls back to OFFSET paging.
+        """
         stmt = (
             select(
                 Comment,
@@ -33,13 +67,133 @@ class CommentCRUDRepository(BaseCRUDRepository):
             )
             .join(Account, Comment.author_id == Account.id)
             .where(Comment.post_id == post_id, Comment.parent_id.is_(None))
-            .group_by(Comment.id, Account.username, Account.avatar)
-            .order_by(Comment.created_at.desc())
-            .offset(skip)
+            .order_by(Comment.created_at.desc(), Comment.id.desc())
             .limit(limit)
         )
+        if cursor:
+            stmt = stmt.where(sqlalchemy.tuple_(Comment.created_at, Comment.id) < sqlalchemy.tuple_(*cursor))
+        else:
+            stmt = stmt.offset(skip)
+
         result = await self.async_session.execute(stmt)
-        return list(result.all())
+        comments_data = result.all()
+        replies_counts = await self.count_replies(post_id, [comment.id for comment, _, _ in comments_data])
+        return [
+            (comment, username, avatar, replies_counts.get(comment.id, 0))
+            for comment, username, avatar in comments_data
+        ]
+
+    async def count_replies(self, post_id: int, comment_ids: list[int]) -> dict[int, int]:
+        """
+        Count the direct replies of every comment in `comment_ids` with one grouped query.
+        """
+        if not comment_ids:
+            return {}
+
+        stmt = (
+            select(Comment.parent_id, func.count())
+            .where(Comment.post_id == post_id, Comment.parent_id.in_(comment_ids))
+            .group_by(Comment.parent_id)
+        )
+        result = await self.async_session.execute(stmt)
+        return {parent_id: replies_count for parent_id, replies_count in result.all()}
+
+    async def get_comment_thread(
+        self,
+        post_id: int,
+        parent_id: int | None = None,
+        limit: int = 10,
+        replies_limit: int = 3,
+        max_depth: int = 2,
+        cursor: tuple[datetime.datetime, int] | None = None,
+    ) -> list[tuple[Comment, str, str | None, int, int]]:
+        """
+        Load a bounded comment subtree in one query over the materialized paths.
+
+        The roots are the `limit` newest top-level comments of the post, or the `limit` oldest replies of
+        `parent_id` when paging deeper into a thread, after `cursor` in either case. Their descendants down
+        to `max_depth` levels are one `(post_id, path)` index range per root, and of every comment at most
+        its `replies_limit` oldest replies are kept, so a reply whose parent was cut is dropped too.
+        Rows come back root by root, each subtree in materialized path order, so a parent always comes
+        before its replies, and carry their depth and their number of direct replies.
+        """
+        roots = select(Comment.id, Comment.path).where(Comment.post_id == post_id)
+        if parent_id is None:
+            root_order = (Comment.created_at.desc(), Comment.id.desc())
+            roots = roots.where(Comment.parent_id.is_(None))
+            if cursor:
+                roots = roots.where(sqlalchemy.tuple_(Comment.created_at, Comment.id) < sqlalchemy.tuple_(*cursor))
+        else:
+            root_order = (Comment.created_at.asc(), Comment.id.asc())
+            roots = roots.where(Comment.parent_id == parent_id)
+            if cursor:
+                roots = roots.where(sqlalchemy.tuple_(Comment.created_at, Comment.id) > sqlalchemy.tuple_(*cursor))
+        roots = (
+            roots.add_columns(func.row_number().over(order_by=root_order).label("root_rank"))
+            .order_by(*root_order)
+            .limit(limit)
+            .cte("roots")
+        )
+
+        descendant = aliased(Comment)
+        max_path_length = func.length(roots.c.path) + max_depth * COMMENT_PATH_SEGMENT_LENGTH
+        descendants = (
+            select(
+                descendant.id,
+                roots.c.root_rank,
+                sqlalchemy.cast(
+                    (func.length(descendant.path) - func.length(roots.c.path)) // COMMENT_PATH_SEGMENT_LENGTH,
+                    sqlalchemy.Integer,
+                ).label("depth"),
+                func.row_number()
+                .over(partition_by=descendant.parent_id, order_by=(descendant.created_at, descendant.id))
+                .label("sibling_rank"),
+            )
+            .select_from(roots)
+            .join(
+                descendant,
+                sqlalchemy.and_(
+                    descendant.post_id == post_id,
+                    descendant.path > roots.c.path + COMMENT_PATH_SEPARATOR,
+                    descendant.path < roots.c.path + COMMENT_PATH_SUBTREE_END,
+                    func.length(descendant.path) <= max_path_length,
+                ),
+            )
+            .subquery("descendants")
+        )
+        thread = sqlalchemy.union_all(
+            select(roots.c.id, roots.c.root_rank, sqlalchemy.literal_column("0", sqlalchemy.Integer).label("depth")),
+            select(descendants.c.id, descendants.c.root_rank, descendants.c.depth).where(
+                descendants.c.sibling_rank <= replies_limit
+            ),
+        ).subquery("thread")
+
+        stmt = (
+            select(
+                Comment,
+                Account.username.label('author_username'),
+                Account.avatar.label('author_avatar'),
+                thread.c.depth,
+            )
+            .join(thread, thread.c.id == Comment.id)
+            .join(Account, Comment.author_id == Account.id)
+            .order_by(thread.c.root_rank, Comment.path)
+        )
+        result = await self.async_session.execute(stmt)
+
+        # Parents come first, so one pass drops the replies below a comment that was cut
+        thread_data = list()
+        kept_ids: set[int] = set()
+        for comment, username, avatar, depth in result.all():
+            if depth == 0 or comment.parent_id in kept_ids:
+                kept_ids.add(comment.id)
+                thread_data.append((comment, username, avatar, depth))
+
+        replies_counts = await self.count_replies(post_id, [comment.id for comment, _, _, _ in thread_data])
+        return [
+            (comment, username, avatar, depth, replies_counts.get(comment.id, 0))
+            for comment, username, avatar, depth in thread_data
+        ]
 
     async def get_comment_replies(self, comment_id: int, skip: int = 0, limit: int = 10) -> list[tuple[Comment, str, str | None]]:
         stmt = (
@@ -83,10 +237,16 @@ class CommentCRUDRepository(BaseCRUDRepository):
         post_id = comment.post_id
         await self.async_session.delete(comment)
         await self.async_session.flush()
-        # Decrement the likes count in PostStats
-        await self.decrement_likes(post_id)
+        # Decrement the comments count in PostStats, or leave it to the write-behind flush
+        if not post_stats_aggregator.is_enabled:
+            await self.decrement_comment_count(post_id)
         await self.async_session.commit()
 
+        if post_stats_aggregator.is_enabled:
+            post_stats_aggregator.record(post_id=post_id, comments=-1)
+        else:
+            post_cache.bump(post_id)
+
     async def update_comment(self, comment_id: int, content: str) -> Comment:
         stmt = select(Comment).where(Comment.id == comment_id)
         result = await self.async_session.execute(stmt)
@@ -1,62 +1,89 @@
 
 import sqlalchemy
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 from src.models.db.like import Like
 from src.models.db.post import Post
 from src.models.db.poll import Poll
 from src.models.db.post_stats import PostStats
 from src.repository.crud.base import BaseCRUDRepository
+from src.utilities.caches.post_cache import post_cache
+from src.utilities.services.post_stats_aggregator import post_stats_aggregator
 from src.utilities.exceptions.database import EntityDoesNotExist, EntityAlreadyExists
 
 class LikeCRUDRepository(BaseCRUDRepository):
-    async def create_like(self, account_id: int, post_id: int) -> Like:
-        stmt = (
-            sqlalchemy.select(Post)
-            .where(Post.id == post_id)
+    async def create_like(self, account_id: int, post_id: int) -> bool:
+        """
+        Idempotently likes a post for a user and returns whether a new row was written.
+
+        The insert and the `post_stats.likes` increment run in one statement, and the unique
+        `(account_id, post_id)` constraint makes concurrent taps count only once.
+        """
+        new_like = (
+            insert(Like)
+            .values(account_id=account_id, post_id=post_id)
+            .on_conflict_do_nothing(constraint="unique_account_post_like")
+            .returning(Like.post_id)
+            .cte("new_like")
         )
-        result = await self.async_session.execute(stmt)
-        db_post = result.scalar_one_or_none()  # Use scalar_one_or_none() to handle the case where the post doesn't exist
-        if not db_post:
+        counted_like = (
+            sqlalchemy.update(PostStats)
+            .where(PostStats.post_id == new_like.c.post_id)
+            .values(likes=PostStats.likes + 1)
+            .cte("counted_like")
+        )
+        stmt = sqlalchemy.select(sqlalchemy.func.count()).select_from(new_like)
+        if not post_stats_aggregator.is_enabled:
+            stmt = stmt.add_cte(counted_like)
+
+        try:
+            result = await self.async_session.execute(statement=stmt)
+        except IntegrityError:
+            await self.async_session.rollback()
             raise EntityDoesNotExist(f"Post with id {post_id} does not exist")
 
-        already_liked = await self.async_session.execute(
-            sqlalchemy.select(Like).where(
+        is_created = result.scalar_one() > 0
+        await self.async_session.commit()
+
+        if is_created and post_stats_aggregator.is_enabled:
+            post_stats_aggregator.record(post_id=post_id, likes=1)
+        elif is_created:
+            post_cache.bump(post_id)
+        return is_created
+
+    async def delete_like(self, account_id: int, post_id: int) -> str:
+        """
+        Idempotently removes a user's like together with the `post_stats.likes` decrement in one statement.
+        """
+        removed_like = (
+            sqlalchemy.delete(Like)
+            .where(
                 (Like.account_id == account_id) &
                 (Like.post_id == post_id)
             )
+            .returning(Like.post_id)
+            .cte("removed_like")
         )
-        if already_liked.scalar_one_or_none():
-            raise EntityAlreadyExists(f"Post with id {post_id} already liked by user with id {account_id}")
-        
-        new_like = Like(
-            account_id=account_id,
-            post_id=post_id
+        counted_like = (
+            sqlalchemy.update(PostStats)
+            .where(PostStats.post_id == removed_like.c.post_id)
+            .values(likes=PostStats.likes - 1)
+            .cte("counted_like")
         )
-        self.async_session.add(instance=new_like)
-        await self.async_session.flush()  # Flush to get the new_like.id
-
-        # Increment the likes count in PostStats
-        await self.increment_likes(post_id)
-        await self.async_session.commit()
-        await self.async_session.refresh(instance=new_like)
-        return new_like
+        stmt = sqlalchemy.select(sqlalchemy.func.count()).select_from(removed_like)
+        if not post_stats_aggregator.is_enabled:
+            stmt = stmt.add_cte(counted_like)
 
-    async def delete_like(self, account_id: int, post_id: int) -> str:
-        stmt = sqlalchemy.delete(Like).where(
-            (Like.account_id == account_id) & 
-            (Like.post_id == post_id)
-        )
         result = await self.async_session.execute(statement=stmt)
+        is_removed = result.scalar_one() > 0
         await self.async_session.commit()
-        
-        if result.rowcount == 0:
-            raise EntityDoesNotExist("Like does not exist")
 
-        # Decrement the likes count in PostStats
-        await self.decrement_likes(post_id)
+        if is_removed and post_stats_aggregator.is_enabled:
+            post_stats_aggregator.record(post_id=post_id, likes=-1)
+        elif is_removed:
+            post_cache.bump(post_id)
 
-        await self.async_session.commit()
-        
         return "Like removed successfully"
 
     """async def get_user_likes(self, account_id: int) -> list[Post]:
@@ -104,6 +131,17 @@ class LikeCRUDRepository(BaseCRUDRepository):
         result = await self.async_session.execute(statement=stmt)
         return result.scalar() is not None
 
+    async def get_liked_post_ids(self, account_id: int, post_ids: list[int]) -> set[int]:
+        if not post_ids:
+            return set()
+
+        stmt = sqlalchemy.select(Like.post_id).where(
+            (Like.account_id == account_id) &
+            (Like.post_id.in_(post_ids))
+        )
+        result = await self.async_session.execute(statement=stmt)
+        return set(result.scalars().all())
+
     async def increment_likes(self, post_id: int) -> None:
         stmt = (
             sqlalchemy.update(PostStats)
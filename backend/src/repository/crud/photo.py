@@ -7,6 +7,7 @@ from sqlalchemy.exc import IntegrityError
 from src.models.db.photo import Photo
 from src.models.db.post import Post
 from src.repository.crud.base import BaseCRUDRepository
+from src.utilities.caches.post_cache import post_cache
 from src.utilities.exceptions.database import EntityDoesNotExist, EntityAlreadyExists, DatabaseError
 
 class PhotoCRUDRepository(BaseCRUDRepository):
@@ -25,6 +26,7 @@ class PhotoCRUDRepository(BaseCRUDRepository):
                 await self.async_session.rollback()
                 raise DatabaseError(f"Failed to create photo: {e}")
 
+        post_cache.bump(post_id)
         return db_photo
 
     async def read_photo(self, photo_id: int) -> Photo:
@@ -55,6 +57,7 @@ class PhotoCRUDRepository(BaseCRUDRepository):
                 await self.async_session.rollback()
                 raise DatabaseError(f"Failed to update photo: {e}")
 
+        post_cache.bump(db_photo.post_id)
         return db_photo
 
     async def delete_photo(self, photo_id: int) -> None:
@@ -63,4 +66,6 @@ class PhotoCRUDRepository(BaseCRUDRepository):
             if not db_photo:
                 raise EntityDoesNotExist(f"Photo with id {photo_id} does not exist")
 
-            await self.async_session.delete(db_photo)
\ No newline at end of file
+            await self.async_session.delete(db_photo)
+
+        post_cache.bump(db_photo.post_id)
\ No newline at end of file
@@ -15,6 +15,7 @@ from src.models.db.answer import Answer
 from src.models.db.post import Post
 from src.models.schemas.poll import PollInCreate, PollInResponse
 from src.repository.crud.base import BaseCRUDRepository
+from src.utilities.caches.post_cache import post_cache
 from src.utilities.exceptions.database import EntityAlreadyExists, EntityDoesNotExist, DatabaseError
 
 class PollCRUDRepository(BaseCRUDRepository):
@@ -61,6 +62,7 @@ class PollCRUDRepository(BaseCRUDRepository):
             await self.async_session.rollback()
             raise DatabaseError(f"Failed to create poll: {e}")
         
+        post_cache.bump(post_id)
         await self.async_session.refresh(db_poll)
         await self.async_session.refresh(db_post, attribute_names=["poll"])
 
@@ -98,7 +100,13 @@ class PollCRUDRepository(BaseCRUDRepository):
             db_answer = Answer(poll_id=poll_id, text=answer_data.text)
             self.async_session.add(db_answer)
 
-        await self.async_session.flush()        
+        try:
+            await self.async_session.commit()
+        except IntegrityError as e:
+            await self.async_session.rollback()
+            raise DatabaseError(f"Failed to update poll: {e}")
+
+        post_cache.bump(db_poll.post_id)
         await self.async_session.refresh(db_poll)
 
         return db_poll
@@ -108,4 +116,7 @@ class PollCRUDRepository(BaseCRUDRepository):
         if not db_poll:
             raise EntityDoesNotExist(f"Poll with id {poll_id} does not exist")
 
+        post_id = db_poll.post_id
         await self.async_session.delete(db_poll)
+        await self.async_session.commit()
+        post_cache.bump(post_id)
@@ -1,23 +1,50 @@
-from sqlalchemy import func, select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from src.models.db.answer import Answer
+from src.models.db.poll import Poll
 from src.models.db.poll_vote import PollVote
 from src.repository.crud.base import BaseCRUDRepository
+from src.utilities.caches.post_cache import post_cache
 from src.utilities.exceptions.database import EntityAlreadyExists
 
 class PollVoteCRUDRepository(BaseCRUDRepository):
     async def create_vote(self, poll_id: int, user_id: int, answer_index: int) -> PollVote:
-        existing_vote = await self.get_user_vote(poll_id, user_id)
-        if existing_vote:
+        # Insert the vote and bump the answer's tally in one statement, so the counter can never
+        # drift from `poll_votes` even under concurrent votes.
+        new_vote = (
+            insert(PollVote)
+            .values(poll_id=poll_id, user_id=user_id, answer_index=answer_index)
+            .on_conflict_do_nothing(constraint="unique_user_poll_vote")
+            .returning(PollVote.id, PollVote.poll_id, PollVote.answer_index)
+            .cte("new_vote")
+        )
+        voted_answer = (
+            update(Answer)
+            .where(Answer.poll_id == new_vote.c.poll_id, Answer.answer_index == new_vote.c.answer_index)
+            .values(vote_count=Answer.vote_count + 1)
+            .returning(Answer.id)
+            .cte("voted_answer")
+        )
+        stmt = (
+            select(new_vote.c.id, Poll.post_id)
+            .join(Poll, Poll.id == new_vote.c.poll_id)
+            .add_cte(voted_answer)
+        )
+        result = await self.async_session.execute(stmt)
+        voted = result.one_or_none()
+
+        if voted is None:
             raise EntityAlreadyExists(f"User with id {user_id} has already voted on poll with id {poll_id}")
 
-        vote = PollVote(
+        vote_id, post_id = voted
+        await self.async_session.commit()
+        post_cache.bump(post_id)
+        return PollVote(
+            id=vote_id,
             poll_id=poll_id,
             user_id=user_id,
             answer_index=answer_index
         )
-        #    raise EntityAlreadyExists(f"Post with id {post_id} already has a poll")
-        self.async_session.add(vote)
-        await self.async_session.commit()
-        return vote
 
     async def get_user_vote(self, poll_id: int, user_id: int) -> PollVote | None:
         stmt = select(PollVote).where(
@@ -33,9 +60,30 @@ class PollVoteCRUDRepository(BaseCRUDRepository):
         return result.scalars().all()
     
     async def get_poll_vote_count(self, poll_id: int, answer_index: int) -> int:
-        stmt = select(func.count()).where(
-            PollVote.poll_id == poll_id,
-            PollVote.answer_index == answer_index
+        stmt = select(Answer.vote_count).where(
+            Answer.poll_id == poll_id,
+            Answer.answer_index == answer_index
         )
         result = await self.async_session.execute(stmt)
-        return result.scalar_one_or_none() or 0
\ No newline at end of file
+        return result.scalar_one_or_none() or 0
+
+    async def get_user_votes(self, poll_ids: list[int], user_id: int) -> dict[int, int]:
+        """Returns the viewer's selected answer index for each of the given polls, keyed by poll id."""
+        if not poll_ids:
+            return {}
+
+        stmt = select(PollVote.poll_id, PollVote.answer_index).where(
+            PollVote.poll_id.in_(poll_ids),
+            PollVote.user_id == user_id
+        )
+        result = await self.async_session.execute(stmt)
+        return {poll_id: answer_index for poll_id, answer_index in result.all()}
+
+    async def get_poll_vote_counts(self, poll_ids: list[int]) -> dict[tuple[int, int], int]:
+        """Returns the vote tally of every answer of the given polls, keyed by `(poll_id, answer_index)`."""
+        if not poll_ids:
+            return {}
+
+        stmt = select(Answer.poll_id, Answer.answer_index, Answer.vote_count).where(Answer.poll_id.in_(poll_ids))
+        result = await self.async_session.execute(stmt)
+        return {(poll_id, answer_index): vote_count for poll_id, answer_index, vote_count in result.all()}
@@ -1,3 +1,4 @@
+import datetime
 import typing
 
 import sqlalchemy
@@ -13,66 +14,93 @@ from src.models.db.tag import Tag
 from src.models.db.post_stats import PostStats
 from src.models.schemas.post import PostInCreate, PostInResponse
 from src.repository.crud.base import BaseCRUDRepository
+from src.repository.crud.tag import TagCRUDRepository
+from src.utilities.caches.post_cache import post_cache
+from src.utilities.caches.search_cache import search_cache
+from src.utilities.caches.suggestion_index import suggestion_index
+from src.utilities.caches.tag_cache import tag_cache
 from src.utilities.exceptions.database import EntityDoesNotExist, EntityAlreadyExists, DatabaseError
 
+
+def _violated_table(e: IntegrityError) -> str | None:
+    # asyncpg reports the table whose row broke the constraint on the exception the DBAPI error wraps
+    return getattr(getattr(e.orig, "__cause__", None), "table_name", None)
+
+
 class PostCRUDRepository(BaseCRUDRepository):
     async def create_post(self, post_create: PostInCreate, account_id: int) -> Post:
-        db_account = await self.async_session.get(Account, account_id)
-        if not db_account:
-            raise EntityDoesNotExist(f"Account with id {account_id} does not exist")
+        # A tag id can come from the cache while another request deletes that tag, so the insert is retried
+        # once with freshly resolved ids before giving up
+        for is_retry in (False, True):
+            tag_ids = await TagCRUDRepository(async_session=self.async_session).resolve_tag_ids(post_create.tags)
+            try:
+                result = await self.async_session.execute(self._build_create_post_stmt(post_create, account_id, tag_ids))
+                break
+            except IntegrityError as e:
+                await self.async_session.rollback()
+                tag_cache.invalidate(tag_ids.keys())
+                violated_table = _violated_table(e)
+                if violated_table == Post.__tablename__:
+                    raise EntityDoesNotExist(f"Account with id {account_id} does not exist")
+                if violated_table != post_tags.name or is_retry:
+                    raise DatabaseError(f"Post of account {account_id} could not be created: {e.orig}")
+
+        post_id, created_at = result.one()
+        await self.async_session.commit()
+        search_cache.invalidate_matching(" ".join([post_create.content, *tag_ids.keys()]))
+        suggestion_index.increment_tags(tag_ids.keys())
 
-        # Create post
-        db_post = Post(
+        # Build the response object from what was written instead of refreshing every relationship
+        return Post(
+            id=post_id,
             content=post_create.content,
             account_id=account_id,
+            created_at=created_at,
+            stats=PostStats(post_id=post_id, comments=0, likes=0, bookmarks=0),
+            photos=[Photo(url=photo_url, post_id=post_id) for photo_url in post_create.photos],
+            tags=[Tag(id=tag_id, name=name) for name, tag_id in tag_ids.items()],
         )
-        self.async_session.add(db_post)
-        await self.async_session.flush()  # Flush to get db_post.id
 
-        # Create photos
-        photos = []
-        for photo_url in post_create.photos:
-            db_photo = Photo(url=photo_url, post_id=db_post.id)
-            self.async_session.add(db_photo)
-            photos.append(db_photo)
-        
-        # --- Handle Tags and Populate post_tags ---
-        for tag_name in post_create.tags:
-            # 1. Fetch or Create the Tag
-            db_tag = await self.async_session.execute(
-                sqlalchemy.select(Tag).where(Tag.name == tag_name)
+    def _build_create_post_stmt(
+        self, post_create: PostInCreate, account_id: int, tag_ids: dict[str, int]
+    ) -> sqlalchemy.Select:
+        # Insert the post together with its stats row, photos and tag links in a single statement
+        new_post = (
+            sqlalchemy.insert(Post)
+            .values(content=post_create.content, account_id=account_id, created_at=datetime.datetime.utcnow())
+            .returning(Post.id, Post.created_at)
+            .cte("new_post")
+        )
+        dependent_inserts = [
+            sqlalchemy.insert(PostStats)
+            .from_select(
+                ["post_id", "comments", "likes", "bookmarks"],
+                sqlalchemy.select(new_post.c.id, sqlalchemy.literal(0), sqlalchemy.literal(0), sqlalchemy.literal(0)),
             )
-            db_tag = db_tag.scalar_one_or_none()
-
-            if db_tag is None:
-                db_tag = Tag(name=tag_name)
-                self.async_session.add(db_tag)
-                await self.async_session.flush()  # Flush to get db_tag.id
+            .cte("new_post_stats")
+        ]
 
-            # 2. Create an entry in the post_tags table
-            #    Using the association table directly (post_tags.insert())
-            await self.async_session.execute(
-                post_tags.insert().values(post_id=db_post.id, tag_id=db_tag.id)
+        if post_create.photos:
+            photo_urls = sqlalchemy.values(sqlalchemy.column("url", sqlalchemy.String), name="photo_urls").data(
+                [(photo_url,) for photo_url in post_create.photos]
+            )
+            dependent_inserts.append(
+                sqlalchemy.insert(Photo)
+                .from_select(["url", "post_id"], sqlalchemy.select(photo_urls.c.url, new_post.c.id))
+                .cte("new_photos")
             )
-        # --- End of Tag Handling ---
-
-
-        # Create post stats
-        db_post_stats = PostStats(
-            post_id=db_post.id,
-            comments=0,
-            likes=0,
-            bookmarks=0
-        )
-        self.async_session.add(db_post_stats)
-
-        # Commit changes to the database
-        await self.async_session.commit()
 
-        # Refresh the post to load relationships
-        await self.async_session.refresh(db_post, attribute_names=["photos", "stats", "tags", "poll"])
+        if tag_ids:
+            post_tag_ids = sqlalchemy.values(sqlalchemy.column("tag_id", sqlalchemy.Integer), name="post_tag_ids").data(
+                [(tag_id,) for tag_id in tag_ids.values()]
+            )
+            dependent_inserts.append(
+                post_tags.insert()
+                .from_select(["post_id", "tag_id"], sqlalchemy.select(new_post.c.id, post_tag_ids.c.tag_id))
+                .cte("new_post_tags")
+            )
 
-        return db_post
+        return sqlalchemy.select(new_post.c.id, new_post.c.created_at).add_cte(*dependent_inserts)
 
     async def read_post(self, post_id: int) -> Post:
         await self.async_session.flush()
@@ -95,43 +123,37 @@ class PostCRUDRepository(BaseCRUDRepository):
         return db_post
 
 
-    async def read_posts(self, user_id:int, skip: int = 0, limit: int = 10, tag: int = None) -> typing.Sequence[Post]:
-        if tag:
-            stmt = (
-                sqlalchemy.select(Post)
-               .join(post_tags)
-               .join(Tag)
-               .where(Tag.id == tag)
-               .options(
-                    selectinload(Post.account),
-                    selectinload(Post.stats),
-                    selectinload(Post.photos),
-                    selectinload(Post.tags),
-                    selectinload(Post.poll).options(selectinload(Poll.answers))
-                )
-              .order_by(Post.created_at.desc())
-              .offset(skip)
-              .limit(limit)
-            )
-        else:
-            stmt = (
-                sqlalchemy.select(Post)
-                .options(
-                    selectinload(Post.account),  # Eagerly load the account relationship
-                    selectinload(Post.stats),    # Eagerly load the stats relationship
-                    selectinload(Post.photos),   # Eagerly load the photos relationship
-                    selectinload(Post.tags),
-                    selectinload(Post.poll).options(selectinload(Poll.answers))
-                )
-                .order_by(Post.created_at.desc())
-                .offset(skip)
-                .limit(limit)
+    async def read_posts(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 10,
+        tag: int = None,
+        cursor: tuple[datetime.datetime, int] | None = None,
+    ) -> typing.Sequence[Post]:
+        stmt = (
+            sqlalchemy.select(Post)
+            .options(
+                selectinload(Post.account),  # Eagerly load the account relationship
+                selectinload(Post.stats),    # Eagerly load the stats relationship
+                selectinload(Post.photos),   # Eagerly load the photos relationship
+                selectinload(Post.tags),
+                selectinload(Post.poll).options(selectinload(Poll.answers))
             )
+        )
+        if tag:
+            stmt = stmt.join(post_tags).where(post_tags.c.tag_id == tag)
         #stmt = stmt.where(Post.account_id != user_id)
-        result = await self.async_session.execute(stmt)
+        result = await self.async_session.execute(self._paginate(stmt, skip=skip, limit=limit, cursor=cursor))
         return result.scalars().all()
 
-    async def read_own_posts(self, user_id: int = None, skip: int = 0, limit: int = 10) -> typing.Sequence[Post]:
+    async def read_own_posts(
+        self,
+        user_id: int = None,
+        skip: int = 0,
+        limit: int = 10,
+        cursor: tuple[datetime.datetime, int] | None = None,
+    ) -> typing.Sequence[Post]:
         stmt = (
             sqlalchemy.select(Post)
             .options(
@@ -141,14 +163,27 @@ class PostCRUDRepository(BaseCRUDRepository):
                 selectinload(Post.tags),
                 selectinload(Post.poll).options(selectinload(Poll.answers))
             )
-            .order_by(Post.created_at.desc())
-            .offset(skip)
-            .limit(limit)
         )
         stmt = stmt.where(Post.account_id == user_id)
-        result = await self.async_session.execute(stmt)
+        result = await self.async_session.execute(self._paginate(stmt, skip=skip, limit=limit, cursor=cursor))
         return result.scalars().all()
 
+    def _paginate(
+        self, stmt: sqlalchemy.Select, skip: int, limit: int, cursor: tuple[datetime.datetime, int] | None
+    ) -> sqlalchemy.Select:
+        """
+        Orders a post query newest first and pages it.
+
+        With a `(created_at, id)` cursor the page is found with a seek predicate, so every page costs
+        the same however deep the reader has scrolled. Without one, `skip` falls back to OFFSET paging.
+        """
+        stmt = stmt.order_by(Post.created_at.desc(), Post.id.desc()).limit(limit)
+
+        if cursor:
+            return stmt.where(sqlalchemy.tuple_(Post.created_at, Post.id) < sqlalchemy.tuple_(*cursor))
+
+        return stmt.offset(skip)
+
     async def update_post(self, post_id: int, post_update: PostInCreate) -> Post:
         # Use select with selectinload for eager loading
         stmt = (
@@ -158,7 +193,8 @@ class PostCRUDRepository(BaseCRUDRepository):
                 selectinload(Post.account),
                 selectinload(Post.stats),
                 selectinload(Post.photos),
-                selectinload(Post.tags).options(selectinload(Poll.answers))
+                selectinload(Post.tags),
+                selectinload(Post.poll).options(selectinload(Poll.answers))
             )
         )
         result = await self.async_session.execute(stmt)
@@ -166,7 +202,8 @@ class PostCRUDRepository(BaseCRUDRepository):
         if not db_post:
             raise EntityDoesNotExist(f"Post with id {post_id} does not exist")
 
-        # Update post fields
+        # Update post fields, cached searches that matched the old text must go too
+        old_content = db_post.content
         db_post.content = post_update.content
 
         # Update photos (replace existing photos)
@@ -179,6 +216,8 @@ class PostCRUDRepository(BaseCRUDRepository):
             self.async_session.add(db_photo)
         
         await self.async_session.commit()
+        post_cache.bump(post_id)
+        search_cache.invalidate_matching(" ".join([old_content, post_update.content]))
         await self.async_session.refresh(db_post)
 
         return db_post
@@ -200,3 +239,5 @@ class PostCRUDRepository(BaseCRUDRepository):
 
         await self.async_session.delete(db_post)
         await self.async_session.commit()
+        post_cache.bump(post_id)
+        search_cache.invalidate_matching(db_post.content)
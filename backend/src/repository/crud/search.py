@@ -3,67 +3,135 @@ import sqlalchemy
 from sqlalchemy import or_
 from sqlalchemy.orm import selectinload
 from src.repository.crud.base import BaseCRUDRepository
-from src.models.db.tag import Tag
+from src.models.db.tag import Tag, post_tags
 from src.models.db.account import Account
 from src.models.db.poll import Poll
 from src.models.db.post import Post
 
+TURKISH_SEARCH_CONFIG = sqlalchemy.literal_column("'turkish'::regconfig")
+ENGLISH_SEARCH_CONFIG = sqlalchemy.literal_column("'english'::regconfig")
+POST_HEADLINE_OPTIONS = "MaxFragments=2, MaxWords=20, MinWords=5, StartSel=<mark>, StopSel=</mark>"
+
+def escape_like(value: str) -> str:
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+def fuzzy_match(
+    column: sqlalchemy.ColumnElement[str], query: str
+) -> tuple[sqlalchemy.ColumnElement[bool], sqlalchemy.ColumnElement[float]]:
+    """
+    Substring or typo-tolerant (pg_trgm `%` similarity) match of `column` against `query`, both served by
+    the column's GIN trigram index, together with the similarity to order the matches by.
+    """
+    match = or_(column.ilike(f"%{escape_like(query)}%", escape="/"), column.op("%")(query))
+    return match, sqlalchemy.func.similarity(column, query)
+
 class SearchCRUDRepository(BaseCRUDRepository):
-    async def search_all(self, query: str, skip, limit):
-        # Search in users
+    async def search_users(self, query: str, skip: int, limit: int) -> list[Account]:
+        # Fuzzy on the username through its trigram index
+        user_match, user_similarity = fuzzy_match(Account.username, query)
         user_stmt = (
             sqlalchemy.select(Account)
-            .where(
-                or_(
-                    Account.username.ilike(f"%{query}%"),
-                    Account.email.ilike(f"%{query}%")
-                )
-            )
+            .where(user_match)
+            .order_by(user_similarity.desc(), Account.username)
             .offset(skip)
             .limit(limit)
         )
+        users = await self.async_session.execute(user_stmt)
+        return list(users.scalars().all())
 
+    async def search_posts(self, query: str, skip: int, limit: int) -> tuple[list[Post], dict[int, str]]:
+        """
+        Ranked full-text matches together with a highlighted `ts_headline` snippet for each post.
+        """
+        # Full-text search over the generated `posts.search_vector`, parsed with both stemmers and served by its GIN index
+        search_query = sqlalchemy.select(
+            sqlalchemy.func.websearch_to_tsquery(TURKISH_SEARCH_CONFIG, query)
+            .op("||")(sqlalchemy.func.websearch_to_tsquery(ENGLISH_SEARCH_CONFIG, query))
+            .label("tsquery")
+        ).cte("search_query")
+        rank = sqlalchemy.func.ts_rank(Post.search_vector, search_query.c.tsquery)
+        headline = sqlalchemy.func.ts_headline(
+            TURKISH_SEARCH_CONFIG, Post.content, search_query.c.tsquery, POST_HEADLINE_OPTIONS
+        ).label("headline")
 
         post_stmt = (
-            sqlalchemy.select(Post)
-            .where(Post.content.ilike(f"%{query}%"))  # Example: case-insensitive like search on content
+            sqlalchemy.select(Post, headline)
+            .join(search_query, Post.search_vector.op("@@")(search_query.c.tsquery))
+            .order_by(rank.desc(), Post.id.desc())
+            .offset(skip)
+            .limit(limit)
             .options(
                 selectinload(Post.account),
                 selectinload(Post.stats),
                 selectinload(Post.photos),
-                selectinload(Post.tags)
+                selectinload(Post.tags),
+                selectinload(Post.poll).options(selectinload(Poll.answers))
             )
+        )
+        posts = (await self.async_session.execute(post_stmt)).all()
+        return [post for post, _ in posts], {post.id: post_headline for post, post_headline in posts}
+
+    async def search_tags(self, query: str, skip: int, limit: int) -> list[Tag]:
+        tag_match, tag_similarity = fuzzy_match(Tag.name, query)
+        tag_stmt = (
+            sqlalchemy.select(Tag)
+            .where(tag_match)
+            .order_by(tag_similarity.desc(), Tag.name)
             .offset(skip)
             .limit(limit)
         )
+        tags = await self.async_session.execute(tag_stmt)
+        return list(tags.scalars().all())
 
-        # Eagerly load relationships for users
-        user_stmt = user_stmt.options(
-            selectinload(Account.posts)
-        )
-        # Eagerly load relationships for posts
-        post_stmt = post_stmt.options(
-            selectinload(Post.account),
-            selectinload(Post.stats),
-            selectinload(Post.photos),
-            selectinload(Post.tags),
-            selectinload(Post.poll).options(selectinload(Poll.answers))
-        )
+    async def read_users_by_ids(self, ids: list[int]) -> list[Account]:
+        if not ids:
+            return list()
 
-        # Example: Searching for tags (replace with your actual tag search logic)
-        tag_stmt = sqlalchemy.select(Tag).where(Tag.name.ilike(f"%{query}%")).offset(skip).limit(limit)
+        users = await self.async_session.execute(sqlalchemy.select(Account).where(Account.id.in_(ids)))
+        users_by_id = {user.id: user for user in users.scalars().all()}
+        return [users_by_id[id] for id in ids if id in users_by_id]
 
-        users = await self.async_session.execute(user_stmt)
-        users = users.scalars().all()
+    async def read_posts_by_ids(self, ids: list[int]) -> list[Post]:
+        if not ids:
+            return list()
 
+        post_stmt = (
+            sqlalchemy.select(Post)
+            .where(Post.id.in_(ids))
+            .options(
+                selectinload(Post.account),
+                selectinload(Post.stats),
+                selectinload(Post.photos),
+                selectinload(Post.tags),
+                selectinload(Post.poll).options(selectinload(Poll.answers))
+            )
+        )
         posts = await self.async_session.execute(post_stmt)
-        posts = posts.scalars().all()
+        posts_by_id = {post.id: post for post in posts.scalars().all()}
+        return [posts_by_id[id] for id in ids if id in posts_by_id]
 
-        tags = await self.async_session.execute(tag_stmt)
-        tags = tags.scalars().all()
+    async def read_tags_by_ids(self, ids: list[int]) -> list[Tag]:
+        if not ids:
+            return list()
+
+        tags = await self.async_session.execute(sqlalchemy.select(Tag).where(Tag.id.in_(ids)))
+        tags_by_id = {tag.id: tag for tag in tags.scalars().all()}
+        return [tags_by_id[id] for id in ids if id in tags_by_id]
 
-        return {
-            "users": users,
-            "posts": posts,
-            "tags": tags  # Assuming Tag has a 'name' attribute
-        }
\ No newline at end of file
+    async def read_tag_popularity(self) -> list[tuple[str, int]]:
+        stmt = (
+            sqlalchemy.select(Tag.name, sqlalchemy.func.count(post_tags.c.post_id))
+            .outerjoin(post_tags, post_tags.c.tag_id == Tag.id)
+            .group_by(Tag.id)
+        )
+        result = await self.async_session.execute(stmt)
+        return [(name, popularity) for name, popularity in result.all()]
+
+    async def read_username_popularity(self) -> list[tuple[str, int]]:
+        stmt = (
+            sqlalchemy.select(Account.username, sqlalchemy.func.count(Post.id))
+            .outerjoin(Post, Post.account_id == Account.id)
+            .group_by(Account.id)
+        )
+        result = await self.async_session.execute(stmt)
+        return [(username, popularity) for username, popularity in result.all()]
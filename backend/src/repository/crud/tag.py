@@ -1,41 +1,104 @@
+import sqlalchemy
 from sqlalchemy import select
-from src.models.db.tag import Tag
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from src.models.db.tag import Tag, post_tags
 from src.repository.crud.base import BaseCRUDRepository
+from src.utilities.caches.post_cache import post_cache
+from src.utilities.caches.search_cache import search_cache
+from src.utilities.caches.suggestion_index import suggestion_index
+from src.utilities.caches.tag_cache import tag_cache
 from src.utilities.exceptions.database import EntityDoesNotExist, EntityAlreadyExists
 
 class TagCRUDRepository(BaseCRUDRepository):
     async def create_tag(self, name: str) -> Tag:
-        # Check if tag already exists
-        existing = await self.get_tag_by_name(name)
-        if existing:
-            return existing
-            
-        tag = Tag(name=name.lower())
-        self.async_session.add(tag)
+        tag_ids = await self.resolve_tag_ids([name.lower()])
         await self.async_session.commit()
-        return tag
+        search_cache.invalidate_matching(name)
+        suggestion_index.add_tag(name=name.lower())
+        return Tag(id=tag_ids[name.lower()], name=name.lower())
 
     async def get_tag_by_name(self, name: str) -> Tag | None:
+        tag_id = tag_cache.get_id(name.lower())
+        if tag_id is not None:
+            return Tag(id=tag_id, name=name.lower())
+
         stmt = select(Tag).where(Tag.name == name.lower())
         result = await self.async_session.execute(stmt)
-        return result.scalar_one_or_none()
+        tag = result.scalar_one_or_none()
+        if tag:
+            tag_cache.set(tag.name, tag.id)
+        return tag
+
+    async def resolve_tag_ids(self, names: list[str]) -> dict[str, int]:
+        """
+        Returns the id of every given tag name, creating the missing tags on the way.
+
+        Names are first looked up in the process-wide tag cache. The rest are inserted in one
+        `INSERT ... ON CONFLICT (name) DO NOTHING RETURNING` statement, and only the names that already
+        existed need a second lookup. New ids are cached right away, so a caller that rolls back
+        afterwards must invalidate the names it passed in.
+        """
+        unique_names = list(dict.fromkeys(names))
+        tag_ids, missing_names = tag_cache.get_ids(unique_names)
+        if not missing_names:
+            return tag_ids
+
+        insert_stmt = (
+            insert(Tag)
+            .values([{"name": name} for name in missing_names])
+            .on_conflict_do_nothing(index_elements=[Tag.name])
+            .returning(Tag.name, Tag.id)
+        )
+        result = await self.async_session.execute(insert_stmt)
+        tag_ids.update({name: id for name, id in result.all()})
+
+        existing_names = [name for name in missing_names if name not in tag_ids]
+        if existing_names:
+            select_stmt = select(Tag.name, Tag.id).where(Tag.name.in_(existing_names))
+            result = await self.async_session.execute(select_stmt)
+            tag_ids.update({name: id for name, id in result.all()})
+
+        for name in missing_names:
+            if name in tag_ids:
+                tag_cache.set(name, tag_ids[name])
+
+        return {name: tag_ids[name] for name in unique_names if name in tag_ids}
 
     async def get_all_tags(self) -> list[Tag]:
         stmt = select(Tag)
         result = await self.async_session.execute(stmt)
-        return list(result.scalars().all())
+        tags = list(result.scalars().all())
+        for tag in tags:
+            tag_cache.set(tag.name, tag.id)
+        return tags
 
     async def add_tags_to_post(self, post_id: int, tag_names: list[str]) -> list[Tag]:
-        tags = []
-        for name in tag_names:
-            tag = await self.create_tag(name)
-            tags.append(tag)
-        
-        # Get the post and add tags
-        post = await self.async_session.get(Post, post_id)
-        if not post:
+        tag_ids = await self.resolve_tag_ids([name.lower() for name in tag_names])
+        if not tag_ids:
+            return []
+
+        # Link every tag the post does not carry yet in a single statement
+        new_tag_ids = sqlalchemy.values(sqlalchemy.column("tag_id", sqlalchemy.Integer), name="new_tag_ids").data(
+            [(tag_id,) for tag_id in tag_ids.values()]
+        )
+        linked_tag_ids = select(post_tags.c.tag_id).where(post_tags.c.post_id == post_id)
+        stmt = post_tags.insert().from_select(
+            ["post_id", "tag_id"],
+            select(sqlalchemy.literal(post_id), new_tag_ids.c.tag_id).where(new_tag_ids.c.tag_id.not_in(linked_tag_ids)),
+        ).returning(post_tags.c.tag_id)
+
+        try:
+            result = await self.async_session.execute(stmt)
+            newly_linked_tag_ids = set(result.scalars().all())
+            await self.async_session.commit()
+        except IntegrityError:
+            await self.async_session.rollback()
+            tag_cache.invalidate(tag_ids.keys())
             raise EntityDoesNotExist(f"Post with id {post_id} not found")
-            
-        post.tags.extend(tags)
-        await self.async_session.commit()
-        return tags
\ No newline at end of file
+
+        if newly_linked_tag_ids:
+            post_cache.bump(post_id)
+        search_cache.invalidate_matching(" ".join(tag_ids.keys()))
+        suggestion_index.increment_tags(name for name, tag_id in tag_ids.items() if tag_id in newly_linked_tag_ids)
+        return [Tag(id=tag_id, name=name) for name, tag_id in tag_ids.items()]
@@ -1,3 +1,6 @@
+import time
+import typing
+
 import fastapi
 import loguru
 from sqlalchemy import event
@@ -6,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSessionTransaction
 from sqlalchemy.pool.base import _ConnectionRecord
 
 from src.repository.database import async_db
+from src.repository.query_counter import current_query_stats
 from src.repository.table import Base
 
 
@@ -25,6 +29,22 @@ def inspect_db_server_on_close(
     loguru.logger.info(f"Closed Connection Record ---\n {connection_record}")
 
 
+@event.listens_for(target=async_db.async_engine.sync_engine, identifier="before_cursor_execute")
+def start_query_timer(
+    connection: typing.Any, cursor: typing.Any, statement: str, parameters: typing.Any, context: typing.Any, executemany: bool
+) -> None:
+    context.query_started_at = time.perf_counter()
+
+
+@event.listens_for(target=async_db.async_engine.sync_engine, identifier="after_cursor_execute")
+def record_query(
+    connection: typing.Any, cursor: typing.Any, statement: str, parameters: typing.Any, context: typing.Any, executemany: bool
+) -> None:
+    query_stats = current_query_stats.get()
+    if query_stats is not None:
+        query_stats.record(statement=statement, duration=time.perf_counter() - context.query_started_at)
+
+
 async def initialize_db_tables(connection: AsyncConnection) -> None:
     loguru.logger.info("Database Table Creation --- Initializing . . .")
 
@@ -0,0 +1,36 @@
+"""add denormalized vote_count to answers
+
+Revision ID: 3f2a9c1d7b44
+Revises: 60d1844cb5d3
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f2a9c1d7b44"
+down_revision = "60d1844cb5d3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("answers", sa.Column("vote_count", sa.Integer(), server_default="0", nullable=False))
+    op.execute(
+        """
+        UPDATE answers
+        SET vote_count = tally.votes
+        FROM (
+            SELECT poll_id, answer_index, count(*) AS votes
+            FROM poll_votes
+            GROUP BY poll_id, answer_index
+        ) AS tally
+        WHERE answers.poll_id = tally.poll_id AND answers.answer_index = tally.answer_index
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("answers", "vote_count")
@@ -0,0 +1,48 @@
+"""add unique (account_id, post_id) constraints to likes and bookmarks
+
+Revision ID: 8b1e5d2f4a60
+Revises: 3f2a9c1d7b44
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8b1e5d2f4a60"
+down_revision = "3f2a9c1d7b44"
+branch_labels = None
+depends_on = None
+
+
+def _dedupe(table: str, counter: str) -> None:
+    # Keep the oldest row per (account_id, post_id) and take the removed duplicates off the post counter.
+    op.execute(
+        f"""
+        WITH removed AS (
+            DELETE FROM {table}
+            WHERE id NOT IN (
+                SELECT min(id) FROM {table} GROUP BY account_id, post_id
+            )
+            RETURNING post_id
+        ), removed_per_post AS (
+            SELECT post_id, count(*) AS removed_count FROM removed GROUP BY post_id
+        )
+        UPDATE post_stats
+        SET {counter} = greatest(post_stats.{counter} - removed_per_post.removed_count, 0)
+        FROM removed_per_post
+        WHERE post_stats.post_id = removed_per_post.post_id
+        """
+    )
+
+
+def upgrade() -> None:
+    _dedupe("likes", "likes")
+    _dedupe("bookmarks", "bookmarks")
+    op.create_unique_constraint("unique_account_post_like", "likes", ["account_id", "post_id"])
+    op.create_unique_constraint("unique_account_post_bookmark", "bookmarks", ["account_id", "post_id"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("unique_account_post_bookmark", "bookmarks", type_="unique")
+    op.drop_constraint("unique_account_post_like", "likes", type_="unique")
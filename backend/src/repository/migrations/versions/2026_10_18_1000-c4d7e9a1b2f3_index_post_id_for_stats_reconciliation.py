@@ -0,0 +1,29 @@
+"""index post_id on post_stats, likes, bookmarks and comment
+
+Revision ID: c4d7e9a1b2f3
+Revises: 8b1e5d2f4a60
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c4d7e9a1b2f3"
+down_revision = "8b1e5d2f4a60"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_post_stats_post_id", "post_stats", ["post_id"])
+    op.create_index("ix_likes_post_id", "likes", ["post_id"])
+    op.create_index("ix_bookmarks_post_id", "bookmarks", ["post_id"])
+    op.create_index("ix_comment_post_id", "comment", ["post_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_comment_post_id", table_name="comment")
+    op.drop_index("ix_bookmarks_post_id", table_name="bookmarks")
+    op.drop_index("ix_likes_post_id", table_name="likes")
+    op.drop_index("ix_post_stats_post_id", table_name="post_stats")
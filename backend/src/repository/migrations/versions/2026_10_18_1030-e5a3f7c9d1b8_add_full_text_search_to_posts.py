@@ -0,0 +1,39 @@
+"""add generated full-text search vector and GIN index to posts
+
+Revision ID: e5a3f7c9d1b8
+Revises: c4d7e9a1b2f3
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "e5a3f7c9d1b8"
+down_revision = "c4d7e9a1b2f3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "posts",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('turkish'::regconfig, coalesce(content, '')) || "
+                "to_tsvector('english'::regconfig, coalesce(content, ''))",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    op.create_index("ix_posts_search_vector", "posts", ["search_vector"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_posts_search_vector", table_name="posts")
+    op.drop_column("posts", "search_vector")
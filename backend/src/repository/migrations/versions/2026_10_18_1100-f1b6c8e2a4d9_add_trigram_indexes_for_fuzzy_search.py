@@ -0,0 +1,34 @@
+"""add pg_trgm GIN indexes on account.username and tags.name
+
+Revision ID: f1b6c8e2a4d9
+Revises: e5a3f7c9d1b8
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f1b6c8e2a4d9"
+down_revision = "e5a3f7c9d1b8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_account_username_trgm",
+        "account",
+        ["username"],
+        postgresql_using="gin",
+        postgresql_ops={"username": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_tags_name_trgm", "tags", ["name"], postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tags_name_trgm", table_name="tags")
+    op.drop_index("ix_account_username_trgm", table_name="account")
@@ -0,0 +1,24 @@
+"""add token_version to account for claims-based access tokens
+
+Revision ID: a7c2e4f6b8d0
+Revises: f1b6c8e2a4d9
+Create Date: 2026-10-18 11:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a7c2e4f6b8d0"
+down_revision = "f1b6c8e2a4d9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("account", sa.Column("token_version", sa.Integer(), server_default="0", nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column("account", "token_version")
@@ -0,0 +1,23 @@
+"""add (created_at, id) index for keyset paginated account listing
+
+Revision ID: d9e1f3a5b7c4
+Revises: b3d5f7a9c1e2
+Create Date: 2026-10-18 12:30:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d9e1f3a5b7c4"
+down_revision = "b3d5f7a9c1e2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_account_created_at_id", "account", ["created_at", "id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_account_created_at_id", table_name="account")
@@ -0,0 +1,40 @@
+"""add materialized path to comment for threaded loading
+
+Revision ID: e2f4a6c8d0b1
+Revises: d9e1f3a5b7c4
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e2f4a6c8d0b1"
+down_revision = "d9e1f3a5b7c4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("comment", sa.Column("path", sa.Text(collation="C"), nullable=True))
+    op.execute(
+        """
+        WITH RECURSIVE tree AS (
+            SELECT id, lpad(id::text, 10, '0') AS path
+            FROM comment
+            WHERE parent_id IS NULL
+            UNION ALL
+            SELECT comment.id, tree.path || '/' || lpad(comment.id::text, 10, '0')
+            FROM comment
+            JOIN tree ON comment.parent_id = tree.id
+        )
+        UPDATE comment SET path = tree.path COLLATE "C" FROM tree WHERE comment.id = tree.id
+        """
+    )
+    op.create_index("ix_comment_post_id_path", "comment", ["post_id", "path"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_comment_post_id_path", table_name="comment")
+    op.drop_column("comment", "path")
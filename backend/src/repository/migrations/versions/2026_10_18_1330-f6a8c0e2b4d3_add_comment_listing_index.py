@@ -0,0 +1,29 @@
+"""add (post_id, parent_id, created_at DESC, id DESC) index for comment listings
+
+Revision ID: f6a8c0e2b4d3
+Revises: e2f4a6c8d0b1
+Create Date: 2026-10-18 13:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f6a8c0e2b4d3"
+down_revision = "e2f4a6c8d0b1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_comment_post_id_parent_id_created_at",
+        "comment",
+        ["post_id", "parent_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_comment_post_id_parent_id_created_at", table_name="comment")
@@ -0,0 +1,44 @@
+"""add (created_at, id) and (account_id, created_at, id) indexes for keyset paginated post feeds
+
+Revision ID: a1c3e5f7b9d2
+Revises: f6a8c0e2b4d3
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a1c3e5f7b9d2"
+down_revision = "f6a8c0e2b4d3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction, and `posts` is too busy to lock for the build
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_posts_created_at_id",
+            "posts",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_posts_account_id_created_at_id",
+            "posts",
+            ["account_id", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_posts_account_id_created_at_id", table_name="posts", postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index("ix_posts_created_at_id", table_name="posts", postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,55 @@
+import collections
+import contextlib
+import contextvars
+import re
+import typing
+
+_PLACEHOLDER_PATTERN = re.compile(r"\$\d+|%\(\w+\)s|%s|\?")
+_PLACEHOLDER_LIST_PATTERN = re.compile(r"\?(?:\s*,\s*\?)+")
+_VALUES_ROWS_PATTERN = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Reduce a SQL statement to its shape, so the same query issued with different parameters or list
+    lengths is counted as one statement.
+    """
+    statement = _WHITESPACE_PATTERN.sub(" ", statement).strip()
+    statement = _PLACEHOLDER_PATTERN.sub("?", statement)
+    statement = _PLACEHOLDER_LIST_PATTERN.sub("?", statement)
+    return _VALUES_ROWS_PATTERN.sub("(?)", statement)
+
+
+class QueryStats:
+    """
+    SQL statements issued while a `count_queries()` block is active, usually one HTTP request.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.statements: collections.Counter[str] = collections.Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[normalize_statement(statement)] += 1
+
+    def repeated_statements(self, threshold: int) -> dict[str, int]:
+        return {statement: count for statement, count in self.statements.items() if count > threshold}
+
+
+current_query_stats: contextvars.ContextVar[QueryStats | None] = contextvars.ContextVar(
+    "current_query_stats", default=None
+)
+
+
+@contextlib.contextmanager
+def count_queries() -> typing.Iterator[QueryStats]:
+    query_stats = QueryStats()
+    token = current_query_stats.set(query_stats)
+    try:
+        yield query_stats
+    finally:
+        current_query_stats.reset(token)
@@ -5,7 +5,7 @@ from jose import jwt as jose_jwt, JWTError as JoseJWTError
 
 from src.config.manager import settings
 from src.models.db.account import Account
-from src.models.schemas.jwt import JWTAccount, JWTVerification, JWToken
+from src.models.schemas.jwt import JWTAccount, JWTPrincipal, JWTVerification, JWToken
 from src.utilities.exceptions.database import EntityDoesNotExist
 
 
@@ -35,8 +35,13 @@ class JWTGenerator:
         if not account:
             raise EntityDoesNotExist(f"Cannot generate JWT token for without Account entity!")
 
+        if settings.IS_JWT_CLAIMS_PRINCIPAL:
+            jwt_data = JWTPrincipal.from_account(account).dict()
+        else:
+            jwt_data = JWTAccount(username=account.username, email=account.email).dict()
+
         return self._generate_jwt_token(
-            jwt_data=JWTAccount(username=account.username, email=account.email).dict(),  # type: ignore
+            jwt_data=jwt_data,  # type: ignore
             expires_delta=datetime.timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRATION_TIME),
         )
 
@@ -1,18 +1,39 @@
+import statistics
+import time
+
+import loguru
 from passlib.context import CryptContext
+from passlib.hash import argon2 as argon2_hasher
 
 from src.config.manager import settings
 
+ARGON2_SCHEME = "argon2"
+CALIBRATION_SECRET = "unihelp-password-hash-calibration"
+CALIBRATION_SAMPLES = 3
+
 
 class HashGenerator:
     def __init__(self):
         self._hash_ctx_layer_1: CryptContext = CryptContext(
             schemes=[settings.HASHING_ALGORITHM_LAYER_1], deprecated="auto"
         )
-        self._hash_ctx_layer_2: CryptContext = CryptContext(
-            schemes=[settings.HASHING_ALGORITHM_LAYER_2], deprecated="auto"
+        self._hash_ctx_layer_2: CryptContext = self._build_layer_2_context(
+            time_cost=settings.PASSWORD_HASH_TIME_COST
         )
         self._hash_ctx_salt: str = settings.HASHING_SALT
 
+    def _build_layer_2_context(self, time_cost: int) -> CryptContext:
+        if settings.HASHING_ALGORITHM_LAYER_2 != ARGON2_SCHEME:
+            return CryptContext(schemes=[settings.HASHING_ALGORITHM_LAYER_2], deprecated="auto")
+
+        return CryptContext(
+            schemes=[ARGON2_SCHEME],
+            deprecated="auto",
+            argon2__rounds=time_cost,
+            argon2__memory_cost=settings.PASSWORD_HASH_MEMORY_COST_KIB,
+            argon2__parallelism=settings.PASSWORD_HASH_PARALLELISM,
+        )
+
     @property
     def _get_hashing_salt(self) -> str:
         return self._hash_ctx_salt
@@ -37,6 +58,58 @@ class HashGenerator:
         """
         return self._hash_ctx_layer_2.verify(secret=password, hash=hashed_password)
 
+    def is_password_hash_stale(self, hashed_password: str) -> bool:
+        """
+        A function that checks whether a stored hash is weaker than the configured parameters.
+
+        Argon2 hashes carry their own `m`, `t` and `p` parameters, so no extra column is needed. Only a lower
+        time or memory cost counts as stale, so nodes deployed with different costs during a rollout do not
+        keep rehashing each other's hashes on every login.
+        """
+        if settings.HASHING_ALGORITHM_LAYER_2 != ARGON2_SCHEME:
+            return self._hash_ctx_layer_2.needs_update(hash=hashed_password)
+        if not argon2_hasher.identify(hashed_password):
+            return True
+
+        parameters = argon2_hasher.from_string(hashed_password)
+        return (
+            parameters.rounds < settings.PASSWORD_HASH_TIME_COST
+            or parameters.memory_cost < settings.PASSWORD_HASH_MEMORY_COST_KIB
+        )
+
+    def _measure_verify_ms(self, ctx: CryptContext) -> float:
+        hashed_secret = ctx.hash(secret=CALIBRATION_SECRET)
+        durations = list()
+        for _ in range(CALIBRATION_SAMPLES):
+            started_at = time.perf_counter()
+            ctx.verify(secret=CALIBRATION_SECRET, hash=hashed_secret)
+            durations.append((time.perf_counter() - started_at) * 1000)
+        return statistics.median(durations)
+
+    def calibrate_password_hash_cost(self, target_verify_ms: int, max_time_cost: int) -> int:
+        """
+        A function that finds the lowest Argon2 time cost, up to `max_time_cost`, for which one verification
+        takes at least `target_verify_ms` on this machine, and returns it.
+
+        The result only depends on the hardware and load of the moment, so it is reported, never applied:
+        the cost in use always comes from `PASSWORD_HASH_TIME_COST`, one value for the whole deployment.
+        """
+        if settings.HASHING_ALGORITHM_LAYER_2 != ARGON2_SCHEME:
+            loguru.logger.warning("Password hash calibration skipped --- layer 2 algorithm is not argon2")
+            return settings.PASSWORD_HASH_TIME_COST
+
+        time_cost = 1
+        verify_ms = self._measure_verify_ms(ctx=self._build_layer_2_context(time_cost=time_cost))
+        while verify_ms < target_verify_ms and time_cost < max_time_cost:
+            time_cost += 1
+            verify_ms = self._measure_verify_ms(ctx=self._build_layer_2_context(time_cost=time_cost))
+
+        loguru.logger.info(
+            f"Password hash calibration --- argon2 time cost {time_cost} verifies in {verify_ms:.0f}ms"
+            f" (target {target_verify_ms}ms), PASSWORD_HASH_TIME_COST is {settings.PASSWORD_HASH_TIME_COST}"
+        )
+        return time_cost
+
 
 def get_hash_generator() -> HashGenerator:
     return HashGenerator()
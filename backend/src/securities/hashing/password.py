@@ -1,16 +1,19 @@
 from src.securities.hashing.hash import hash_generator
+from src.securities.hashing.pool import hashing_pool
 
 
 class PasswordGenerator:
-    @property
-    def generate_salt(self) -> str:
-        return hash_generator.generate_password_salt_hash
+    async def generate_salt(self) -> str:
+        return await hashing_pool.run(lambda: hash_generator.generate_password_salt_hash)
 
-    def generate_hashed_password(self, hash_salt: str, new_password: str) -> str:
-        return hash_generator.generate_password_hash(hash_salt=hash_salt, password=new_password)
+    async def generate_hashed_password(self, hash_salt: str, new_password: str) -> str:
+        return await hashing_pool.run(hash_generator.generate_password_hash, hash_salt, new_password)
 
-    def is_password_authenticated(self, hash_salt: str, password: str, hashed_password: str) -> bool:
-        return hash_generator.is_password_verified(password=hash_salt + password, hashed_password=hashed_password)
+    async def is_password_authenticated(self, hash_salt: str, password: str, hashed_password: str) -> bool:
+        return await hashing_pool.run(hash_generator.is_password_verified, hash_salt + password, hashed_password)
+
+    def is_password_hash_stale(self, hashed_password: str) -> bool:
+        return hash_generator.is_password_hash_stale(hashed_password=hashed_password)
 
 
 def get_pwd_generator() -> PasswordGenerator:
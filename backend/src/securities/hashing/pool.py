@@ -0,0 +1,82 @@
+import asyncio
+import concurrent.futures
+import typing
+
+from src.config.manager import settings
+from src.utilities.exceptions.password import HashingPoolSaturated
+
+T = typing.TypeVar("T")
+
+
+class HashingPool:
+    """
+    Bounded worker pool that keeps password hashing and verification off the event loop.
+
+    Argon2 and bcrypt spend their time inside C extensions that release the GIL, so a thread pool gives
+    real parallelism without the pickling and start-up cost of worker processes. At most `max_pending`
+    calls may be running or queued at once; any call beyond that is rejected with `HashingPoolSaturated`
+    right away instead of waiting, so a login burst turns into fast `503`s rather than a frozen API. A
+    call counts as pending until its job is done in the pool, not until its caller stops waiting.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._pending = 0
+        self._peak_pending = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="password-hashing"
+            )
+        return self._executor
+
+    async def run(self, fn: typing.Callable[..., T], *args: typing.Any) -> T:
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            raise HashingPoolSaturated(f"{self._pending} password hashing calls are already pending!")
+
+        loop = asyncio.get_running_loop()
+        job = self._get_executor().submit(fn, *args)
+        self._pending += 1
+        self._peak_pending = max(self._peak_pending, self._pending)
+
+        # A job still holds its slot after its caller went away, until it ran or was cancelled before starting
+        def release(_: concurrent.futures.Future) -> None:
+            loop.call_soon_threadsafe(self._release)
+
+        job.add_done_callback(release)
+        # Cancelling the awaiting request cancels the job too, which only succeeds if it has not started
+        return await asyncio.wrap_future(job, loop=loop)
+
+    def _release(self) -> None:
+        self._pending -= 1
+        self._completed += 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "workers": self.max_workers,
+            "pending": self._pending,
+            "queued": max(0, self._pending - self.max_workers),
+            "peak_pending": self._peak_pending,
+            "max_pending": self.max_pending,
+            "completed": self._completed,
+            "rejected": self._rejected,
+        }
+
+
+def get_hashing_pool() -> HashingPool:
+    return HashingPool(max_workers=settings.HASHING_POOL_WORKERS, max_pending=settings.HASHING_POOL_MAX_PENDING)
+
+
+hashing_pool: HashingPool = get_hashing_pool()
@@ -0,0 +1,127 @@
+class _TrieNode:
+    __slots__ = ("children", "scores", "top")
+
+    def __init__(self) -> None:
+        # First character of the edge label -> (edge label, child node)
+        self.children: dict[str, tuple[str, "_TrieNode"]] = dict()
+        # Values stored under the key that ends at this node, with their scores
+        self.scores: dict[str, int] = dict()
+        # Best (score, value) pairs of the whole subtree, highest score first
+        self.top: list[tuple[int, str]] = list()
+
+
+class CompressedTrie:
+    """
+    Radix trie mapping string keys to scored values, answering "best values under this prefix" lookups.
+
+    Every node keeps the `max_suggestions` best values of its subtree, so a lookup only walks the prefix
+    and never visits the subtree below it. Scores are expected to only grow, which keeps those per-node
+    lists exact on `add`/`increment`; `remove` rebuilds the lists along the removed key's path.
+    """
+
+    def __init__(self, max_suggestions: int):
+        self.max_suggestions = max_suggestions
+        self._root = _TrieNode()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _sort_key(self, entry: tuple[int, str]) -> tuple[int, str]:
+        return -entry[0], entry[1]
+
+    def _offer(self, node: _TrieNode, value: str, score: int) -> None:
+        node.top = [entry for entry in node.top if entry[1] != value]
+        node.top.append((score, value))
+        node.top.sort(key=self._sort_key)
+        del node.top[self.max_suggestions :]
+
+    def _path(self, key: str, is_creating: bool) -> list[_TrieNode] | None:
+        """
+        Nodes from the root down to the node where `key` ends, splitting edges and creating nodes on the
+        way if `is_creating`, otherwise `None` when the key is not in the trie.
+        """
+        node, path, rest = self._root, [self._root], key
+        while rest:
+            edge = node.children.get(rest[0])
+            if edge is None:
+                if not is_creating:
+                    return None
+                child = _TrieNode()
+                node.children[rest[0]] = (rest, child)
+                path.append(child)
+                return path
+
+            label, child = edge
+            common_length = 0
+            while common_length < min(len(label), len(rest)) and label[common_length] == rest[common_length]:
+                common_length += 1
+
+            if common_length < len(label):
+                if not is_creating:
+                    return None
+                # Split the edge, the new middle node covers exactly the subtree of the old child
+                middle = _TrieNode()
+                middle.top = list(child.top)
+                middle.children[label[common_length]] = (label[common_length:], child)
+                node.children[rest[0]] = (label[:common_length], middle)
+                child = middle
+
+            node, rest = child, rest[common_length:]
+            path.append(node)
+
+        return path
+
+    def add(self, key: str, value: str, score: int = 0) -> None:
+        path = self._path(key, is_creating=True)
+        terminal = path[-1]  # type: ignore
+        if value not in terminal.scores:
+            self._size += 1
+        score = max(score, terminal.scores.get(value, score))
+        terminal.scores[value] = score
+
+        for node in path:  # type: ignore
+            self._offer(node=node, value=value, score=score)
+
+    def score(self, key: str, value: str) -> int | None:
+        path = self._path(key, is_creating=False)
+        return path[-1].scores.get(value) if path else None
+
+    def increment(self, key: str, value: str, by: int = 1) -> None:
+        self.add(key=key, value=value, score=(self.score(key=key, value=value) or 0) + by)
+
+    def remove(self, key: str, value: str) -> None:
+        path = self._path(key, is_creating=False)
+        if not path or value not in path[-1].scores:
+            return
+
+        del path[-1].scores[value]
+        self._size -= 1
+
+        for node in reversed(path):
+            entries = [(score, stored_value) for stored_value, score in node.scores.items()]
+            for _, child in node.children.values():
+                entries.extend(child.top)
+            node.top = sorted(entries, key=self._sort_key)[: self.max_suggestions]
+
+    def suggest(self, prefix: str, limit: int) -> list[str]:
+        node, rest = self._root, prefix
+        while rest:
+            edge = node.children.get(rest[0])
+            if edge is None:
+                return list()
+
+            label, child = edge
+            if rest.startswith(label):
+                node, rest = child, rest[len(label) :]
+            elif label.startswith(rest):
+                node, rest = child, ""
+            else:
+                return list()
+
+        return [value for _, value in node.top[:limit]]
+
+    def clear(self) -> None:
+        self._root = _TrieNode()
+        self._size = 0
+
@@ -0,0 +1,75 @@
+import collections
+import time
+import typing
+
+KeyT = typing.TypeVar("KeyT")
+ValueT = typing.TypeVar("ValueT")
+
+
+class LRUCache(typing.Generic[KeyT, ValueT]):
+    """
+    A bounded, in-process least-recently-used cache that keeps hit, miss and eviction counters.
+
+    With `ttl_seconds` set, entries also expire that long after they were written; an expired entry is
+    dropped on lookup and counted as a miss and an eviction. It is meant to be used from the event loop
+    only, so no locking is done.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float | None = None):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: collections.OrderedDict[KeyT, tuple[float | None, ValueT]] = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: KeyT) -> bool:
+        return key in self._entries
+
+    def keys(self) -> list[KeyT]:
+        return list(self._entries)
+
+    def get(self, key: KeyT) -> ValueT | None:
+        if key not in self._entries:
+            self.misses += 1
+            return None
+
+        expires_at, value = self._entries[key]
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            self.evictions += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: KeyT, value: ValueT) -> None:
+        expires_at = None if self.ttl_seconds is None else time.monotonic() + self.ttl_seconds
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: KeyT) -> ValueT | None:
+        _, value = self._entries.pop(key, (None, None))
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,76 @@
+import collections
+import typing
+
+from src.config.manager import settings
+from src.models.schemas.post import PostInResponse
+from src.utilities.caches.lru_cache import LRUCache
+
+
+class PostCache:
+    """
+    Process-wide cache of the viewer-independent `GET /posts/{post_id}` response, keyed by post id and
+    the post's version.
+
+    Every write that changes what the response shows calls `bump`, which moves the post to a new version.
+    Readers take the version before loading the post and store the response under that version, so a
+    response built from rows read before a concurrent write lands under an outdated key and is never
+    served. Versions come from one process-wide clock; when the version table outgrows `max_versions`
+    the oldest entries are forgotten and every post without an entry falls back to the newest forgotten
+    version, which can only turn hits into misses.
+
+    All of this holds inside one process only. A `bump` does not reach the other workers, which keep
+    serving the old, or deleted, post until their entry expires, so `ttl_seconds` bounds how stale a
+    response can be across workers.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int, max_versions: int):
+        self._responses: LRUCache[tuple[int, int], PostInResponse] = LRUCache(
+            max_size=max_size, ttl_seconds=ttl_seconds
+        )
+        self.max_versions = max_versions
+        self._versions: collections.OrderedDict[int, int] = collections.OrderedDict()
+        self._clock = 0
+        self._forgotten_version = 0
+
+    def version(self, post_id: int) -> int:
+        return self._versions.get(post_id, self._forgotten_version)
+
+    def get(self, post_id: int) -> PostInResponse | None:
+        return self._responses.get((post_id, self.version(post_id)))
+
+    def set(self, post_id: int, version: int, response: PostInResponse) -> None:
+        if version == self.version(post_id):
+            self._responses.set((post_id, version), response)
+
+    def bump(self, post_id: int) -> None:
+        self._responses.invalidate((post_id, self.version(post_id)))
+
+        self._clock += 1
+        self._versions[post_id] = self._clock
+        self._versions.move_to_end(post_id)
+
+        while len(self._versions) > self.max_versions:
+            _, forgotten_version = self._versions.popitem(last=False)
+            self._forgotten_version = max(self._forgotten_version, forgotten_version)
+
+    def bump_many(self, post_ids: typing.Iterable[int]) -> None:
+        for post_id in post_ids:
+            self.bump(post_id)
+
+    def clear(self) -> None:
+        self._responses.clear()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return self._responses.stats
+
+
+def get_post_cache() -> PostCache:
+    return PostCache(
+        max_size=settings.POST_CACHE_MAX_SIZE,
+        ttl_seconds=settings.POST_CACHE_TTL_SECONDS,
+        max_versions=settings.POST_CACHE_MAX_VERSIONS,
+    )
+
+
+post_cache: PostCache = get_post_cache()
@@ -0,0 +1,83 @@
+from src.config.manager import settings
+from src.models.schemas.jwt import JWTPrincipal
+from src.utilities.caches.lru_cache import LRUCache
+
+
+class PrincipalCache:
+    """
+    Process-wide, short-lived cache of the principal behind an access token, so `get_current_user` does
+    not hit the database on every authenticated request.
+
+    Only plain `JWTPrincipal` values are cached, never `Account` rows, since those belong to the session
+    of the request that loaded them. Next to them it keeps the current `token_version` of recently seen
+    accounts, which claims-based tokens are checked against without a database read.
+
+    Entries live for `ttl_seconds` at most and are dropped right away through `invalidate_account`
+    whenever the account is updated, verified or deleted. A value read before an invalidation is not
+    stored after it: callers take the `epoch` before reading the account and `set` / `set_token_version`
+    ignore values read in an older epoch.
+
+    Invalidation only reaches the process that made the write. Every other worker keeps accepting the
+    old principal or `token_version` until its entry expires, so `ttl_seconds` is the revocation window
+    for deleted accounts, changed credentials and bumped token versions, and must stay a few seconds.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self._principals_by_token: LRUCache[str, JWTPrincipal] = LRUCache(
+            max_size=max_size, ttl_seconds=ttl_seconds
+        )
+        self._tokens_by_account_id: dict[int, set[str]] = dict()
+        self._token_versions: LRUCache[int, int] = LRUCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self._epoch = 0
+
+    @property
+    def epoch(self) -> int:
+        return self._epoch
+
+    def get(self, token: str) -> JWTPrincipal | None:
+        return self._principals_by_token.get(token)
+
+    def set(self, token: str, principal: JWTPrincipal, epoch: int) -> None:
+        if epoch != self._epoch:
+            return
+
+        self._principals_by_token.set(token, principal)
+
+        # Forget tokens that were evicted or expired meanwhile, so the reverse index stays bounded too
+        tokens = {
+            cached_token
+            for cached_token in self._tokens_by_account_id.get(principal.id, set())
+            if cached_token in self._principals_by_token
+        }
+        tokens.add(token)
+        self._tokens_by_account_id[principal.id] = tokens
+
+    def get_token_version(self, account_id: int) -> int | None:
+        return self._token_versions.get(account_id)
+
+    def set_token_version(self, account_id: int, token_version: int, epoch: int) -> None:
+        if epoch == self._epoch:
+            self._token_versions.set(account_id, token_version)
+
+    def invalidate_account(self, account_id: int) -> None:
+        self._epoch += 1
+        self._token_versions.invalidate(account_id)
+        for token in self._tokens_by_account_id.pop(account_id, set()):
+            self._principals_by_token.invalidate(token)
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self._principals_by_token.clear()
+        self._tokens_by_account_id.clear()
+        self._token_versions.clear()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return self._principals_by_token.stats
+
+
+def get_principal_cache() -> PrincipalCache:
+    return PrincipalCache(max_size=settings.PRINCIPAL_CACHE_MAX_SIZE, ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+principal_cache: PrincipalCache = get_principal_cache()
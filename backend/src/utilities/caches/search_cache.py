@@ -0,0 +1,100 @@
+import typing
+
+from src.config.manager import settings
+from src.utilities.caches.lru_cache import LRUCache
+from src.utilities.formatters.search_formatter import (
+    format_search_query,
+    format_search_terms,
+    format_search_trigrams,
+)
+
+# Terms sharing this many leading characters are treated as related, which roughly covers the stemmed
+# suffixes of the full-text post facet such as `notlar` / `notları`.
+RELATED_TERM_PREFIX_LENGTH = 4
+# `pg_trgm.similarity_threshold` behind the `%` operator of the fuzzy tag and user facets
+TRIGRAM_SIMILARITY_THRESHOLD = 0.3
+
+
+def _trigram_similarity(trigrams: set[str], other_trigrams: set[str]) -> float:
+    if not trigrams or not other_trigrams:
+        return 0.0
+    return len(trigrams & other_trigrams) / len(trigrams | other_trigrams)
+
+
+class SearchCacheEntry(typing.NamedTuple):
+    user_ids: list[int]
+    post_ids: list[int]
+    post_headlines: dict[int, str]
+    tag_ids: list[int]
+
+
+class SearchCache:
+    """
+    Process-wide TTL cache of `GET /search` results keyed by the formatted query, skip and limit.
+
+    Only the ids of each facet (and the viewer-independent post headlines) are kept, so likes, bookmarks
+    and poll votes are still hydrated fresh for every viewer. Besides the TTL, an entry is dropped early
+    as soon as newly written text could match its query the way one of the facets does: a word sharing
+    a stem-like prefix with a query term for the full-text post facet, or, for the fuzzy tag and user
+    facets, text containing the query or a word trigram-similar to it.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self._entries: LRUCache[tuple[str, int, int], SearchCacheEntry] = LRUCache(
+            max_size=max_size, ttl_seconds=ttl_seconds
+        )
+
+    def get(self, query: str, skip: int, limit: int) -> SearchCacheEntry | None:
+        return self._entries.get((query, skip, limit))
+
+    def set(self, query: str, skip: int, limit: int, entry: SearchCacheEntry) -> None:
+        self._entries.set((query, skip, limit), entry)
+
+    def invalidate_matching(self, text: str) -> int:
+        """
+        Drop every entry whose results could change because of newly written `text` and return how many.
+        """
+        written_text = format_search_query(text)
+        written_terms = format_search_terms(written_text)
+        if not written_terms:
+            return 0
+
+        written_prefixes = {term[:RELATED_TERM_PREFIX_LENGTH] for term in written_terms}
+        written_trigrams = [format_search_trigrams(term) for term in dict.fromkeys(written_terms)]
+
+        def is_affected(query: str) -> bool:
+            if query in written_text:
+                return True
+            if any(
+                prefix.startswith(term[:RELATED_TERM_PREFIX_LENGTH])
+                for term in format_search_terms(query)
+                for prefix in written_prefixes
+            ):
+                return True
+            query_trigrams = format_search_trigrams(query)
+            return any(
+                _trigram_similarity(query_trigrams, term_trigrams) >= TRIGRAM_SIMILARITY_THRESHOLD
+                for term_trigrams in written_trigrams
+            )
+
+        invalidated_count = 0
+        for key in self._entries.keys():
+            if is_affected(key[0]):
+                self._entries.invalidate(key)
+                invalidated_count += 1
+
+        return invalidated_count
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return self._entries.stats
+
+
+def get_search_cache() -> SearchCache:
+    return SearchCache(max_size=settings.SEARCH_CACHE_MAX_SIZE, ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS)
+
+
+search_cache: SearchCache = get_search_cache()
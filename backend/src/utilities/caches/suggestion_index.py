@@ -0,0 +1,71 @@
+import typing
+
+import loguru
+
+from src.config.manager import settings
+from src.utilities.caches.compressed_trie import CompressedTrie
+from src.utilities.formatters.search_formatter import format_search_query
+
+
+class SuggestionIndex:
+    """
+    Process-wide typeahead index of tag names and usernames, ranked by how many posts use the tag or
+    were written by the account.
+
+    It is filled once at startup and then kept current by the repositories that create, rename or delete
+    tags and accounts, so suggestions never touch the database.
+    """
+
+    def __init__(self, max_suggestions: int):
+        self.max_suggestions = max_suggestions
+        self._tags = CompressedTrie(max_suggestions=max_suggestions)
+        self._usernames = CompressedTrie(max_suggestions=max_suggestions)
+
+    def load(self, tag_popularity: typing.Iterable[tuple[str, int]], username_popularity: typing.Iterable[tuple[str, int]]) -> None:
+        self._tags.clear()
+        self._usernames.clear()
+
+        for name, popularity in tag_popularity:
+            self.add_tag(name=name, popularity=popularity)
+        for username, popularity in username_popularity:
+            self.add_username(username=username, popularity=popularity)
+
+        loguru.logger.info(
+            f"Suggestion Index --- Loaded {len(self._tags)} tags and {len(self._usernames)} usernames"
+        )
+
+    def add_tag(self, name: str, popularity: int = 0) -> None:
+        self._tags.add(key=format_search_query(name), value=name, score=popularity)
+
+    def increment_tags(self, names: typing.Iterable[str]) -> None:
+        for name in names:
+            self._tags.increment(key=format_search_query(name), value=name)
+
+    def add_username(self, username: str, popularity: int = 0) -> None:
+        self._usernames.add(key=format_search_query(username), value=username, score=popularity)
+
+    def increment_username(self, username: str) -> None:
+        self._usernames.increment(key=format_search_query(username), value=username)
+
+    def rename_username(self, old_username: str, new_username: str) -> None:
+        popularity = self._usernames.score(key=format_search_query(old_username), value=old_username) or 0
+        self.remove_username(username=old_username)
+        self.add_username(username=new_username, popularity=popularity)
+
+    def remove_username(self, username: str) -> None:
+        self._usernames.remove(key=format_search_query(username), value=username)
+
+    def suggest(self, prefix: str, limit: int) -> dict[str, list[str]]:
+        prefix = format_search_query(prefix)
+        limit = min(limit, self.max_suggestions)
+        return {
+            "tags": self._tags.suggest(prefix=prefix, limit=limit),
+            "users": self._usernames.suggest(prefix=prefix, limit=limit),
+        }
+
+
+def get_suggestion_index() -> SuggestionIndex:
+    return SuggestionIndex(max_suggestions=settings.SUGGESTION_INDEX_MAX_SUGGESTIONS)
+
+
+suggestion_index: SuggestionIndex = get_suggestion_index()
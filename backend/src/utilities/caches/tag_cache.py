@@ -0,0 +1,57 @@
+import typing
+
+from src.config.manager import settings
+from src.utilities.caches.lru_cache import LRUCache
+
+
+class TagCache:
+    """
+    Process-wide `Tag` name -> id cache shared by the post and tag repositories.
+
+    The tag vocabulary is small and rows are never renamed, so entries are filled lazily from the
+    database, added as soon as a tag is inserted and only dropped on eviction or explicit invalidation.
+    Names are not cached by id, since posts load their tag names in the same round trip as the post.
+    """
+
+    def __init__(self, max_size: int):
+        self._ids_by_name: LRUCache[str, int] = LRUCache(max_size=max_size)
+
+    def get_id(self, name: str) -> int | None:
+        return self._ids_by_name.get(name)
+
+    def get_ids(self, names: typing.Iterable[str]) -> tuple[dict[str, int], list[str]]:
+        """
+        Split the given names into the cached `name -> id` entries and the names that still need a lookup.
+        """
+        cached_ids: dict[str, int] = dict()
+        missing_names: list[str] = list()
+
+        for name in names:
+            tag_id = self.get_id(name)
+            if tag_id is None:
+                missing_names.append(name)
+            else:
+                cached_ids[name] = tag_id
+
+        return cached_ids, missing_names
+
+    def set(self, name: str, id: int) -> None:
+        self._ids_by_name.set(name, id)
+
+    def invalidate(self, names: typing.Iterable[str]) -> None:
+        for name in names:
+            self._ids_by_name.invalidate(name)
+
+    def clear(self) -> None:
+        self._ids_by_name.clear()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return self._ids_by_name.stats
+
+
+def get_tag_cache() -> TagCache:
+    return TagCache(max_size=settings.TAG_CACHE_MAX_SIZE)
+
+
+tag_cache: TagCache = get_tag_cache()
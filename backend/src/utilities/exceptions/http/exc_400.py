@@ -12,7 +12,8 @@ from src.utilities.messages.exceptions.http.exc_details import (
     http_400_sigin_credentials_details,
     http_400_signup_credentials_details,
     http_400_username_details,
-    http_400_already_verified
+    http_400_already_verified,
+    http_400_invalid_cursor_details,
 )
 
 
@@ -53,4 +54,10 @@ async def http_400_exc_bad_verification_code() -> Exception:
     return fastapi.HTTPException(
         status_code=fastapi.status.HTTP_400_BAD_REQUEST,
         detail=http_400_invalid_verification_code()
-    )
\ No newline at end of file
+    )
+
+async def http_400_exc_bad_cursor_request(cursor: str) -> Exception:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+        detail=http_400_invalid_cursor_details(cursor=cursor),
+    )
@@ -4,7 +4,8 @@ import fastapi
 
 from src.utilities.messages.exceptions.http.exc_details import (
     http_409_post_poll_conflict,
-    http_409_poll_already_voted
+    http_409_poll_already_voted,
+    http_409_post_create_conflict,
 )
 
 async def http_409_exc_post_already_has_poll_request(*, post_id: int) -> Exception:
@@ -17,4 +18,10 @@ async def http_409_exc_poll_already_voted(*, poll_id: int) -> Exception:
     return fastapi.HTTPException(
         status_code=fastapi.status.HTTP_409_CONFLICT,
         detail=http_409_poll_already_voted(poll_id=poll_id)
-    )
\ No newline at end of file
+    )
+
+async def http_409_exc_post_create_conflict_request() -> Exception:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_409_CONFLICT,
+        detail=http_409_post_create_conflict(),
+    )
@@ -0,0 +1,17 @@
+"""
+The HTTP 503 Service Unavailable response status code indicates that the server is temporarily unable to handle the request.
+"""
+
+import fastapi
+
+from src.utilities.messages.exceptions.http.exc_details import http_503_hashing_pool_saturated_details
+
+RETRY_AFTER_SECONDS = 1
+
+
+async def http_503_exc_hashing_pool_saturated_request() -> Exception:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=http_503_hashing_pool_saturated_details(),
+        headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+    )
@@ -2,3 +2,9 @@ class PasswordDoesNotMatch(Exception):
     """
     Throw an exception when the account password does not match the entitiy's hashed password from the database.
     """
+
+
+class HashingPoolSaturated(Exception):
+    """
+    Throw an exception when too many password hashing calls are already pending in the hashing pool.
+    """
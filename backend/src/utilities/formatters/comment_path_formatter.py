@@ -0,0 +1,15 @@
+COMMENT_PATH_SEPARATOR = "/"
+# Wide enough for any positive int4 id, so sorting paths as strings sorts sibling ids numerically
+COMMENT_PATH_ID_WIDTH = 10
+# Every level below a comment adds one separator and one id to the path
+COMMENT_PATH_SEGMENT_LENGTH = COMMENT_PATH_ID_WIDTH + len(COMMENT_PATH_SEPARATOR)
+# The character right after the separator, so `[path + "/", path + "0")` is exactly the subtree of `path`
+COMMENT_PATH_SUBTREE_END = chr(ord(COMMENT_PATH_SEPARATOR) + 1)
+
+
+def format_comment_path(comment_id: int, parent_path: str | None = None) -> str:
+    """
+    Build the materialized path of a comment from its id and the path of its parent, if it is a reply.
+    """
+    segment = str(comment_id).zfill(COMMENT_PATH_ID_WIDTH)
+    return f"{parent_path}{COMMENT_PATH_SEPARATOR}{segment}" if parent_path else segment
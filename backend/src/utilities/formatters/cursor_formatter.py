@@ -0,0 +1,35 @@
+import base64
+import datetime
+import json
+
+
+def format_keyset_into_cursor(created_at: datetime.datetime, id: int) -> str:
+    """
+    Encode the `(created_at, id)` position of the last row of a page into an opaque cursor.
+    """
+    payload = json.dumps([created_at.isoformat(), id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def format_cursor_into_keyset(cursor: str, is_timezone_aware: bool = False) -> tuple[datetime.datetime, int]:
+    """
+    Decode a cursor created by `format_keyset_into_cursor` back into its `(created_at, id)` position.
+
+    Cursors are opaque but can be made by hand, so the timestamp is normalized to the kind of column it is
+    compared against: naive UTC by default, aware UTC when `is_timezone_aware` is set. A naive timestamp
+    column cannot be compared with an aware value, so without this a hand-made cursor fails in the driver.
+    """
+    try:
+        padded_cursor = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded_cursor.encode()))
+        created_at = datetime.datetime.fromisoformat(created_at)
+        id = int(id)
+
+    except (ValueError, TypeError) as cursor_decode_error:
+        raise ValueError(f"Invalid pagination cursor `{cursor}`") from cursor_decode_error
+
+    if created_at.tzinfo is None:
+        return (created_at.replace(tzinfo=datetime.timezone.utc) if is_timezone_aware else created_at), id
+
+    created_at = created_at.astimezone(datetime.timezone.utc)
+    return (created_at if is_timezone_aware else created_at.replace(tzinfo=None)), id
@@ -0,0 +1,36 @@
+import re
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_TERM_PATTERN = re.compile(r"\w+")
+# The only `websearch_to_tsquery` operator spelled as a word, it must stay uppercase to be one
+_OR_OPERATOR = "OR"
+
+
+def _fold_case(text: str) -> str:
+    return text.replace("I", "ı").replace("İ", "i").lower()
+
+
+def format_search_query(query: str) -> str:
+    """
+    Trim, collapse whitespace and case fold a search query the Turkish way, so `İSTANBUL`, `istanbul`
+    and ` İstanbul ` all become `istanbul`, and `IĞDIR` becomes `ığdır` instead of `iğdir`. A standalone
+    `OR` is kept as is, since `websearch_to_tsquery` reads it as an operator.
+    """
+    words = _WHITESPACE_PATTERN.split(query.strip())
+    return " ".join(word if word == _OR_OPERATOR else _fold_case(word) for word in words if word)
+
+
+def format_search_terms(text: str) -> list[str]:
+    return [term for term in _TERM_PATTERN.findall(format_search_query(text)) if term != _OR_OPERATOR]
+
+
+def format_search_trigrams(text: str) -> set[str]:
+    """
+    The trigrams `pg_trgm` extracts from `text`: every word is padded with two spaces in front and one
+    behind, and cut into its three character windows.
+    """
+    trigrams: set[str] = set()
+    for term in format_search_terms(text):
+        padded_term = f"  {term} "
+        trigrams.update(padded_term[index : index + 3] for index in range(len(padded_term) - 2))
+    return trigrams
@@ -19,6 +19,9 @@ def http_400_already_verified() -> str:
 def http_400_invalid_verification_code() -> str:
     return f"Invalid verification code"
 
+def http_400_invalid_cursor_details(*, cursor: str) -> str:
+    return f"The pagination cursor `{cursor}` is invalid!"
+
 
 def http_401_unauthorized_details() -> str:
     return "Refused to complete request due to lack of valid authentication!"
@@ -56,3 +59,9 @@ def http_409_post_poll_conflict(*, post_id: int) -> str:
 
 def http_409_poll_already_voted(*, poll_id: int) -> str:
     return f"You have already voted on the poll with id `{poll_id}`!"
+
+def http_409_post_create_conflict() -> str:
+    return "The post could not be created because its tags changed meanwhile! Please try again."
+
+def http_503_hashing_pool_saturated_details() -> str:
+    return "Too many sign-in requests right now! Please try again in a moment."
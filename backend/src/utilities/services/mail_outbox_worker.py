@@ -0,0 +1,180 @@
+import asyncio
+import datetime
+import smtplib
+import typing
+
+import loguru
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+from src.config.manager import settings
+from src.models.db.mail_outbox import MailOutbox
+from src.repository.database import async_db
+from src.utilities.services.mail_service import MailService, mail_service
+
+MAX_RETRY_DELAY_SECONDS = 3600
+# Errors after which the SMTP session cannot be trusted anymore and is reopened
+SESSION_ERRORS: tuple[type[Exception], ...] = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+class MailOutboxWorker:
+    """
+    Background job that delivers the rows of the `mail_outbox` table.
+
+    Requests only insert outbox rows inside their own transaction, this worker sends them in batches of
+    `batch_size` over one SMTP session that stays open between batches and is reopened once when the
+    server dropped it. Rows are claimed with `FOR UPDATE SKIP LOCKED`, so several app workers can drain
+    the same outbox. A failed mail is retried with exponential backoff starting at `backoff_seconds`
+    until it used up `max_attempts`.
+    """
+
+    def __init__(
+        self,
+        session_factory: typing.Callable[[], SQLAlchemyAsyncSession],
+        mail_service: MailService,
+        batch_size: int,
+        poll_interval_seconds: int,
+        max_attempts: int,
+        backoff_seconds: int,
+    ):
+        self.session_factory = session_factory
+        self.mail_service = mail_service
+        self.batch_size = batch_size
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+
+        self._smtp: smtplib.SMTP | None = None
+        self._wake_requested = asyncio.Event()
+        self._is_running = False
+        self._worker: asyncio.Task | None = None
+
+    def notify(self) -> None:
+        self._wake_requested.set()
+
+    def retry_delay(self, attempts: int) -> datetime.timedelta:
+        return datetime.timedelta(seconds=min(self.backoff_seconds * 2 ** (attempts - 1), MAX_RETRY_DELAY_SECONDS))
+
+    async def _close_session(self) -> None:
+        smtp, self._smtp = self._smtp, None
+        if smtp is not None:
+            try:
+                await asyncio.to_thread(smtp.quit)
+            except Exception:
+                smtp.close()
+
+    async def _send(self, mail: MailOutbox) -> None:
+        for is_reconnected in (False, True):
+            if self._smtp is None:
+                self._smtp = await asyncio.to_thread(self.mail_service.connect)
+            try:
+                await asyncio.to_thread(self.mail_service.send, self._smtp, mail.recipient, mail.subject, mail.body)
+                return
+            except SESSION_ERRORS:
+                await self._close_session()
+                if is_reconnected:
+                    raise
+
+    async def deliver(self, mails: typing.Sequence[MailOutbox]) -> tuple[list[int], dict[int, Exception]]:
+        """
+        Send `mails` in order and return the ids that were sent and the errors of those that failed.
+
+        Once no SMTP session can be opened, the remaining mails are left alone for the next batch.
+        """
+        sent_ids: list[int] = list()
+        failures: dict[int, Exception] = dict()
+        for mail in mails:
+            try:
+                await self._send(mail=mail)
+            except Exception as e:
+                failures[mail.id] = e
+                if self._smtp is None:
+                    break
+            else:
+                sent_ids.append(mail.id)
+
+        return sent_ids, failures
+
+    async def drain_batch(self) -> int:
+        async with self.session_factory() as session:
+            stmt = (
+                sqlalchemy.select(MailOutbox)
+                .where(
+                    MailOutbox.sent_at.is_(None),
+                    MailOutbox.attempts < self.max_attempts,
+                    MailOutbox.next_attempt_at <= sqlalchemy.func.now(),
+                )
+                .order_by(MailOutbox.next_attempt_at, MailOutbox.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            mails = (await session.execute(statement=stmt)).scalars().all()
+            if not mails:
+                return 0
+
+            sent_ids, failures = await self.deliver(mails=mails)
+
+            now = datetime.datetime.now(tz=datetime.timezone.utc)
+            if sent_ids:
+                await session.execute(
+                    statement=sqlalchemy.update(MailOutbox)
+                    .where(MailOutbox.id.in_(sent_ids))
+                    .values(sent_at=now, attempts=MailOutbox.attempts + 1, last_error=None)
+                )
+            for mail in mails:
+                if mail.id not in failures:
+                    continue
+                attempts = mail.attempts + 1
+                if attempts >= self.max_attempts:
+                    loguru.logger.error(f"Mail outbox --- giving up on mail `{mail.id}` after {attempts} attempts")
+                mail.attempts = attempts
+                mail.last_error = repr(failures[mail.id])
+                mail.next_attempt_at = now + self.retry_delay(attempts=attempts)
+
+            await session.commit()
+
+        return len(sent_ids)
+
+    async def _run(self) -> None:
+        while self._is_running:
+            sent_count = 0
+            try:
+                sent_count = await self.drain_batch()
+            except Exception:
+                loguru.logger.exception("Mail outbox --- batch failed")
+
+            # A full batch means there is probably more waiting, so only sleep once the outbox looks drained
+            if sent_count < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wake_requested.wait(), timeout=self.poll_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake_requested.clear()
+
+    def start(self) -> None:
+        if self._worker is None:
+            self._is_running = True
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # Every batch commits on its own, unsent rows simply wait in the table for the next start.
+        if self._worker is not None:
+            self._is_running = False
+            self._wake_requested.set()
+            await self._worker
+            self._worker = None
+        await self._close_session()
+
+
+def get_mail_outbox_worker() -> MailOutboxWorker:
+    return MailOutboxWorker(
+        session_factory=async_db.async_session,
+        mail_service=mail_service,
+        batch_size=settings.MAIL_OUTBOX_BATCH_SIZE,
+        poll_interval_seconds=settings.MAIL_OUTBOX_POLL_INTERVAL_SECONDS,
+        max_attempts=settings.MAIL_OUTBOX_MAX_ATTEMPTS,
+        backoff_seconds=settings.MAIL_OUTBOX_BACKOFF_SECONDS,
+    )
+
+
+mail_outbox_worker: MailOutboxWorker = get_mail_outbox_worker()
@@ -1,6 +1,8 @@
 import smtplib
 from email.mime.text import MIMEText
-from typing import List
+
+from src.config.manager import settings
+
 
 class MailService:
     def __init__(self, email_options):
@@ -9,27 +11,47 @@ class MailService:
         self.username = email_options['username']
         self.password = email_options['password']
         self.from_email = email_options['from']
+        self.use_starttls = email_options.get('starttls', True)
+        self.timeout = email_options.get('timeout', 30)
 
-    def send_verification_code(self, to: List[str], code: str, verification_url: str = None):
+    def build_verification_mail(self, code: str, verification_url: str = None) -> tuple[str, str]:
+        subject = "UniHelp Hesap Onaylaması"
+        if verification_url:
+            body = f"UniHelp'e Hoşgeldin! Hesabını onaylamak için aşağıdaki linke tıkla:\n\n{verification_url}\n\nEğer böyle bir mail beklemiyorsanız lütfen bu maili yok sayın.\n\nOnay kodunuz: {code}"
+        else:
+            body = f"UniHelp'e Hoşgeldin!\n\nOnay kodunuz: {code}\n\nBu kodu girerek kaydınızı tamamlayınız."
+        return subject, body
+
+    def connect(self) -> smtplib.SMTP:
+        # Blocking handshake, callers run it off the event loop and keep the session open across mails
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
         try:
-            subject = "UniHelp Hesap Onaylaması"
-            if verification_url:
-                body = f"UniHelp'e Hoşgeldin! Hesabını onaylamak için aşağıdaki linke tıkla:\n\n{verification_url}\n\nEğer böyle bir mail beklemiyorsanız lütfen bu maili yok sayın.\n\nOnay kodunuz: {code}"
-            else:
-                body = f"UniHelp'e Hoşgeldin!\n\nOnay kodunuz: {code}\n\nBu kodu girerek kaydınızı tamamlayınız."
-
-            # Create message
-            msg = MIMEText(body, "plain")
-            msg['From'] = self.from_email
-            msg['To'] = ", ".join(to)
-            msg['Subject'] = subject
-
-            # Connect to SMTP server and send email
-            with smtplib.SMTP(self.host, self.port) as server:
+            if self.use_starttls:
                 server.starttls()
+            if self.username:
                 server.login(self.username, self.password)
-                server.send_message(msg)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def send(self, server: smtplib.SMTP, recipient: str, subject: str, body: str) -> None:
+        msg = MIMEText(body, "plain")
+        msg['From'] = self.from_email
+        msg['To'] = recipient
+        msg['Subject'] = subject
+        server.send_message(msg)
+
+
+def get_mail_service() -> MailService:
+    return MailService({
+        "host": settings.SMTP_HOST,
+        "port": settings.SMTP_PORT,
+        "username": settings.SMTP_USERNAME,
+        "password": settings.SMTP_PASSWORD,
+        "from": settings.SMTP_FROM_EMAIL,
+        "starttls": settings.IS_SMTP_STARTTLS_ENABLED,
+    })
+
 
-            print("Verification code sent!")
-        except Exception as e:
-            print(f"Error sending email: {e}")
\ No newline at end of file
+mail_service: MailService = get_mail_service()
@@ -0,0 +1,73 @@
+import asyncio
+import typing
+
+import loguru
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+from src.models.db.account import Account
+from src.repository.database import async_db
+from src.securities.hashing.password import pwd_generator
+from src.utilities.exceptions.password import HashingPoolSaturated
+
+
+class PasswordRehasher:
+    """
+    Upgrades stale password hashes in the background after a successful login.
+
+    The login response never waits for the new hash. The new hash is written with a compare-and-set on
+    the old one, so a password change that lands in between is never overwritten, and each account has
+    at most one rehash in flight. A rehash that finds the hashing pool saturated is dropped, the next
+    login of that account tries again.
+    """
+
+    def __init__(self, session_factory: typing.Callable[[], SQLAlchemyAsyncSession]):
+        self.session_factory = session_factory
+        self._rehashing: dict[int, asyncio.Task] = dict()
+
+    def schedule(self, account: Account, password: str) -> None:
+        if account.id in self._rehashing:
+            return
+
+        task = asyncio.create_task(
+            self.rehash(
+                account_id=account.id,
+                hash_salt=account.hash_salt,
+                password=password,
+                old_hashed_password=account.hashed_password,
+            )
+        )
+        self._rehashing[account.id] = task
+        task.add_done_callback(lambda _: self._rehashing.pop(account.id, None))
+
+    async def rehash(self, account_id: int, hash_salt: str, password: str, old_hashed_password: str) -> bool:
+        try:
+            new_hashed_password = await pwd_generator.generate_hashed_password(
+                hash_salt=hash_salt, new_password=password
+            )
+            async with self.session_factory() as session:
+                stmt = (
+                    sqlalchemy.update(Account)
+                    .where(Account.id == account_id, Account._hashed_password == old_hashed_password)
+                    .values(_hashed_password=new_hashed_password)
+                )
+                result = await session.execute(statement=stmt)
+                await session.commit()
+        except HashingPoolSaturated:
+            return False
+        except Exception:
+            loguru.logger.exception(f"Password rehash failed for account `{account_id}`")
+            return False
+
+        return result.rowcount == 1
+
+    async def stop(self) -> None:
+        if self._rehashing:
+            await asyncio.gather(*self._rehashing.values(), return_exceptions=True)
+
+
+def get_password_rehasher() -> PasswordRehasher:
+    return PasswordRehasher(session_factory=async_db.async_session)
+
+
+password_rehasher: PasswordRehasher = get_password_rehasher()
@@ -0,0 +1,162 @@
+import typing
+
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+from src.models.db.post import Post
+from src.models.schemas.account import AccountDetailBase
+from src.models.schemas.jwt import JWTPrincipal
+from src.models.schemas.post import AnswerInResponsePost, PollInResponsePost, PostInResponse, PostStatsBase
+from src.models.schemas.tag import TagCreate
+from src.repository.crud.bookmark import BookmarkCRUDRepository
+from src.repository.crud.like import LikeCRUDRepository
+from src.repository.crud.poll_vote import PollVoteCRUDRepository
+
+
+class PostHydrationService:
+    """
+    Turns a page of `Post` rows into `PostInResponse` objects for a given viewer.
+
+    Likes, bookmarks and the viewer's poll votes are resolved for the whole page at once, and answer
+    tallies come from the denormalized `Answer.vote_count`, so a page costs a fixed number of queries
+    whatever its size.
+    """
+
+    def __init__(self, async_session: SQLAlchemyAsyncSession):
+        self.like_repo = LikeCRUDRepository(async_session=async_session)
+        self.bookmark_repo = BookmarkCRUDRepository(async_session=async_session)
+        self.poll_vote_repo = PollVoteCRUDRepository(async_session=async_session)
+
+    async def hydrate_posts(self, posts: typing.Sequence[Post], viewer: JWTPrincipal | None) -> list[PostInResponse]:
+        post_ids = [post.id for post in posts]
+        poll_ids = [post.poll.id for post in posts if post.poll]
+
+        liked_post_ids: set[int] = set()
+        bookmarked_post_ids: set[int] = set()
+        user_votes: dict[int, int] = dict()
+
+        if viewer:
+            liked_post_ids = await self.like_repo.get_liked_post_ids(viewer.id, post_ids)
+            bookmarked_post_ids = await self.bookmark_repo.get_bookmarked_post_ids(viewer.id, post_ids)
+            user_votes = await self.poll_vote_repo.get_user_votes(poll_ids, viewer.id)
+
+        return [
+            self._build_post_response(
+                post=post,
+                is_liked=post.id in liked_post_ids,
+                is_bookmarked=post.id in bookmarked_post_ids,
+                user_votes=user_votes,
+            )
+            for post in posts
+        ]
+
+    async def hydrate_post(self, post: Post, viewer: JWTPrincipal | None) -> PostInResponse:
+        hydrated_posts = await self.hydrate_posts([post], viewer)
+        return hydrated_posts[0]
+
+    @classmethod
+    def build_public_post(cls, post: Post) -> PostInResponse:
+        """
+        The viewer-independent response of a post, as kept by the post cache. It needs no session, so it
+        can also be called on the class.
+        """
+        return cls._build_post_response(post=post, is_liked=False, is_bookmarked=False, user_votes=dict())
+
+    async def personalize_post(self, response: PostInResponse, viewer: JWTPrincipal | None) -> PostInResponse:
+        personalized_posts = await self.personalize_posts([response], viewer)
+        return personalized_posts[0]
+
+    async def personalize_posts(
+        self, responses: typing.Sequence[PostInResponse], viewer: JWTPrincipal | None
+    ) -> list[PostInResponse]:
+        """
+        Add the viewer's likes, bookmarks and poll votes to public post responses without touching them,
+        since the same objects may be shared through the post cache or a coalesced read.
+        """
+        if not viewer:
+            return list(responses)
+
+        post_ids = [response.id for response in responses]
+        liked_post_ids = await self.like_repo.get_liked_post_ids(viewer.id, post_ids)
+        bookmarked_post_ids = await self.bookmark_repo.get_bookmarked_post_ids(viewer.id, post_ids)
+        user_votes = await self.poll_vote_repo.get_user_votes(
+            [response.poll.id for response in responses if response.poll], viewer.id
+        )
+
+        return [
+            response.copy(
+                update={
+                    "is_liked": response.id in liked_post_ids,
+                    "is_bookmarked": response.id in bookmarked_post_ids,
+                    "poll": self._personalize_poll(response.poll, user_votes),
+                }
+            )
+            for response in responses
+        ]
+
+    def _personalize_poll(
+        self, poll: PollInResponsePost | None, user_votes: dict[int, int]
+    ) -> PollInResponsePost | None:
+        if not poll or poll.id not in user_votes:
+            return poll
+
+        return poll.copy(
+            update={
+                "answers": [
+                    answer.copy(update={"is_selected": answer.answer_index == user_votes[poll.id]})
+                    for answer in poll.answers
+                ]
+            }
+        )
+
+    @classmethod
+    def _build_poll_response(cls, post: Post, user_votes: dict[int, int]) -> PollInResponsePost | None:
+        if not post.poll:
+            return None
+
+        selected_answer_index = user_votes.get(post.poll.id)
+
+        return PollInResponsePost(
+            id=post.poll.id,
+            postId=post.poll.post_id,
+            accountId=post.poll.account_id,
+            answers=[
+                AnswerInResponsePost(
+                    id=answer.id,
+                    answerIndex=answer.answer_index,
+                    text=answer.text,
+                    answerCount=answer.vote_count,
+                    isSelected=answer.answer_index == selected_answer_index,
+                )
+                for answer in post.poll.answers
+            ],
+            expirationDate=post.poll.expiration_date,
+        )
+
+    @classmethod
+    def _build_post_response(
+        cls,
+        post: Post,
+        is_liked: bool,
+        is_bookmarked: bool,
+        user_votes: dict[int, int],
+    ) -> PostInResponse:
+        return PostInResponse(
+            id=post.id,
+            content=post.content,
+            account=AccountDetailBase(
+                avatar=post.account.avatar,
+                username=post.account.username,
+                fullName=post.account.username,
+            ),
+            stats=PostStatsBase(
+                comments=post.stats.comments,
+                likes=post.stats.likes,
+                bookmarks=post.stats.bookmarks,
+            ),
+            photos=[photo.url for photo in post.photos],
+            tags=[TagCreate(name=tag.name) for tag in post.tags],
+            poll=cls._build_poll_response(post=post, user_votes=user_votes),
+            createdAt=post.created_at,
+            isLiked=is_liked,
+            isBookmarked=is_bookmarked,
+        )
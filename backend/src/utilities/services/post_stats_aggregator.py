@@ -0,0 +1,158 @@
+import asyncio
+import collections
+import typing
+
+import loguru
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+from src.config.manager import settings
+from src.models.db.post_stats import PostStats
+from src.repository.database import async_db
+from src.utilities.caches.post_cache import post_cache
+
+COUNTER_NAMES: tuple[str, ...] = ("likes", "bookmarks", "comments")
+
+
+class PostStatsAggregator:
+    """
+    Optional write-behind buffer for the `post_stats` counters.
+
+    Instead of every like, bookmark and comment taking the row lock of a hot post, deltas are summed per
+    post in memory and written back as one `UPDATE ... FROM (VALUES ...)` every `flush_interval_ms`
+    milliseconds or as soon as `flush_max_events` deltas are pending, whichever comes first, so at most that
+    window of counter updates is lost if the process dies.
+    """
+
+    def __init__(
+        self,
+        session_factory: typing.Callable[[], SQLAlchemyAsyncSession],
+        is_enabled: bool,
+        flush_interval_ms: int,
+        flush_max_events: int,
+    ):
+        self.session_factory = session_factory
+        self.is_enabled = is_enabled
+        self.flush_interval = flush_interval_ms / 1000
+        self.flush_max_events = flush_max_events
+
+        self._deltas: collections.defaultdict[int, collections.Counter[str]] = collections.defaultdict(
+            collections.Counter
+        )
+        self._pending_events = 0
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flusher: asyncio.Task | None = None
+        self._is_running = False
+
+    @property
+    def pending_events(self) -> int:
+        return self._pending_events
+
+    @property
+    def flush_lock(self) -> asyncio.Lock:
+        # Held by every flush, so whoever holds it knows the buffered deltas are not in `post_stats` yet
+        return self._flush_lock
+
+    def pending_deltas(self, first_post_id: int, last_post_id: int) -> dict[int, collections.Counter[str]]:
+        return {
+            post_id: counters.copy()
+            for post_id, counters in self._deltas.items()
+            if first_post_id <= post_id <= last_post_id
+        }
+
+    def record(self, post_id: int, likes: int = 0, bookmarks: int = 0, comments: int = 0) -> None:
+        counters = self._deltas[post_id]
+        counters.update(likes=likes, bookmarks=bookmarks, comments=comments)
+        self._pending_events += 1
+
+        if self._pending_events >= self.flush_max_events:
+            self._flush_requested.set()
+
+    async def flush(self) -> int:
+        """
+        Write every buffered delta in one statement and return the number of posts touched.
+
+        On failure the deltas are merged back into the buffer so the next flush retries them.
+        """
+        async with self._flush_lock:
+            if not self._deltas:
+                return 0
+
+            deltas, self._deltas = self._deltas, collections.defaultdict(collections.Counter)
+            pending_events, self._pending_events = self._pending_events, 0
+
+            try:
+                await self._write(deltas=deltas)
+            except Exception:
+                loguru.logger.exception(f"PostStats write-behind flush failed, retrying {len(deltas)} posts later")
+                for post_id, counters in deltas.items():
+                    self._deltas[post_id].update(counters)
+                self._pending_events += pending_events
+                return 0
+
+            return len(deltas)
+
+    async def _write(self, deltas: dict[int, collections.Counter[str]]) -> None:
+        delta_rows = sqlalchemy.values(
+            sqlalchemy.column("post_id", sqlalchemy.Integer),
+            *[sqlalchemy.column(name, sqlalchemy.Integer) for name in COUNTER_NAMES],
+            name="post_stats_deltas",
+        ).data(
+            [
+                (post_id, *[counters[name] for name in COUNTER_NAMES])
+                for post_id, counters in sorted(deltas.items())
+            ]
+        )
+        stmt = (
+            sqlalchemy.update(PostStats)
+            .where(PostStats.post_id == delta_rows.c.post_id)
+            .values(
+                {
+                    getattr(PostStats, name): getattr(PostStats, name) + delta_rows.c[name]
+                    for name in COUNTER_NAMES
+                }
+            )
+        )
+
+        async with self.session_factory() as session:
+            await session.execute(statement=stmt)
+            await session.commit()
+
+        post_cache.bump_many(deltas.keys())
+
+    async def _run(self) -> None:
+        while self._is_running:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        if self.is_enabled and self._flusher is None:
+            self._is_running = True
+            self._flusher = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # Let an in-flight flush finish instead of cancelling it half way, then drain what is left.
+        if self._flusher is not None:
+            self._is_running = False
+            self._flush_requested.set()
+            await self._flusher
+            self._flusher = None
+
+        await self.flush()
+
+
+def get_post_stats_aggregator() -> PostStatsAggregator:
+    return PostStatsAggregator(
+        session_factory=async_db.async_session,
+        is_enabled=settings.IS_POST_STATS_WRITE_BEHIND,
+        flush_interval_ms=settings.POST_STATS_FLUSH_INTERVAL_MS,
+        flush_max_events=settings.POST_STATS_FLUSH_MAX_EVENTS,
+    )
+
+
+post_stats_aggregator: PostStatsAggregator = get_post_stats_aggregator()
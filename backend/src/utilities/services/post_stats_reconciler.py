@@ -0,0 +1,209 @@
+import asyncio
+import collections
+import time
+import typing
+
+import loguru
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+from sqlalchemy.orm import aliased
+
+from src.config.manager import settings
+from src.models.db.bookmark import Bookmark
+from src.models.db.comment import Comment
+from src.models.db.like import Like
+from src.models.db.post import Post
+from src.models.db.post_stats import PostStats
+from src.repository.database import async_db
+from src.utilities.caches.post_cache import post_cache
+from src.utilities.services.post_stats_aggregator import COUNTER_NAMES, post_stats_aggregator
+
+
+class PostStatsReconciler:
+    """
+    Background job that recomputes the `post_stats` counters from the `likes`, `bookmarks` and `comment`
+    tables and repairs the rows that drifted.
+
+    Posts are walked in id order, `chunk_size` at a time. Each chunk costs one id lookup and one `UPDATE`
+    over grouped aggregates that only touches the rows whose counters differ, and the job sleeps between
+    chunks so it never reconciles more than `max_posts_per_second` posts.
+
+    With write-behind enabled, a recount already sees the rows whose counter deltas still wait in the
+    aggregator, so each chunk is written as the recount minus those deltas while flushes are held off.
+    Deltas buffered by other processes are not visible here and are only corrected by the next pass.
+    """
+
+    def __init__(
+        self,
+        session_factory: typing.Callable[[], SQLAlchemyAsyncSession],
+        is_enabled: bool,
+        chunk_size: int,
+        max_posts_per_second: int,
+        interval_seconds: int,
+    ):
+        self.session_factory = session_factory
+        self.is_enabled = is_enabled
+        self.chunk_size = chunk_size
+        self.max_posts_per_second = max_posts_per_second
+        self.interval_seconds = interval_seconds
+
+        self._stop_requested = asyncio.Event()
+        self._reconciler: asyncio.Task | None = None
+
+    def build_reconcile_statement(
+        self,
+        first_post_id: int,
+        last_post_id: int,
+        pending_deltas: dict[int, collections.Counter[str]] | None = None,
+    ) -> sqlalchemy.Update:
+        stats = aliased(PostStats)
+        like_counts = (
+            sqlalchemy.select(Like.post_id, sqlalchemy.func.count().label("likes"))
+            .where(Like.post_id.between(first_post_id, last_post_id))
+            .group_by(Like.post_id)
+            .subquery("like_counts")
+        )
+        bookmark_counts = (
+            sqlalchemy.select(Bookmark.post_id, sqlalchemy.func.count().label("bookmarks"))
+            .where(Bookmark.post_id.between(first_post_id, last_post_id))
+            .group_by(Bookmark.post_id)
+            .subquery("bookmark_counts")
+        )
+        comment_counts = (
+            sqlalchemy.select(Comment.post_id, sqlalchemy.func.count().label("comments"))
+            .where(Comment.post_id.between(first_post_id, last_post_id))
+            .group_by(Comment.post_id)
+            .subquery("comment_counts")
+        )
+        counts = {
+            "likes": sqlalchemy.func.coalesce(like_counts.c.likes, 0),
+            "bookmarks": sqlalchemy.func.coalesce(bookmark_counts.c.bookmarks, 0),
+            "comments": sqlalchemy.func.coalesce(comment_counts.c.comments, 0),
+        }
+        actual_stmt = (
+            sqlalchemy.select(stats.id)
+            .outerjoin(like_counts, like_counts.c.post_id == stats.post_id)
+            .outerjoin(bookmark_counts, bookmark_counts.c.post_id == stats.post_id)
+            .outerjoin(comment_counts, comment_counts.c.post_id == stats.post_id)
+            .where(stats.post_id.between(first_post_id, last_post_id))
+        )
+        if pending_deltas:
+            # The next flush adds these deltas on top, so leave them out of the stored counters
+            pending = sqlalchemy.values(
+                sqlalchemy.column("post_id", sqlalchemy.Integer),
+                *[sqlalchemy.column(name, sqlalchemy.Integer) for name in COUNTER_NAMES],
+                name="pending_deltas",
+            ).data(
+                [
+                    (post_id, *[counters[name] for name in COUNTER_NAMES])
+                    for post_id, counters in sorted(pending_deltas.items())
+                ]
+            )
+            actual_stmt = actual_stmt.outerjoin(pending, pending.c.post_id == stats.post_id)
+            counts = {name: count - sqlalchemy.func.coalesce(pending.c[name], 0) for name, count in counts.items()}
+        actual = actual_stmt.add_columns(*[count.label(name) for name, count in counts.items()]).subquery("actual")
+
+        return (
+            sqlalchemy.update(PostStats)
+            .where(PostStats.id == actual.c.id)
+            .where(
+                PostStats.likes.is_distinct_from(actual.c.likes)
+                | PostStats.bookmarks.is_distinct_from(actual.c.bookmarks)
+                | PostStats.comments.is_distinct_from(actual.c.comments)
+            )
+            .values(likes=actual.c.likes, bookmarks=actual.c.bookmarks, comments=actual.c.comments)
+            .returning(PostStats.post_id)
+        )
+
+    async def reconcile_chunk(self, after_post_id: int) -> tuple[int | None, int]:
+        """
+        Reconcile the next chunk of posts after `after_post_id`.
+
+        Returns the last post id of the chunk (`None` once every post was visited) and the number of
+        repaired rows.
+        """
+        async with self.session_factory() as session:
+            stmt = (
+                sqlalchemy.select(Post.id)
+                .where(Post.id > after_post_id)
+                .order_by(Post.id)
+                .limit(self.chunk_size)
+            )
+            post_ids = (await session.execute(statement=stmt)).scalars().all()
+            if not post_ids:
+                return None, 0
+
+            # No flush may land between reading the pending deltas and committing the recount, or it would
+            # be overwritten by a recount that already subtracted it
+            async with post_stats_aggregator.flush_lock:
+                pending_deltas = post_stats_aggregator.pending_deltas(
+                    first_post_id=post_ids[0], last_post_id=post_ids[-1]
+                )
+                result = await session.execute(
+                    statement=self.build_reconcile_statement(
+                        first_post_id=post_ids[0], last_post_id=post_ids[-1], pending_deltas=pending_deltas
+                    )
+                )
+                repaired_post_ids = result.scalars().all()
+                await session.commit()
+
+        post_cache.bump_many(repaired_post_ids)
+
+        return post_ids[-1], len(repaired_post_ids)
+
+    async def run_pass(self) -> int:
+        after_post_id, repaired_count = 0, 0
+        while not self._stop_requested.is_set():
+            started_at = time.monotonic()
+            last_post_id, chunk_repaired_count = await self.reconcile_chunk(after_post_id=after_post_id)
+            if last_post_id is None:
+                break
+
+            after_post_id = last_post_id
+            repaired_count += chunk_repaired_count
+
+            pause = self.chunk_size / self.max_posts_per_second - (time.monotonic() - started_at)
+            if pause > 0:
+                await self._sleep(pause)
+
+        loguru.logger.info(f"PostStats reconciliation --- repaired {repaired_count} drifted rows")
+        return repaired_count
+
+    async def _sleep(self, seconds: float) -> None:
+        try:
+            await asyncio.wait_for(self._stop_requested.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run(self) -> None:
+        while not self._stop_requested.is_set():
+            try:
+                await self.run_pass()
+            except Exception:
+                loguru.logger.exception("PostStats reconciliation --- pass failed")
+            await self._sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        if self.is_enabled and self._reconciler is None:
+            self._stop_requested.clear()
+            self._reconciler = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # Every chunk commits on its own, so the job can stop between any two of them.
+        if self._reconciler is not None:
+            self._stop_requested.set()
+            await self._reconciler
+            self._reconciler = None
+
+
+def get_post_stats_reconciler() -> PostStatsReconciler:
+    return PostStatsReconciler(
+        session_factory=async_db.async_session,
+        is_enabled=settings.IS_POST_STATS_RECONCILE_ENABLED,
+        chunk_size=settings.POST_STATS_RECONCILE_CHUNK_SIZE,
+        max_posts_per_second=settings.POST_STATS_RECONCILE_MAX_POSTS_PER_SECOND,
+        interval_seconds=settings.POST_STATS_RECONCILE_INTERVAL_SECONDS,
+    )
+
+
+post_stats_reconciler: PostStatsReconciler = get_post_stats_reconciler()
@@ -0,0 +1,170 @@
+import asyncio
+import collections
+import datetime
+import hashlib
+import time
+import typing
+
+import loguru
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+from src.config.manager import settings
+from src.models.schemas.post import PostInResponse
+from src.repository.crud.post import PostCRUDRepository
+from src.repository.database import async_db
+from src.utilities.services.post_hydration_service import PostHydrationService
+
+
+class PublicFeedSnapshot(typing.NamedTuple):
+    posts: list[PostInResponse]
+    digests: list[str]
+    # The feed had no more posts than the snapshot holds, so windows past its end are known to be short
+    is_complete: bool
+    refreshed_at: float
+
+
+class PublicFeedPage(typing.NamedTuple):
+    posts: list[PostInResponse]
+    etag: str
+
+
+class PublicFeedService:
+    """
+    Serves the logged-out `GET /posts` feed from in-memory snapshots instead of the database.
+
+    A background job rebuilds, every `refresh_interval_seconds`, the first `pages` pages of `page_size`
+    posts of the untagged feed and of the `max_tags` tags that anonymous visitors asked for most recently.
+    Any page, by `skip` or by cursor, that lies inside a snapshot is served from it with an `ETag` derived
+    from the posts on the page, everything else falls back to the database.
+    """
+
+    def __init__(
+        self,
+        session_factory: typing.Callable[[], SQLAlchemyAsyncSession],
+        is_enabled: bool,
+        page_size: int,
+        pages: int,
+        max_tags: int,
+        refresh_interval_seconds: int,
+    ):
+        self.session_factory = session_factory
+        self.is_enabled = is_enabled
+        self.page_size = page_size
+        self.pages = pages
+        self.max_tags = max_tags
+        self.refresh_interval_seconds = refresh_interval_seconds
+
+        self._snapshots: dict[int | None, PublicFeedSnapshot] = dict()
+        # Tags anonymous visitors asked for, most recent last
+        self._requested_tags: collections.OrderedDict[int, None] = collections.OrderedDict()
+        self._stop_requested = asyncio.Event()
+        self._refresher: asyncio.Task | None = None
+
+    def _request_tag(self, tag: int) -> None:
+        self._requested_tags[tag] = None
+        self._requested_tags.move_to_end(tag)
+        while len(self._requested_tags) > self.max_tags:
+            forgotten_tag, _ = self._requested_tags.popitem(last=False)
+            self._snapshots.pop(forgotten_tag, None)
+
+    def read_page(
+        self,
+        tag: int | None,
+        skip: int,
+        limit: int,
+        cursor: tuple[datetime.datetime, int] | None,
+    ) -> PublicFeedPage | None:
+        """
+        The page from the snapshot of `tag`, or `None` when it has to come from the database. Raises
+        `ValueError` for a cursor that cannot be compared with the snapshot.
+        """
+        if not self.is_enabled:
+            return None
+
+        if tag is not None:
+            self._request_tag(tag)
+
+        snapshot = self._snapshots.get(tag)
+        if snapshot is None:
+            return None
+
+        start = skip
+        if cursor:
+            try:
+                start = next(
+                    (
+                        index
+                        for index, post in enumerate(snapshot.posts)
+                        if (post.created_at, post.id) < cursor
+                    ),
+                    len(snapshot.posts),
+                )
+            except TypeError as cursor_compare_error:
+                # Snapshot timestamps are naive, so only a hand-made cursor with a timezone gets here
+                raise ValueError(f"Invalid pagination cursor `{cursor}`") from cursor_compare_error
+        end = start + limit
+        if end > len(snapshot.posts) and not snapshot.is_complete:
+            return None
+
+        digest = hashlib.sha1(f"{limit}:{','.join(snapshot.digests[start:end])}".encode()).hexdigest()
+        return PublicFeedPage(posts=snapshot.posts[start:end], etag=f'"{digest}"')
+
+    async def build_snapshot(self, tag: int | None) -> PublicFeedSnapshot:
+        capacity = self.page_size * self.pages
+        async with self.session_factory() as session:
+            db_posts = await PostCRUDRepository(async_session=session).read_posts(
+                user_id=None, limit=capacity, tag=tag  # type: ignore
+            )
+            posts = await PostHydrationService(async_session=session).hydrate_posts(db_posts, None)
+
+        return PublicFeedSnapshot(
+            posts=posts,
+            digests=[hashlib.sha1(post.json().encode()).hexdigest()[:16] for post in posts],
+            is_complete=len(posts) < capacity,
+            refreshed_at=time.monotonic(),
+        )
+
+    async def refresh(self) -> None:
+        for tag in [None, *self._requested_tags]:
+            try:
+                snapshot = await self.build_snapshot(tag=tag)
+            except Exception:
+                loguru.logger.exception(f"Public feed --- refreshing the snapshot of tag `{tag}` failed")
+                continue
+
+            # The tag may have been forgotten while its snapshot was being built
+            if tag is None or tag in self._requested_tags:
+                self._snapshots[tag] = snapshot
+
+    async def _run(self) -> None:
+        while not self._stop_requested.is_set():
+            await self.refresh()
+            try:
+                await asyncio.wait_for(self._stop_requested.wait(), timeout=self.refresh_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        if self.is_enabled and self._refresher is None:
+            self._stop_requested.clear()
+            self._refresher = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._refresher is not None:
+            self._stop_requested.set()
+            await self._refresher
+            self._refresher = None
+
+
+def get_public_feed_service() -> PublicFeedService:
+    return PublicFeedService(
+        session_factory=async_db.async_session,
+        is_enabled=settings.IS_PUBLIC_FEED_SNAPSHOT_ENABLED,
+        page_size=settings.PUBLIC_FEED_PAGE_SIZE,
+        pages=settings.PUBLIC_FEED_PAGES,
+        max_tags=settings.PUBLIC_FEED_MAX_TAGS,
+        refresh_interval_seconds=settings.PUBLIC_FEED_REFRESH_SECONDS,
+    )
+
+
+public_feed_service: PublicFeedService = get_public_feed_service()
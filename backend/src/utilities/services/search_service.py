@@ -0,0 +1,154 @@
+import asyncio
+import typing
+
+import loguru
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+from src.config.manager import settings
+from src.models.schemas.account import AccountDetailBase
+from src.models.schemas.search import PostInSearchResponse, SearchResponse
+from src.models.schemas.tag import TagResponse
+from src.repository.crud.search import SearchCRUDRepository
+from src.repository.database import async_db
+from src.utilities.caches.search_cache import SearchCache, SearchCacheEntry, search_cache
+from src.utilities.formatters.search_formatter import format_search_query
+from src.utilities.services.post_hydration_service import PostHydrationService
+from src.utilities.services.singleflight import SingleFlight, singleflight
+
+
+class SearchService:
+    """
+    Runs the user, post and tag facets of a search concurrently.
+
+    Every facet gets its own session, and therefore its own pooled connection, so the facets overlap
+    instead of queueing on one connection. A facet that does not finish within `facet_timeout_ms` is
+    cancelled and comes back empty, and its name is listed in `timed_out_facets` so the response can be
+    flagged as partial.
+
+    Complete results are cached by id in `cache`, and a cache hit only reloads those rows by primary key.
+    Identical searches running at the same time share one run through `singleflight`, which hands out the
+    viewer-independent `SearchResponse` built from the rows, never the rows themselves.
+    """
+
+    def __init__(
+        self,
+        session_factory: typing.Callable[[], SQLAlchemyAsyncSession],
+        facet_timeout_ms: int,
+        cache: SearchCache,
+        singleflight: SingleFlight,
+    ):
+        self.session_factory = session_factory
+        self.facet_timeout = facet_timeout_ms / 1000
+        self.cache = cache
+        self.singleflight = singleflight
+
+    async def _run_facet(
+        self,
+        facet: str,
+        search: typing.Callable[[SearchCRUDRepository], typing.Awaitable[typing.Any]],
+        fallback: typing.Any,
+    ) -> tuple[typing.Any, bool]:
+        async with self.session_factory() as session:
+            try:
+                result = await asyncio.wait_for(
+                    search(SearchCRUDRepository(async_session=session)), timeout=self.facet_timeout
+                )
+            except asyncio.TimeoutError:
+                loguru.logger.warning(f"Search facet `{facet}` timed out after {self.facet_timeout}s")
+                return fallback, False
+
+        return result, True
+
+    async def _gather_facets(
+        self,
+        search_users: typing.Callable[[SearchCRUDRepository], typing.Awaitable[typing.Any]],
+        search_posts: typing.Callable[[SearchCRUDRepository], typing.Awaitable[typing.Any]],
+        search_tags: typing.Callable[[SearchCRUDRepository], typing.Awaitable[typing.Any]],
+    ) -> dict[str, typing.Any]:
+        (users, has_users), ((posts, post_headlines), has_posts), (tags, has_tags) = await asyncio.gather(
+            self._run_facet("users", search_users, fallback=list()),
+            self._run_facet("posts", search_posts, fallback=(list(), dict())),
+            self._run_facet("tags", search_tags, fallback=list()),
+        )
+
+        return {
+            "users": users,
+            "posts": posts,
+            "post_headlines": post_headlines,
+            "tags": tags,
+            "timed_out_facets": [
+                facet
+                for facet, is_complete in (("users", has_users), ("posts", has_posts), ("tags", has_tags))
+                if not is_complete
+            ],
+        }
+
+    async def search_all(self, query: str, skip: int, limit: int) -> SearchResponse:
+        query = format_search_query(query)
+        return await self.singleflight.do(("search_all", query, skip, limit), lambda: self._search_all(query, skip, limit))
+
+    async def _search_all(self, query: str, skip: int, limit: int) -> SearchResponse:
+        cache_entry = self.cache.get(query, skip, limit)
+        if cache_entry is not None:
+            async def read_posts(repo: SearchCRUDRepository) -> tuple[list, dict[int, str]]:
+                return await repo.read_posts_by_ids(cache_entry.post_ids), cache_entry.post_headlines
+
+            return self._build_response(
+                await self._gather_facets(
+                    search_users=lambda repo: repo.read_users_by_ids(cache_entry.user_ids),
+                    search_posts=read_posts,
+                    search_tags=lambda repo: repo.read_tags_by_ids(cache_entry.tag_ids),
+                )
+            )
+
+        results = await self._gather_facets(
+            search_users=lambda repo: repo.search_users(query, skip, limit),
+            search_posts=lambda repo: repo.search_posts(query, skip, limit),
+            search_tags=lambda repo: repo.search_tags(query, skip, limit),
+        )
+
+        # Partial results are not cached, the next identical search gets another chance at every facet
+        if not results["timed_out_facets"]:
+            self.cache.set(
+                query,
+                skip,
+                limit,
+                SearchCacheEntry(
+                    user_ids=[user.id for user in results["users"]],
+                    post_ids=[post.id for post in results["posts"]],
+                    post_headlines=results["post_headlines"],
+                    tag_ids=[tag.id for tag in results["tags"]],
+                ),
+            )
+
+        return self._build_response(results)
+
+    def _build_response(self, results: dict[str, typing.Any]) -> SearchResponse:
+        return SearchResponse(
+            users=[
+                AccountDetailBase(username=user.username, avatar=user.avatar, fullName=user.username)
+                for user in results["users"]
+            ],
+            posts=[
+                PostInSearchResponse(
+                    **PostHydrationService.build_public_post(post).dict(by_alias=True),
+                    headline=results["post_headlines"].get(post.id),
+                )
+                for post in results["posts"]
+            ],
+            tags=[TagResponse(id=tag.id, name=tag.name) for tag in results["tags"]],
+            isPartial=bool(results["timed_out_facets"]),
+            timedOutFacets=results["timed_out_facets"],
+        )
+
+
+def get_search_service() -> SearchService:
+    return SearchService(
+        session_factory=async_db.async_session,
+        facet_timeout_ms=settings.SEARCH_FACET_TIMEOUT_MS,
+        cache=search_cache,
+        singleflight=singleflight,
+    )
+
+
+search_service: SearchService = get_search_service()
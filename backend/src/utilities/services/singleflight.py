@@ -0,0 +1,80 @@
+import asyncio
+import typing
+
+T = typing.TypeVar("T")
+
+
+class _LeaderCancelled(Exception):
+    pass
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent reads: while a call for a key is in flight, later callers with the
+    same key await its result instead of running their own.
+
+    The first caller runs the coroutine itself, in its own task and with whatever session the coroutine
+    uses, usually that caller's, and shares the outcome, result or exception, with everyone who joined
+    meanwhile. Results must therefore not depend on the first caller's session: coalesce on detached
+    values such as response schemas, never on ORM rows. If that caller is cancelled, for example because
+    its client went away, the callers that joined it start over instead of failing. Shared results must
+    be treated as read-only by every caller.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[typing.Hashable, asyncio.Future] = dict()
+        self.calls = 0
+        self.executions = 0
+        self.saved_calls = 0
+
+    async def do(self, key: typing.Hashable, fn: typing.Callable[[], typing.Awaitable[T]]) -> T:
+        self.calls += 1
+
+        while (flight := self._flights.get(key)) is not None:
+            try:
+                result = await asyncio.shield(flight)
+            except _LeaderCancelled:
+                continue
+            except Exception:
+                self.saved_calls += 1
+                raise
+            self.saved_calls += 1
+            return result
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        self.executions += 1
+        try:
+            result = await fn()
+        except Exception as e:
+            flight.set_exception(e)
+            raise
+        except BaseException:
+            # Cancelled (or interrupted), the result is not known so the joined callers retry
+            flight.set_exception(_LeaderCancelled())
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            # Nobody may be waiting, so mark the exception as retrieved to keep asyncio from logging it
+            if flight.done() and not flight.cancelled():
+                flight.exception()
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "saved_calls": self.saved_calls,
+            "in_flight": len(self._flights),
+        }
+
+
+def get_singleflight() -> SingleFlight:
+    return SingleFlight()
+
+
+singleflight: SingleFlight = get_singleflight()
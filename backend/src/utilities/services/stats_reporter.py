@@ -0,0 +1,71 @@
+import asyncio
+import os
+import typing
+
+import loguru
+
+from src.config.manager import settings
+from src.securities.hashing.pool import hashing_pool
+from src.utilities.caches.post_cache import post_cache
+from src.utilities.caches.tag_cache import tag_cache
+from src.utilities.services.singleflight import singleflight
+
+
+class StatsReporter:
+    """
+    Background job that logs the counters of the in-process caches and pools every `interval_seconds`.
+
+    Every worker process keeps its own caches, so each one reports its own counters, tagged with its pid.
+    """
+
+    def __init__(
+        self,
+        sources: dict[str, typing.Callable[[], dict[str, typing.Any]]],
+        is_enabled: bool,
+        interval_seconds: int,
+    ):
+        self.sources = sources
+        self.is_enabled = is_enabled
+        self.interval_seconds = interval_seconds
+
+        self._stop_requested = asyncio.Event()
+        self._reporter: asyncio.Task | None = None
+
+    def report(self) -> None:
+        for name, read_stats in self.sources.items():
+            loguru.logger.info(f"Stats [pid {os.getpid()}] --- {name}: {read_stats()}")
+
+    async def _run(self) -> None:
+        while not self._stop_requested.is_set():
+            try:
+                await asyncio.wait_for(self._stop_requested.wait(), timeout=self.interval_seconds)
+            except asyncio.TimeoutError:
+                self.report()
+
+    def start(self) -> None:
+        if self.is_enabled and self._reporter is None:
+            self._stop_requested.clear()
+            self._reporter = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._reporter is not None:
+            self._stop_requested.set()
+            await self._reporter
+            self._reporter = None
+            self.report()
+
+
+def get_stats_reporter() -> StatsReporter:
+    return StatsReporter(
+        sources={
+            "tag_cache": lambda: tag_cache.stats,
+            "hashing_pool": lambda: hashing_pool.stats,
+            "post_cache": lambda: post_cache.stats,
+            "singleflight": lambda: singleflight.stats,
+        },
+        is_enabled=settings.IS_STATS_REPORT_ENABLED,
+        interval_seconds=settings.STATS_REPORT_INTERVAL_SECONDS,
+    )
+
+
+stats_reporter: StatsReporter = get_stats_reporter()
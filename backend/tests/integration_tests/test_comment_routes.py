@@ -0,0 +1,102 @@
+import datetime
+
+import fastapi
+import httpx
+import pytest
+
+from src.api.dependencies.session import get_async_session
+from src.main import initialize_backend_application
+from src.models.db.comment import Comment
+from src.repository.crud.comment import CommentCRUDRepository
+from src.utilities.formatters.cursor_formatter import format_cursor_into_keyset, format_keyset_into_cursor
+
+CREATED_AT = datetime.datetime(2026, 10, 18, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+def build_comment(comment_id: int, parent_id: int | None = None) -> Comment:
+    return Comment(
+        id=comment_id,
+        post_id=5,
+        author_id=1,
+        parent_id=parent_id,
+        content="Vize kaçta?",
+        created_at=CREATED_AT + datetime.timedelta(minutes=comment_id),
+        updated_at=CREATED_AT + datetime.timedelta(minutes=comment_id),
+    )
+
+
+class FakeComments:
+    """
+    Stands in for the comment queries: top-level comments 1 to 5 of post 5, newest first, where comment
+    5 has two replies.
+    """
+
+    def __init__(self) -> None:
+        self.cursors: list[tuple[datetime.datetime, int] | None] = list()
+
+    async def get_post_comments(self, post_id, skip=0, limit=10, cursor=None):
+        self.cursors.append(cursor)
+        comments = [build_comment(comment_id) for comment_id in range(5, 0, -1)]
+        if cursor:
+            comments = [comment for comment in comments if (comment.created_at, comment.id) < cursor]
+        return [(comment, "berk", None, 2 if comment.id == 5 else 0) for comment in comments[skip : skip + limit]]
+
+    async def get_comment(self, comment_id):
+        return build_comment(comment_id), "berk", None
+
+    async def count_replies(self, post_id, comment_ids):
+        return {5: 2}
+
+
+@pytest.fixture(name="fake_comments")
+def fake_comments(monkeypatch: pytest.MonkeyPatch) -> FakeComments:
+    comments = FakeComments()
+    for name in ("get_post_comments", "get_comment", "count_replies"):
+        monkeypatch.setattr(CommentCRUDRepository, name, staticmethod(getattr(comments, name)))
+    return comments
+
+
+@pytest.fixture(name="comment_client")
+async def comment_client(fake_comments: FakeComments) -> httpx.AsyncClient:  # type: ignore
+    app: fastapi.FastAPI = initialize_backend_application()
+
+    async def get_no_session():
+        yield None
+
+    app.dependency_overrides[get_async_session] = get_no_session
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client:
+        yield client
+
+
+async def test_post_comments_page_by_the_next_cursor(comment_client: httpx.AsyncClient, fake_comments) -> None:
+    first_page = await comment_client.get("/api/comments/post/5", params={"limit": 2})
+
+    assert first_page.status_code == 200
+    assert [comment["id"] for comment in first_page.json()] == [5, 4]
+    assert [comment["replies_count"] for comment in first_page.json()] == [2, 0]
+    next_cursor = first_page.headers["X-Next-Cursor"]
+    assert next_cursor == format_keyset_into_cursor(CREATED_AT + datetime.timedelta(minutes=4), 4)
+
+    second_page = await comment_client.get("/api/comments/post/5", params={"limit": 2, "cursor": next_cursor})
+    assert [comment["id"] for comment in second_page.json()] == [3, 2]
+    assert fake_comments.cursors[-1] == format_cursor_into_keyset(next_cursor, is_timezone_aware=True)
+
+    # A short page is the last one
+    last_page = await comment_client.get(
+        "/api/comments/post/5", params={"limit": 2, "cursor": second_page.headers["X-Next-Cursor"]}
+    )
+    assert [comment["id"] for comment in last_page.json()] == [1]
+    assert "X-Next-Cursor" not in last_page.headers
+
+
+async def test_post_comments_reject_a_malformed_cursor(comment_client: httpx.AsyncClient) -> None:
+    response = await comment_client.get("/api/comments/post/5", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+
+
+async def test_single_comment_carries_its_replies_count(comment_client: httpx.AsyncClient) -> None:
+    response = await comment_client.get("/api/comments/5")
+
+    assert response.status_code == 200
+    assert response.json()["replies_count"] == 2
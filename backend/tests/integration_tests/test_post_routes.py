@@ -0,0 +1,78 @@
+import asyncio
+import datetime
+
+import fastapi
+import httpx
+import pytest
+
+from src.api.dependencies.session import get_async_session
+from src.main import initialize_backend_application
+from src.models.db.account import Account
+from src.models.db.post import Post
+from src.models.db.post_stats import PostStats
+from src.repository.crud.post import PostCRUDRepository
+
+CREATED_AT = datetime.datetime(2026, 10, 18, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+def build_post(post_id: int) -> Post:
+    return Post(
+        id=post_id,
+        content="Vize notları",
+        account_id=1,
+        account=Account(id=1, username="berk", avatar=None),
+        stats=PostStats(post_id=post_id, comments=0, likes=0, bookmarks=0),
+        photos=[],
+        tags=[],
+        poll=None,
+        created_at=CREATED_AT + datetime.timedelta(minutes=post_id),
+    )
+
+
+class FakePosts:
+    """
+    Stands in for the feed query and keeps every read open until `release` is set.
+    """
+
+    def __init__(self) -> None:
+        self.reads = 0
+        self.release = asyncio.Event()
+
+    async def read_posts(self, user_id, skip=0, limit=10, tag=None, cursor=None):
+        self.reads += 1
+        await self.release.wait()
+        return [build_post(post_id) for post_id in (3, 2)]
+
+
+@pytest.fixture(name="fake_posts")
+def fake_posts(monkeypatch: pytest.MonkeyPatch) -> FakePosts:
+    posts = FakePosts()
+    monkeypatch.setattr(PostCRUDRepository, "read_posts", staticmethod(posts.read_posts))
+    return posts
+
+
+@pytest.fixture(name="post_client")
+async def post_client(fake_posts: FakePosts) -> httpx.AsyncClient:  # type: ignore
+    app: fastapi.FastAPI = initialize_backend_application()
+
+    async def get_no_session():
+        yield None
+
+    app.dependency_overrides[get_async_session] = get_no_session
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client:
+        yield client
+
+
+async def test_concurrent_feed_reads_share_one_page_of_responses(post_client: httpx.AsyncClient, fake_posts) -> None:
+    requests = [asyncio.create_task(post_client.get("/api/posts", params={"limit": 2})) for _ in range(3)]
+    while fake_posts.reads == 0:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.01)
+    fake_posts.release.set()
+    responses = await asyncio.gather(*requests)
+
+    assert fake_posts.reads == 1
+    assert all(response.status_code == 200 for response in responses)
+    assert all(response.json() == responses[0].json() for response in responses)
+    assert [post["id"] for post in responses[0].json()] == [3, 2]
+    assert "X-Next-Cursor" in responses[0].headers
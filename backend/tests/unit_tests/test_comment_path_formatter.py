@@ -0,0 +1,11 @@
+from src.utilities.formatters.comment_path_formatter import format_comment_path
+
+
+def test_comment_paths_sort_parents_before_replies_and_siblings_by_id() -> None:
+    root = format_comment_path(comment_id=7)
+    first_reply = format_comment_path(comment_id=42, parent_path=root)
+    nested_reply = format_comment_path(comment_id=1000, parent_path=first_reply)
+    second_reply = format_comment_path(comment_id=100, parent_path=root)
+
+    assert first_reply == "0000000007/0000000042"
+    assert sorted([second_reply, nested_reply, root, first_reply]) == [root, first_reply, nested_reply, second_reply]
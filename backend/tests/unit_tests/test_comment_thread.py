@@ -0,0 +1,44 @@
+from sqlalchemy.dialects import postgresql
+
+from src.models.db.comment import Comment
+from src.repository.crud.comment import CommentCRUDRepository
+
+
+class ThreadResult:
+    def __init__(self, rows: list[tuple]):
+        self.rows = rows
+
+    def all(self) -> list[tuple]:
+        return self.rows
+
+
+class ThreadSession:
+    def __init__(self, thread_rows: list[tuple]):
+        self.thread_rows = thread_rows
+        self.statements: list[str] = list()
+
+    async def execute(self, statement) -> ThreadResult:
+        self.statements.append(
+            str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+        )
+        return ThreadResult(self.thread_rows if len(self.statements) == 1 else [(1, 1)])
+
+
+async def test_comment_thread_seeks_subtrees_by_path_and_drops_orphaned_replies() -> None:
+    session = ThreadSession(
+        [
+            (Comment(id=1, post_id=5, parent_id=None), "berk", None, 0),
+            (Comment(id=2, post_id=5, parent_id=1), "irem", None, 1),
+            # Its parent was not among the first replies of comment 1, so it has to go too
+            (Comment(id=4, post_id=5, parent_id=3), "berk", None, 2),
+        ]
+    )
+
+    thread = await CommentCRUDRepository(async_session=session).get_comment_thread(post_id=5)  # type: ignore
+
+    assert [(comment.id, depth, replies_count) for comment, _, _, depth, replies_count in thread] == [
+        (1, 0, 1),
+        (2, 1, 0),
+    ]
+    assert "comment_1.path > (roots.path || '/') AND comment_1.path < (roots.path || '0')" in session.statements[0]
+    assert "comment.parent_id IN (1, 2)" in session.statements[1]
@@ -0,0 +1,35 @@
+import datetime
+
+import pytest
+
+from src.utilities.formatters.cursor_formatter import format_cursor_into_keyset, format_keyset_into_cursor
+
+
+def test_cursor_round_trips_keyset() -> None:
+    created_at = datetime.datetime(2024, 3, 1, 12, 30, 45, 123456)
+
+    cursor = format_keyset_into_cursor(created_at, 42)
+
+    assert "=" not in cursor
+    assert format_cursor_into_keyset(cursor) == (created_at, 42)
+
+
+def test_cursor_rejects_garbage() -> None:
+    with pytest.raises(ValueError):
+        format_cursor_into_keyset("not-a-cursor")
+
+
+def test_cursor_normalizes_hand_made_timezones() -> None:
+    cursor = format_keyset_into_cursor(
+        datetime.datetime(2024, 3, 1, 15, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=3))), 42
+    )
+
+    assert format_cursor_into_keyset(cursor) == (datetime.datetime(2024, 3, 1, 12, 30), 42)
+    assert format_cursor_into_keyset(cursor, is_timezone_aware=True) == (
+        datetime.datetime(2024, 3, 1, 12, 30, tzinfo=datetime.timezone.utc),
+        42,
+    )
+    assert format_cursor_into_keyset(format_keyset_into_cursor(datetime.datetime(2024, 3, 1, 12, 30), 42), True) == (
+        datetime.datetime(2024, 3, 1, 12, 30, tzinfo=datetime.timezone.utc),
+        42,
+    )
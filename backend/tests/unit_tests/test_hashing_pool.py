@@ -0,0 +1,57 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.securities.hashing.pool import HashingPool
+from src.utilities.exceptions.password import HashingPoolSaturated
+
+
+async def test_hashing_pool_rejects_calls_beyond_max_pending() -> None:
+    hashing_pool = HashingPool(max_workers=1, max_pending=2)
+    release = threading.Event()
+
+    running = [asyncio.create_task(hashing_pool.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+
+    assert hashing_pool.stats["pending"] == 2
+    assert hashing_pool.stats["queued"] == 1
+
+    with pytest.raises(HashingPoolSaturated):
+        await hashing_pool.run(release.wait)
+
+    release.set()
+    assert await asyncio.gather(*running) == [True, True]
+    assert await hashing_pool.run(sum, [1, 2]) == 3
+
+    stats = hashing_pool.stats
+    hashing_pool.shutdown()
+
+    assert stats["pending"] == 0
+    assert stats["peak_pending"] == stats["max_pending"] == 2
+    assert stats["completed"] == 3
+    assert stats["rejected"] == 1
+
+
+async def test_hashing_pool_frees_the_slot_of_a_cancelled_call() -> None:
+    hashing_pool = HashingPool(max_workers=1, max_pending=2)
+    release = threading.Event()
+
+    running = asyncio.create_task(hashing_pool.run(release.wait))
+    queued = asyncio.create_task(hashing_pool.run(release.wait))
+    await asyncio.sleep(0.01)
+
+    # The client of the queued call went away before its job started
+    queued.cancel()
+    await asyncio.sleep(0.01)
+    assert hashing_pool.stats["pending"] == 1
+
+    # The running job keeps its slot until it is done, even once nobody waits for it
+    running.cancel()
+    await asyncio.sleep(0.01)
+    assert hashing_pool.stats["pending"] == 1
+
+    release.set()
+    await asyncio.sleep(0.01)
+    assert hashing_pool.stats["pending"] == 0
+    hashing_pool.shutdown()
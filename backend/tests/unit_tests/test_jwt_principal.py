@@ -0,0 +1,50 @@
+from src.api.dependencies import auth
+from src.config.manager import settings
+from src.models.db.account import Account
+from src.models.schemas.jwt import JWTPrincipal
+from src.securities.authorizations.jwt import jwt_generator
+from src.utilities.caches.principal_cache import PrincipalCache
+
+
+def test_claims_access_token_round_trips_into_a_principal(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "IS_JWT_CLAIMS_PRINCIPAL", True)
+    account = Account(
+        id=7, username="berk", email="berk@unihelp.com", avatar=None, is_verified=True, token_version=3
+    )
+
+    payload = jwt_generator.verify_token(jwt_generator.generate_access_token(account=account))
+    principal = JWTPrincipal(**payload)
+
+    assert payload["email"] == "berk@unihelp.com"
+    assert principal.id == 7
+    assert principal.is_verified is True
+    assert principal.token_version == 3
+
+
+class TokenVersionRepository:
+    def __init__(self, token_version: int | None):
+        self.token_version = token_version
+        self.reads = 0
+
+    async def read_token_version(self, id: int) -> int | None:
+        self.reads += 1
+        return self.token_version
+
+
+async def test_claims_access_token_is_revoked_by_a_token_version_bump(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "IS_JWT_CLAIMS_PRINCIPAL", True)
+    monkeypatch.setattr(auth, "principal_cache", PrincipalCache(max_size=8, ttl_seconds=60))
+    account = Account(
+        id=7, username="berk", email="berk@unihelp.com", avatar=None, is_verified=True, token_version=3
+    )
+    token = jwt_generator.generate_access_token(account=account)
+
+    account_repo = TokenVersionRepository(token_version=3)
+    assert (await auth.get_current_user(token=token, account_repo=account_repo)).id == 7  # type: ignore
+    assert (await auth.get_current_user(token=token, account_repo=account_repo)).id == 7  # type: ignore
+    assert account_repo.reads == 1
+
+    # The password changed, so the version moved on and the cached one was dropped
+    account_repo.token_version = 4
+    auth.principal_cache.invalidate_account(account_id=7)
+    assert await auth.get_current_user(token=token, account_repo=account_repo) is None  # type: ignore
@@ -0,0 +1,24 @@
+from src.utilities.caches.lru_cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used_entry() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_size=2)
+    cache.set("vize", 1)
+    cache.set("final", 2)
+
+    assert cache.get("vize") == 1
+
+    cache.set("odev", 3)
+
+    assert "final" not in cache
+    assert cache.get("final") is None
+    assert cache.stats == {"size": 2, "max_size": 2, "hits": 1, "misses": 1, "evictions": 1}
+
+
+def test_lru_cache_expires_entries_after_ttl() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_size=2, ttl_seconds=0)
+    cache.set("vize", 1)
+
+    assert cache.get("vize") is None
+    assert "vize" not in cache
+    assert cache.stats == {"size": 0, "max_size": 2, "hits": 0, "misses": 1, "evictions": 1}
@@ -0,0 +1,93 @@
+import smtplib
+import typing
+
+import pytest
+
+from src.models.db.mail_outbox import MailOutbox
+from src.utilities.services.mail_outbox_worker import MailOutboxWorker
+from src.utilities.services.mail_service import MailService
+
+
+class FlakyMailService:
+    def __init__(self, dropped_sends: int = 0, is_reachable: bool = True):
+        self.dropped_sends = dropped_sends
+        self.is_reachable = is_reachable
+        self.connections = 0
+        self.delivered: list[str] = list()
+
+    def connect(self) -> smtplib.SMTP:
+        if not self.is_reachable:
+            raise ConnectionRefusedError("smtp is down")
+        self.connections += 1
+        return smtplib.SMTP()
+
+    def send(self, server: smtplib.SMTP, recipient: str, subject: str, body: str) -> None:
+        if self.dropped_sends:
+            self.dropped_sends -= 1
+            raise smtplib.SMTPServerDisconnected("idle session closed")
+        self.delivered.append(recipient)
+
+
+def build_worker(mail_service: typing.Any) -> MailOutboxWorker:
+    return MailOutboxWorker(
+        session_factory=None,  # type: ignore
+        mail_service=mail_service,
+        batch_size=10,
+        poll_interval_seconds=1,
+        max_attempts=3,
+        backoff_seconds=30,
+    )
+
+
+def build_mails(count: int) -> list[MailOutbox]:
+    return [MailOutbox(id=id, recipient=f"user{id}@unihelp.com", subject="s", body="b", attempts=0) for id in range(1, count + 1)]
+
+
+async def test_mail_outbox_worker_reuses_and_reopens_one_smtp_session() -> None:
+    mail_service = FlakyMailService(dropped_sends=1)
+    worker = build_worker(mail_service=mail_service)
+
+    sent_ids, failures = await worker.deliver(mails=build_mails(count=3))
+
+    assert sent_ids == [1, 2, 3]
+    assert failures == dict()
+    assert mail_service.connections == 2
+    assert worker.retry_delay(attempts=3).total_seconds() == 120
+
+
+async def test_mail_outbox_worker_leaves_the_batch_when_smtp_is_unreachable() -> None:
+    worker = build_worker(mail_service=FlakyMailService(is_reachable=False))
+
+    sent_ids, failures = await worker.deliver(mails=build_mails(count=3))
+
+    assert sent_ids == list()
+    assert list(failures) == [1]
+
+
+async def test_mail_outbox_worker_delivers_to_a_local_smtp_server() -> None:
+    controller_module = pytest.importorskip("aiosmtpd.controller")
+
+    class Handler:
+        def __init__(self) -> None:
+            self.recipients: list[str] = list()
+
+        async def handle_DATA(self, server, session, envelope) -> str:  # type: ignore
+            self.recipients.extend(envelope.rcpt_tos)
+            return "250 Message accepted for delivery"
+
+    handler = Handler()
+    controller = controller_module.Controller(handler, hostname="127.0.0.1", port=8025)
+    controller.start()
+    try:
+        mail_service = MailService(
+            {"host": "127.0.0.1", "port": 8025, "username": "", "password": "", "from": "noreply@unihelp.com", "starttls": False}
+        )
+        worker = build_worker(mail_service=mail_service)
+
+        sent_ids, _ = await worker.deliver(mails=build_mails(count=2))
+        await worker.stop()
+    finally:
+        controller.stop()
+
+    assert sent_ids == [1, 2]
+    assert handler.recipients == ["user1@unihelp.com", "user2@unihelp.com"]
@@ -0,0 +1,29 @@
+from src.config.manager import settings
+from src.securities.hashing.hash import HashGenerator
+
+
+def test_calibration_reports_a_time_cost_without_applying_it() -> None:
+    hash_generator = HashGenerator()
+
+    # An unreachable target pushes the time cost to its ceiling
+    time_cost = hash_generator.calibrate_password_hash_cost(
+        target_verify_ms=10**6, max_time_cost=settings.PASSWORD_HASH_TIME_COST + 1
+    )
+    hashed_password = hash_generator.generate_password_hash(hash_salt="salt", password="sifre123")
+
+    assert time_cost == settings.PASSWORD_HASH_TIME_COST + 1
+    assert f"t={settings.PASSWORD_HASH_TIME_COST}," in hashed_password
+    assert not hash_generator.is_password_hash_stale(hashed_password=hashed_password)
+
+
+def test_only_hashes_weaker_than_the_configured_cost_are_stale(monkeypatch) -> None:
+    hash_generator = HashGenerator()
+    hashed_password = hash_generator.generate_password_hash(hash_salt="salt", password="sifre123")
+
+    # A node deployed with a lower cost keeps accepting the stronger hashes of the others
+    monkeypatch.setattr(settings, "PASSWORD_HASH_TIME_COST", settings.PASSWORD_HASH_TIME_COST - 1)
+    assert not hash_generator.is_password_hash_stale(hashed_password=hashed_password)
+
+    monkeypatch.setattr(settings, "PASSWORD_HASH_TIME_COST", settings.PASSWORD_HASH_TIME_COST + 2)
+    assert hash_generator.is_password_hash_stale(hashed_password=hashed_password)
+    assert hash_generator.is_password_verified(password="salt" + "sifre123", hashed_password=hashed_password)
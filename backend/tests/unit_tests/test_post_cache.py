@@ -0,0 +1,108 @@
+import datetime
+
+import pytest
+
+from src.models.db.account import Account
+from src.models.db.poll import Poll
+from src.models.schemas.account import AccountDetailBase
+from src.models.schemas.post import PostInResponse, PostStatsBase
+from src.repository.crud import account as account_crud, poll as poll_crud
+from src.repository.crud.account import AccountCRUDRepository
+from src.repository.crud.poll import PollCRUDRepository
+from src.utilities.caches.post_cache import PostCache
+
+
+def build_post_response(post_id: int, likes: int) -> PostInResponse:
+    return PostInResponse(
+        id=post_id,
+        content="Vize notları",
+        account=AccountDetailBase(avatar=None, username="berk", fullName="berk"),
+        stats=PostStatsBase(comments=0, likes=likes, bookmarks=0),
+        createdAt=datetime.datetime(2026, 10, 18),
+    )
+
+
+def test_post_cache_never_serves_a_response_read_before_a_write() -> None:
+    post_cache = PostCache(max_size=8, ttl_seconds=60, max_versions=8)
+
+    version = post_cache.version(1)
+    post_cache.set(1, version, build_post_response(post_id=1, likes=0))
+    assert post_cache.get(1).stats.likes == 0  # type: ignore
+
+    # A reader took the version, then a like landed before it stored what it had read
+    stale_version = post_cache.version(1)
+    post_cache.bump(1)
+    post_cache.set(1, stale_version, build_post_response(post_id=1, likes=0))
+
+    assert post_cache.get(1) is None
+    post_cache.set(1, post_cache.version(1), build_post_response(post_id=1, likes=1))
+    assert post_cache.get(1).stats.likes == 1  # type: ignore
+    assert post_cache.stats["hits"] == 2
+    assert post_cache.stats["misses"] == 1
+
+
+def test_post_cache_forgotten_versions_only_cause_misses() -> None:
+    post_cache = PostCache(max_size=8, ttl_seconds=60, max_versions=1)
+    post_cache.set(1, post_cache.version(1), build_post_response(post_id=1, likes=0))
+
+    post_cache.bump(2)
+    post_cache.bump(3)  # Forgets the version of post 2
+
+    assert post_cache.get(1) is None
+    assert post_cache.version(2) == post_cache.version(3) - 1
+
+
+class FakeSession:
+    """
+    Answers `get` with the given row and every `execute` with the ids of the author's posts.
+    """
+
+    def __init__(self, row: object, post_ids: list[int]):
+        self.row = row
+        self.post_ids = post_ids
+        self.commits = 0
+
+    async def get(self, *args, **kwargs) -> object:
+        return self.row
+
+    async def execute(self, *args, **kwargs):
+        session = self
+
+        class Result:
+            def scalar(self) -> object:
+                return session.row
+
+            def scalars(self):
+                return self
+
+            def all(self) -> list[int]:
+                return session.post_ids
+
+        return Result()
+
+    async def delete(self, row: object) -> None:
+        pass
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def refresh(self, *args, **kwargs) -> None:
+        pass
+
+
+async def test_poll_and_author_writes_drop_the_cached_posts(monkeypatch: pytest.MonkeyPatch) -> None:
+    post_cache = PostCache(max_size=8, ttl_seconds=60, max_versions=8)
+    monkeypatch.setattr(poll_crud, "post_cache", post_cache)
+    monkeypatch.setattr(account_crud, "post_cache", post_cache)
+    for post_id in (1, 2, 3):
+        post_cache.set(post_id, post_cache.version(post_id), build_post_response(post_id=post_id, likes=0))
+
+    session = FakeSession(row=Poll(id=9, post_id=1, account_id=4), post_ids=[])
+    await PollCRUDRepository(async_session=session).delete_poll(poll_id=9)  # type: ignore
+    assert session.commits == 1
+    assert post_cache.get(1) is None
+
+    session = FakeSession(row=Account(id=4, username="berk"), post_ids=[2])
+    await AccountCRUDRepository(async_session=session).update_account_avatar(id=4, avatar_url="berk.png")  # type: ignore
+    assert post_cache.get(2) is None
+    assert post_cache.get(3) is not None
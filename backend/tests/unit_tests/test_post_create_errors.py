@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from src.models.schemas.post import PostInCreate
+from src.repository.crud.post import PostCRUDRepository
+from src.repository.crud.tag import TagCRUDRepository
+from src.utilities.exceptions.database import DatabaseError, EntityDoesNotExist
+
+
+class ForeignKeyViolation(Exception):
+    def __init__(self, table_name: str):
+        super().__init__(f"insert or update on table {table_name} violates a foreign key constraint")
+        self.table_name = table_name
+
+
+def build_integrity_error(table_name: str) -> IntegrityError:
+    orig = Exception("IntegrityError")
+    orig.__cause__ = ForeignKeyViolation(table_name=table_name)
+    return IntegrityError("INSERT", {}, orig)
+
+
+class FailingSession:
+    def __init__(self, *table_names: str):
+        self.table_names = list(table_names)
+        self.rollbacks = 0
+
+    async def execute(self, *args, **kwargs):
+        raise build_integrity_error(self.table_names.pop(0))
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+@pytest.fixture(autouse=True)
+def resolve_tags_without_database(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    resolved: list[list[str]] = list()
+
+    async def resolve_tag_ids(self, names: list[str]) -> dict[str, int]:
+        resolved.append(names)
+        return {name: index for index, name in enumerate(names, start=1)}
+
+    monkeypatch.setattr(TagCRUDRepository, "resolve_tag_ids", resolve_tag_ids)
+    return resolved
+
+
+async def test_create_post_reports_a_missing_account() -> None:
+    session = FailingSession("posts")
+
+    with pytest.raises(EntityDoesNotExist):
+        await PostCRUDRepository(async_session=session).create_post(  # type: ignore
+            PostInCreate(content="Vize notları", tags=["vize"]), account_id=1
+        )
+    assert session.rollbacks == 1
+
+
+async def test_create_post_retries_once_when_a_tag_disappears(resolve_tags_without_database: list) -> None:
+    session = FailingSession("post_tags", "post_tags")
+
+    with pytest.raises(DatabaseError):
+        await PostCRUDRepository(async_session=session).create_post(  # type: ignore
+            PostInCreate(content="Vize notları", tags=["vize"]), account_id=1
+        )
+    assert session.rollbacks == 2
+    assert len(resolve_tags_without_database) == 2
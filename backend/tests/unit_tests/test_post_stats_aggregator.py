@@ -0,0 +1,57 @@
+from sqlalchemy.dialects import postgresql
+
+from src.utilities.services.post_stats_aggregator import PostStatsAggregator
+
+
+class RecordingSession:
+    def __init__(self, statements: list[str], is_failing: bool = False):
+        self.statements = statements
+        self.is_failing = is_failing
+
+    async def __aenter__(self) -> "RecordingSession":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+    async def execute(self, statement) -> None:
+        if self.is_failing:
+            raise ConnectionError("database is down")
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+
+    async def commit(self) -> None:
+        pass
+
+
+async def test_post_stats_aggregator_flushes_merged_deltas_in_one_statement() -> None:
+    statements: list[str] = list()
+    aggregator = PostStatsAggregator(
+        session_factory=lambda: RecordingSession(statements),
+        is_enabled=True,
+        flush_interval_ms=1000,
+        flush_max_events=100,
+    )
+    aggregator.record(post_id=7, likes=1)
+    aggregator.record(post_id=7, likes=1)
+    aggregator.record(post_id=9, comments=1)
+
+    assert aggregator.pending_events == 3
+    assert await aggregator.flush() == 2
+    assert aggregator.pending_events == 0
+    assert len(statements) == 1
+    assert "likes=(post_stats.likes + post_stats_deltas.likes)" in statements[0]
+    assert "FROM (VALUES" in statements[0]
+    assert await aggregator.flush() == 0
+
+
+async def test_post_stats_aggregator_keeps_deltas_when_flush_fails() -> None:
+    aggregator = PostStatsAggregator(
+        session_factory=lambda: RecordingSession(list(), is_failing=True),
+        is_enabled=True,
+        flush_interval_ms=1000,
+        flush_max_events=100,
+    )
+    aggregator.record(post_id=7, bookmarks=1)
+
+    assert await aggregator.flush() == 0
+    assert aggregator.pending_events == 1
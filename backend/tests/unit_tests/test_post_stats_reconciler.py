@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+import sqlalchemy
+from sqlalchemy.dialects import postgresql
+
+from src.utilities.services import post_stats_reconciler as post_stats_reconciler_module
+from src.utilities.services.post_stats_aggregator import PostStatsAggregator
+from src.utilities.services.post_stats_reconciler import PostStatsReconciler
+
+
+class ScalarsResult:
+    def __init__(self, values: list[int]):
+        self.values = values
+
+    def scalars(self) -> "ScalarsResult":
+        return self
+
+    def all(self) -> list[int]:
+        return self.values
+
+
+class ChunkSession:
+    """
+    Serves post ids 1 to 4 in chunks and records the compiled reconcile statements, calling `on_update`
+    while each of them runs.
+    """
+
+    def __init__(self, updates: list[str], on_update):
+        self.updates = updates
+        self.on_update = on_update
+
+    async def __aenter__(self) -> "ChunkSession":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+    async def execute(self, statement) -> ScalarsResult:
+        if isinstance(statement, sqlalchemy.Update):
+            self.updates.append(
+                str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+            )
+            await self.on_update(len(self.updates))
+            return ScalarsResult([])
+
+        after_post_id = statement.whereclause.right.value
+        return ScalarsResult([post_id for post_id in range(1, 5) if post_id > after_post_id][:2])
+
+    async def commit(self) -> None:
+        pass
+
+
+class FlushSession:
+    async def __aenter__(self) -> "FlushSession":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+    async def execute(self, statement) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+
+def test_post_stats_reconciler_only_updates_drifted_rows_of_the_chunk() -> None:
+    reconciler = PostStatsReconciler(
+        session_factory=lambda: None,
+        is_enabled=False,
+        chunk_size=500,
+        max_posts_per_second=1000,
+        interval_seconds=3600,
+    )
+    stmt = str(
+        reconciler.build_reconcile_statement(first_post_id=1, last_post_id=500).compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+    assert stmt.startswith("UPDATE post_stats SET")
+    assert "post_stats.likes IS DISTINCT FROM actual.likes" in stmt
+    assert "likes.post_id BETWEEN 1 AND 500 GROUP BY likes.post_id" in stmt
+    assert "RETURNING post_stats.post_id" in stmt
+
+
+async def test_post_stats_reconciler_leaves_deltas_buffered_mid_pass_to_the_next_flush(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    aggregator = PostStatsAggregator(
+        session_factory=FlushSession, is_enabled=True, flush_interval_ms=1000, flush_max_events=100
+    )
+    monkeypatch.setattr(post_stats_reconciler_module, "post_stats_aggregator", aggregator)
+    flushes: list[asyncio.Task] = list()
+
+    async def on_update(chunk: int) -> None:
+        if chunk == 1:
+            # A like on post 3 lands between the chunks, its row is already in the recount of the second one
+            aggregator.record(post_id=3, likes=1)
+        else:
+            flushes.append(asyncio.create_task(aggregator.flush()))
+            await asyncio.sleep(0)
+            assert not flushes[0].done()
+
+    updates: list[str] = list()
+    reconciler = PostStatsReconciler(
+        session_factory=lambda: ChunkSession(updates, on_update),
+        is_enabled=True,
+        chunk_size=2,
+        max_posts_per_second=1_000_000,
+        interval_seconds=3600,
+    )
+    await reconciler.run_pass()
+
+    assert len(updates) == 2
+    assert "pending_deltas" not in updates[0]
+    assert "VALUES (3, 1, 0, 0)" in updates[1]
+    assert "coalesce(like_counts.likes, 0) - coalesce(pending_deltas.likes, 0)" in updates[1]
+
+    # The flush held off during the recount lands the delta exactly once
+    assert await flushes[0] == 1
+    assert aggregator.pending_events == 0
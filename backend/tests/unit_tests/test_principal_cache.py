@@ -0,0 +1,50 @@
+from src.models.schemas.jwt import JWTPrincipal
+from src.utilities.caches.principal_cache import PrincipalCache
+
+
+def build_principal(account_id: int, username: str) -> JWTPrincipal:
+    return JWTPrincipal(
+        account_id=account_id,
+        username=username,
+        email=f"{username}@unihelp.com",
+        is_verified=True,
+        token_version=0,
+    )
+
+
+def test_principal_cache_invalidates_every_token_of_an_account() -> None:
+    principal_cache = PrincipalCache(max_size=8, ttl_seconds=60)
+    principal = build_principal(account_id=1, username="berk")
+    other_principal = build_principal(account_id=2, username="irem")
+    principal_cache.set("laptop-token", principal, epoch=principal_cache.epoch)
+    principal_cache.set("phone-token", principal, epoch=principal_cache.epoch)
+    principal_cache.set("other-token", other_principal, epoch=principal_cache.epoch)
+
+    assert principal_cache.get("phone-token") is principal
+
+    principal_cache.invalidate_account(account_id=1)
+
+    assert principal_cache.get("laptop-token") is None
+    assert principal_cache.get("phone-token") is None
+    assert principal_cache.get("other-token") is other_principal
+
+
+def test_principal_cache_ignores_principals_read_before_an_invalidation() -> None:
+    principal_cache = PrincipalCache(max_size=8, ttl_seconds=60)
+
+    # The account was read, then updated before the reader stored what it had read
+    epoch = principal_cache.epoch
+    principal_cache.invalidate_account(account_id=1)
+    principal_cache.set("laptop-token", build_principal(account_id=1, username="berk"), epoch=epoch)
+
+    assert principal_cache.get("laptop-token") is None
+
+
+def test_principal_cache_forgets_the_token_version_of_an_updated_account() -> None:
+    principal_cache = PrincipalCache(max_size=8, ttl_seconds=60)
+    principal_cache.set_token_version(1, 3, epoch=principal_cache.epoch)
+    assert principal_cache.get_token_version(1) == 3
+
+    principal_cache.invalidate_account(account_id=1)
+
+    assert principal_cache.get_token_version(1) is None
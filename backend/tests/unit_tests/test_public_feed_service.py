@@ -0,0 +1,89 @@
+import datetime
+import time
+
+import pytest
+
+from src.models.schemas.account import AccountDetailBase
+from src.models.schemas.post import PostInResponse, PostStatsBase
+from src.utilities.services.public_feed_service import PublicFeedService, PublicFeedSnapshot
+
+
+def build_post_response(post_id: int) -> PostInResponse:
+    return PostInResponse(
+        id=post_id,
+        content="Vize notları",
+        account=AccountDetailBase(avatar=None, username="berk", fullName="berk"),
+        stats=PostStatsBase(comments=0, likes=0, bookmarks=0),
+        createdAt=datetime.datetime(2026, 10, 18) + datetime.timedelta(minutes=post_id),
+    )
+
+
+class FakePublicFeedService(PublicFeedService):
+    def __init__(self, post_count: int):
+        super().__init__(
+            session_factory=None,  # type: ignore
+            is_enabled=True,
+            page_size=2,
+            pages=2,
+            max_tags=1,
+            refresh_interval_seconds=30,
+        )
+        self.post_count = post_count
+        self.built_tags: list[int | None] = list()
+
+    async def build_snapshot(self, tag: int | None) -> PublicFeedSnapshot:
+        self.built_tags.append(tag)
+        capacity = self.page_size * self.pages
+        posts = [build_post_response(post_id) for post_id in range(self.post_count, 0, -1)][:capacity]
+        return PublicFeedSnapshot(
+            posts=posts,
+            digests=[str(post.id) for post in posts],
+            is_complete=len(posts) < capacity,
+            refreshed_at=time.monotonic(),
+        )
+
+
+async def test_public_feed_serves_pages_inside_the_snapshot_only() -> None:
+    public_feed = FakePublicFeedService(post_count=10)
+    assert public_feed.read_page(tag=None, skip=0, limit=2, cursor=None) is None
+
+    await public_feed.refresh()
+
+    first_page = public_feed.read_page(tag=None, skip=0, limit=2, cursor=None)
+    assert [post.id for post in first_page.posts] == [10, 9]  # type: ignore
+
+    # The cursor of the first page leads to the same page as skipping it
+    last_post = first_page.posts[-1]  # type: ignore
+    by_cursor = public_feed.read_page(tag=None, skip=0, limit=2, cursor=(last_post.created_at, last_post.id))
+    by_skip = public_feed.read_page(tag=None, skip=2, limit=2, cursor=None)
+    assert [post.id for post in by_cursor.posts] == [8, 7]  # type: ignore
+    assert by_cursor.etag == by_skip.etag != first_page.etag  # type: ignore
+
+    # Past the snapshot the feed goes on, so those pages come from the database
+    assert public_feed.read_page(tag=None, skip=3, limit=2, cursor=None) is None
+
+
+async def test_public_feed_snapshots_tags_visitors_asked_for() -> None:
+    public_feed = FakePublicFeedService(post_count=1)
+
+    assert public_feed.read_page(tag=7, skip=0, limit=2, cursor=None) is None
+    await public_feed.refresh()
+    assert public_feed.built_tags == [None, 7]
+
+    # The whole tag fits in the snapshot, so a short page is a complete answer
+    assert [post.id for post in public_feed.read_page(tag=7, skip=0, limit=2, cursor=None).posts] == [1]  # type: ignore
+
+    # Only `max_tags` tags are kept, asking for another one forgets the oldest
+    assert public_feed.read_page(tag=8, skip=0, limit=2, cursor=None) is None
+    assert public_feed.read_page(tag=7, skip=0, limit=2, cursor=None) is None
+
+
+async def test_public_feed_rejects_a_cursor_with_a_timezone() -> None:
+    public_feed = FakePublicFeedService(post_count=10)
+    await public_feed.refresh()
+
+    # Snapshot timestamps are naive like `posts.created_at`, an aware cursor is a bad request
+    with pytest.raises(ValueError):
+        public_feed.read_page(
+            tag=None, skip=0, limit=2, cursor=(datetime.datetime(2026, 10, 18, tzinfo=datetime.timezone.utc), 5)
+        )
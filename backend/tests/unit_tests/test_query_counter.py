@@ -0,0 +1,51 @@
+import types
+
+import fastapi
+import httpx
+
+from src.api.middlewares.query_counter import QueryCounterMiddleware
+from src.repository.events import record_query, start_query_timer
+from src.repository.query_counter import count_queries, normalize_statement
+
+LIKED_POSTS_STATEMENT = "SELECT likes.post_id FROM likes WHERE likes.account_id = $1 AND likes.post_id IN ($2, $3, $4)"
+
+
+def execute_statement(statement: str) -> None:
+    context = types.SimpleNamespace()
+    start_query_timer(None, None, statement, None, context, False)
+    record_query(None, None, statement, None, context, False)
+
+
+def test_normalize_statement_ignores_parameters_and_list_lengths() -> None:
+    assert normalize_statement(LIKED_POSTS_STATEMENT) == normalize_statement(
+        "SELECT likes.post_id FROM likes\n WHERE likes.account_id = $1 AND likes.post_id IN ($2)"
+    )
+
+
+def test_count_queries_groups_repeated_statements() -> None:
+    with count_queries() as query_stats:
+        for _ in range(3):
+            execute_statement(LIKED_POSTS_STATEMENT)
+        execute_statement("SELECT 1")
+
+    execute_statement("SELECT 2")
+
+    assert query_stats.count == 4
+    assert query_stats.repeated_statements(threshold=2) == {normalize_statement(LIKED_POSTS_STATEMENT): 3}
+
+
+async def test_query_counter_middleware_sets_db_headers() -> None:
+    app = fastapi.FastAPI()
+    app.add_middleware(QueryCounterMiddleware, repeat_threshold=5)
+
+    @app.get("/feed")
+    async def feed() -> dict[str, bool]:
+        execute_statement(LIKED_POSTS_STATEMENT)
+        execute_statement("SELECT 1")
+        return {"ok": True}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client:
+        response = await client.get("/feed")
+
+    assert response.headers["X-DB-Queries"] == "2"
+    assert float(response.headers["X-DB-Time"]) >= 0
@@ -0,0 +1,84 @@
+import pytest
+
+from src.models.db.post import Post
+from src.models.schemas.post import PostInCreate
+from src.repository.crud import post as post_crud
+from src.repository.crud.post import PostCRUDRepository
+from src.utilities.caches.search_cache import SearchCache, SearchCacheEntry
+from src.utilities.formatters.search_formatter import format_search_query
+
+
+def test_format_search_query_folds_turkish_case_and_whitespace() -> None:
+    assert format_search_query("  İSTANBUL   Vize ") == "istanbul vize"
+    assert format_search_query("IĞDIR") == "ığdır"
+    assert format_search_query("Vize  OR Final or") == "vize OR final or"
+
+
+def test_search_cache_drops_entries_related_to_new_content() -> None:
+    search_cache = SearchCache(max_size=8, ttl_seconds=60)
+    entry = SearchCacheEntry(user_ids=[1], post_ids=[2, 3], post_headlines={2: "<mark>vize</mark>"}, tag_ids=[4])
+    search_cache.set("vize notları", 0, 10, entry)
+    search_cache.set("final", 0, 10, entry)
+
+    assert search_cache.invalidate_matching("Fizik notlar paylaşıyorum") == 1
+    assert search_cache.get("vize notları", 0, 10) is None
+    assert search_cache.get("final", 0, 10) == entry
+
+
+def test_search_cache_drops_entries_the_fuzzy_facets_would_match() -> None:
+    search_cache = SearchCache(max_size=8, ttl_seconds=60)
+    entry = SearchCacheEntry(user_ids=[], post_ids=[], post_headlines={}, tag_ids=[])
+    search_cache.set("tanbul", 0, 10, entry)  # Substring of the new tag
+    search_cache.set("istnbul", 0, 10, entry)  # Typo of the new tag
+    search_cache.set("ankara", 0, 10, entry)
+
+    assert search_cache.invalidate_matching("istanbul") == 2
+    assert search_cache.get("ankara", 0, 10) == entry
+
+
+class PostSession:
+    """
+    Answers every `execute` with the same post row and accepts the writes of `update_post` and `delete_post`.
+    """
+
+    def __init__(self, post: Post):
+        self.post = post
+
+    async def execute(self, *args, **kwargs):
+        post = self.post
+
+        class Result:
+            def scalar_one_or_none(self) -> Post:
+                return post
+
+        return Result()
+
+    def add(self, row: object) -> None:
+        pass
+
+    async def delete(self, row: object) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+    async def refresh(self, *args, **kwargs) -> None:
+        pass
+
+
+async def test_post_edits_and_deletes_drop_entries_matching_the_old_text(monkeypatch: pytest.MonkeyPatch) -> None:
+    search_cache = SearchCache(max_size=8, ttl_seconds=60)
+    monkeypatch.setattr(post_crud, "search_cache", search_cache)
+    entry = SearchCacheEntry(user_ids=[], post_ids=[2], post_headlines={2: "<mark>vize</mark>"}, tag_ids=[])
+    for query in ("vize", "final", "ankara"):
+        search_cache.set(query, 0, 10, entry)
+
+    post_repo = PostCRUDRepository(async_session=PostSession(Post(id=2, content="vize")))  # type: ignore
+    await post_repo.update_post(2, PostInCreate(content="final", photos=[]))
+    assert search_cache.get("vize", 0, 10) is None
+    assert search_cache.get("final", 0, 10) is None
+
+    search_cache.set("final", 0, 10, entry)
+    await post_repo.delete_post(2)
+    assert search_cache.get("final", 0, 10) is None
+    assert search_cache.get("ankara", 0, 10) == entry
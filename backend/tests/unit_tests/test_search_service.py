@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from src.models.db.account import Account
+from src.models.db.tag import Tag
+from src.repository.crud.search import SearchCRUDRepository
+from src.utilities.caches.search_cache import SearchCache
+from src.utilities.services.search_service import SearchService
+from src.utilities.services.singleflight import SingleFlight
+
+
+class IdleSession:
+    async def __aenter__(self) -> "IdleSession":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+
+async def test_search_service_returns_partial_results_when_a_facet_times_out(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def search_users(self, query: str, skip: int, limit: int) -> list[Account]:
+        return [Account(id=1, username="berk", avatar=None)]
+
+    async def search_posts(self, query: str, skip: int, limit: int) -> tuple[list, dict]:
+        await asyncio.sleep(1)
+        return ["slow post"], {}
+
+    async def search_tags(self, query: str, skip: int, limit: int) -> list[Tag]:
+        return [Tag(id=4, name="vize")]
+
+    monkeypatch.setattr(SearchCRUDRepository, "search_users", search_users)
+    monkeypatch.setattr(SearchCRUDRepository, "search_posts", search_posts)
+    monkeypatch.setattr(SearchCRUDRepository, "search_tags", search_tags)
+
+    search_cache = SearchCache(max_size=8, ttl_seconds=60)
+    search_service = SearchService(
+        session_factory=IdleSession, facet_timeout_ms=50, cache=search_cache, singleflight=SingleFlight()
+    )
+    results = await search_service.search_all("vize", 0, 10)
+
+    # Only response schemas come back, so callers that joined the search never touch its sessions' rows
+    assert [user.username for user in results.users] == ["berk"]
+    assert [(tag.id, tag.name) for tag in results.tags] == [(4, "vize")]
+    assert results.posts == []
+    assert results.is_partial
+    assert results.timed_out_facets == ["posts"]
+    assert search_cache.get("vize", 0, 10) is None
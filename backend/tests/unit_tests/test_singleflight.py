@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from src.utilities.services.singleflight import SingleFlight
+
+
+async def test_singleflight_coalesces_identical_concurrent_calls() -> None:
+    singleflight = SingleFlight()
+    executions = 0
+
+    async def read_post() -> dict:
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.01)
+        return {"id": 1}
+
+    results = await asyncio.gather(*[singleflight.do(("read_post", 1), read_post) for _ in range(5)])
+    other_result = await singleflight.do(("read_post", 1), read_post)
+
+    assert executions == 2
+    assert all(result is results[0] for result in results)
+    assert other_result == {"id": 1}
+    assert singleflight.stats == {"calls": 6, "executions": 2, "saved_calls": 4, "in_flight": 0}
+
+
+async def test_singleflight_retries_when_the_leader_is_cancelled() -> None:
+    singleflight = SingleFlight()
+
+    async def slow_read() -> int:
+        await asyncio.sleep(0.01)
+        return 42
+
+    leader = asyncio.create_task(singleflight.do("key", slow_read))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(singleflight.do("key", slow_read))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == 42
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert singleflight.stats["executions"] == 2
@@ -0,0 +1,20 @@
+import loguru
+
+from src.utilities.caches.lru_cache import LRUCache
+from src.utilities.services.stats_reporter import StatsReporter
+
+
+def test_stats_reporter_logs_every_source() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_size=2)
+    cache.get("vize")
+    reporter = StatsReporter(sources={"tag_cache": lambda: cache.stats}, is_enabled=True, interval_seconds=60)
+
+    messages: list[str] = list()
+    sink_id = loguru.logger.add(lambda message: messages.append(message.record["message"]))
+    try:
+        reporter.report()
+    finally:
+        loguru.logger.remove(sink_id)
+
+    assert len(messages) == 1
+    assert "tag_cache" in messages[0] and "'misses': 1" in messages[0]
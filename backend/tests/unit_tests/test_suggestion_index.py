@@ -0,0 +1,33 @@
+from src.utilities.caches.compressed_trie import CompressedTrie
+from src.utilities.caches.suggestion_index import SuggestionIndex
+
+
+def test_compressed_trie_ranks_prefix_matches_by_score() -> None:
+    trie = CompressedTrie(max_suggestions=3)
+    trie.add(key="matematik", value="matematik", score=5)
+    trie.add(key="mat101", value="mat101", score=9)
+    trie.add(key="makine", value="makine", score=7)
+    trie.add(key="fizik", value="fizik", score=1)
+
+    assert trie.suggest(prefix="ma", limit=3) == ["mat101", "makine", "matematik"]
+    assert trie.suggest(prefix="mat", limit=3) == ["mat101", "matematik"]
+    assert trie.suggest(prefix="mate", limit=3) == ["matematik"]
+    assert trie.suggest(prefix="x", limit=3) == []
+
+    trie.increment(key="matematik", value="matematik", by=10)
+    trie.remove(key="mat101", value="mat101")
+
+    assert trie.suggest(prefix="ma", limit=3) == ["matematik", "makine"]
+    assert len(trie) == 3
+
+
+def test_suggestion_index_folds_turkish_case_and_follows_renames() -> None:
+    suggestion_index = SuggestionIndex(max_suggestions=5)
+    suggestion_index.load(tag_popularity=[("istatistik", 3)], username_popularity=[("İrem", 2), ("ilker", 4)])
+
+    assert suggestion_index.suggest(prefix="İ", limit=5) == {"tags": ["istatistik"], "users": ["ilker", "İrem"]}
+
+    suggestion_index.rename_username(old_username="ilker", new_username="berk")
+
+    assert suggestion_index.suggest(prefix="i", limit=5)["users"] == ["İrem"]
+    assert suggestion_index.suggest(prefix="b", limit=5)["users"] == ["berk"]